@@ -45,8 +45,9 @@ def fastapi_app():
     """Serve the Arch FastAPI application."""
     from arch.api.main import create_app
 
-    # Create app with volume-mounted database
-    return create_app(db_path=DB_PATH)
+    # Create app with volume-mounted database; read-only mode gives each
+    # worker thread its own connection so concurrent inputs don't serialize
+    return create_app(db_path=DB_PATH, read_only=True)
 
 
 @app.local_entrypoint()
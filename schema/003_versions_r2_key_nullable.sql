@@ -0,0 +1,8 @@
+-- Allow versions recorded before their file is uploaded to R2
+--
+-- Incremental title syncs (SupabaseIngestor.record_title_changes) record a
+-- version per changed section from the parsed text's content hash; no raw
+-- file is archived for it. r2_key stays NULL until an upload sets it, rather
+-- than pointing at an object that does not exist.
+
+ALTER TABLE versions ALTER COLUMN r2_key DROP NOT NULL;
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""Benchmark API response latency: pydantic response models vs the fast JSON path.
+
+For 26 USC 1, 26 USC 32 and a search, reports p50/p99 of:
+
+- serializing with the response models the way FastAPI does for a
+  ``response_model`` route (build, validate, dump, json.dumps)
+- serializing with arch.api.serialize (plain dicts, orjson if installed)
+- a full uncached request through the ASGI app (storage read + fast path)
+- a cached request (pre-serialized, pre-compressed body)
+
+Requests run in process over httpx's ASGI transport, so no network time is
+included.
+
+Usage:
+    python scripts/benchmark_api.py --db atlas.db -n 500
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from arch.api.cache import BROTLI_AVAILABLE
+from arch.api.main import SearchResponse, SearchResultResponse, SectionResponse, create_app
+from arch.api.serialize import ORJSON_AVAILABLE, dumps, search_payload, section_payload
+from arch.storage.sharded import open_storage
+
+SECTIONS = [(26, "1"), (26, "32")]
+QUERY = "earned income"
+
+
+def percentiles(samples: list[float]) -> tuple[float, float]:
+    """p50 and p99 in milliseconds."""
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return cuts[49] * 1000, cuts[98] * 1000
+
+
+def time_sync(func: Callable[[], object], n: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+async def time_async(func: Callable[[], Awaitable[object]], n: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def model_json(model_cls, model) -> bytes:
+    """Serialize as FastAPI does for a route declaring ``response_model``."""
+    validated = model_cls.model_validate(model.model_dump())
+    return json.dumps(
+        validated.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+async def request_timings(db: str, path: str, params: dict, n: int, cached: bool):
+    app = create_app(db_path=db, cache_bytes=64 * 1024 * 1024 if cached else 0)
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Accept-Encoding": "gzip"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def call():
+            response = await client.get(path, params=params, headers=headers)
+            response.raise_for_status()
+
+        await call()  # Warm up (and fill the cache)
+        return await time_async(call, n)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--db", default="atlas.db", help="Database file or shard directory")
+    parser.add_argument("-n", type=int, default=500, help="Iterations per measurement")
+    args = parser.parse_args()
+
+    storage = open_storage(args.db, read_only=True)
+    print(f"orjson: {ORJSON_AVAILABLE}  brotli: {BROTLI_AVAILABLE}  iterations: {args.n}")
+    print(f"{'target':<16}{'measurement':<22}{'p50 ms':>10}{'p99 ms':>10}")
+
+    def report(target: str, label: str, timings: tuple[float, float]):
+        print(f"{target:<16}{label:<22}{timings[0]:>10.3f}{timings[1]:>10.3f}")
+
+    for title, number in SECTIONS:
+        section = storage.get_section(title, number)
+        if section is None:
+            print(f"{title} USC {number}: not in database, skipped")
+            continue
+        target = f"{title} USC {number}"
+        report(
+            target,
+            "serialize (models)",
+            time_sync(
+                lambda s=section: model_json(SectionResponse, SectionResponse.from_section(s)),
+                args.n,
+            ),
+        )
+        report(
+            target,
+            "serialize (fast)",
+            time_sync(lambda s=section: dumps(section_payload(s)), args.n),
+        )
+        path = f"/v1/sections/{title}/{number}"
+        report(
+            target,
+            "request (uncached)",
+            asyncio.run(request_timings(args.db, path, {}, args.n, False)),
+        )
+        report(
+            target,
+            "request (cached)",
+            asyncio.run(request_timings(args.db, path, {}, args.n, True)),
+        )
+
+    page = storage.search_page(QUERY, include_total=True)
+
+    def search_models():
+        response = SearchResponse(
+            query=QUERY,
+            total=page.total,
+            results=[SearchResultResponse.from_result(r) for r in page.results],
+            next_cursor=page.next_cursor,
+        )
+        return model_json(SearchResponse, response)
+
+    report("search", "serialize (models)", time_sync(search_models, args.n))
+    report(
+        "search", "serialize (fast)", time_sync(lambda: dumps(search_payload(QUERY, page)), args.n)
+    )
+    report(
+        "search",
+        "request",
+        asyncio.run(request_timings(args.db, "/v1/search", {"q": QUERY}, args.n, False)),
+    )
+
+
+if __name__ == "__main__":
+    main()
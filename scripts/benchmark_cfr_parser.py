@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Benchmark CFR paragraph text extraction on one part.
+
+Extracts the text and italic heading of every paragraph in a CFR part two
+ways: by serializing each P element to HTML and regex-cleaning the string
+(the previous approach), and by reading the element tree directly
+(element_text / element_heading). Both outputs are checked to be identical
+before timings are reported. Whole-section parsing throughput for the part
+is reported too.
+
+Usage:
+    python scripts/benchmark_cfr_parser.py data/cfr/title-26.xml --part 1 -n 3
+"""
+
+import argparse
+import sys
+import time
+from xml.etree import ElementTree as ET
+
+from arch.parsers.cfr import (
+    _parse_section_element,
+    clean_text,
+    element_heading,
+    element_text,
+    extract_heading,
+)
+
+
+def serialized(paragraphs: list[ET.Element]) -> list[tuple]:
+    results = []
+    for p in paragraphs:
+        markup = ET.tostring(p, encoding="unicode", method="html")
+        results.append((clean_text(markup), extract_heading(markup)))
+    return results
+
+
+def structural(paragraphs: list[ET.Element]) -> list[tuple]:
+    results = []
+    for p in paragraphs:
+        heading = element_heading(p)
+        results.append((element_text(p), heading.strip() if heading is not None else None))
+    return results
+
+
+def best_time(func, *args, runs: int) -> tuple[object, float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("xml_path", help="eCFR title or part XML (e.g. title-26.xml)")
+    parser.add_argument("--part", help="Part number (default: the first part in the file)")
+    parser.add_argument("-n", type=int, default=3, help="Runs per method (best is reported)")
+    args = parser.parse_args()
+
+    root = ET.parse(args.xml_path).getroot()
+    parts = [p for p in root.iter("DIV5") if args.part is None or p.get("N") == args.part]
+    if not parts:
+        sys.exit(f"Part {args.part} not found in {args.xml_path}")
+    part = parts[0]
+    sections = [s for s in part.iter("DIV8") if s.get("TYPE") == "SECTION"]
+    paragraphs = list(part.iter("P"))
+
+    expected, before = best_time(serialized, paragraphs, runs=args.n)
+    actual, after = best_time(structural, paragraphs, runs=args.n)
+    if actual != expected:
+        mismatches = sum(a != e for a, e in zip(actual, expected, strict=True))
+        sys.exit(f"Output differs for {mismatches} of {len(paragraphs)} paragraphs")
+
+    print(f"Part {part.get('N')}: {len(sections)} sections, {len(paragraphs)} paragraphs")
+    print(f"{'method':<14}{'seconds':>10}{'paragraphs/s':>14}")
+    for method, elapsed in (("serialize", before), ("element tree", after)):
+        print(f"{method:<14}{elapsed:>10.3f}{len(paragraphs) / elapsed:>14.0f}")
+    print(f"Speedup: {before / after:.1f}x, output identical")
+
+    authority = element_text(part.find(".//AUTH")) if part.find(".//AUTH") is not None else ""
+    _, elapsed = best_time(
+        lambda: [_parse_section_element(s, authority) for s in sections], runs=args.n
+    )
+    print(f"Section parsing: {len(sections) / elapsed:.0f} sections/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""Benchmark USLM section parsing throughput.
+
+Parses every section of a US Code title XML file and reports sections per
+second, in tree mode (whole document loaded) and streaming mode (iterparse).
+Parsing is timed separately from reading the file, so the tree-mode figure
+measures only the per-section work (text, subsection hierarchy and
+references).
+
+Usage:
+    python scripts/benchmark_uslm_parser.py data/uscode/usc26.xml -n 3
+"""
+
+import argparse
+import time
+
+from arch.parsers.us.statutes import USLMParser
+
+
+def time_tree(path: str) -> tuple[int, float]:
+    parser = USLMParser(path)
+    parser.tree.getroot()  # Load the document outside the timed region
+    parser.get_title_number()
+    start = time.perf_counter()
+    count = sum(1 for _ in parser.iter_sections())
+    return count, time.perf_counter() - start
+
+
+def time_streaming(path: str) -> tuple[int, float]:
+    start = time.perf_counter()
+    count = sum(1 for _ in USLMParser(path).iter_sections(streaming=True))
+    return count, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("xml_path", help="USLM title file (e.g. usc26.xml)")
+    parser.add_argument("-n", type=int, default=3, help="Runs per mode (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'sections':>10}{'seconds':>10}{'sections/s':>12}")
+    for mode, func in (("tree", time_tree), ("streaming", time_streaming)):
+        count, elapsed = min((func(args.xml_path) for _ in range(args.n)), key=lambda r: r[1])
+        print(f"{mode:<12}{count:>10}{elapsed:>10.2f}{count / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
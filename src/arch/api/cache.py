@@ -0,0 +1,261 @@
+"""HTTP response caching for the REST API.
+
+Statute text only changes when a title is re-ingested, so serialized
+responses can be reused across requests. Each entry records the storage
+data version it was built from; a lookup made after the title's data has
+changed is a miss, so re-ingesting a title invalidates its entries without
+any coordination between the ingest process and the server.
+
+Bodies are compressed once when cached (gzip, and brotli when the optional
+``brotli`` package is installed), so a hit costs no serialization or
+compression work whatever encoding the client negotiates. Compression is
+CPU-bound, so the server builds entries (``ResponseCache.build``) and
+encodes uncached bodies (``encode_json``) in worker threads, and only
+stores and sends the finished bytes on the event loop.
+
+Example:
+    >>> cache = ResponseCache(max_bytes=64 * 1024 * 1024)
+    >>> entry = cache.put(("section", 26, "32"), "v1", body, last_modified)
+    >>> entry.response(request.headers.get("if-none-match"), request.headers.get("accept-encoding"))
+"""
+
+import gzip
+import hashlib
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from email.utils import format_datetime
+
+from fastapi import Response
+
+# Lazy import - only load if fast extras installed
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE = 3600
+
+# Bodies smaller than this are sent uncompressed; framing would eat the savings
+MIN_COMPRESS_SIZE = 500
+
+# Content codings in order of preference; brotli is smaller but optional
+ENCODINGS = ("br", "gzip") if BROTLI_AVAILABLE else ("gzip",)
+
+
+def encode_body(body: bytes, encoding: str) -> bytes:
+    """Compress a body with one content coding ("br" or "gzip")."""
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def compress_body(body: bytes) -> dict[str, bytes]:
+    """Pre-compress a body with every available content coding."""
+    if len(body) < MIN_COMPRESS_SIZE:
+        return {}
+    return {encoding: encode_body(body, encoding) for encoding in ENCODINGS}
+
+
+def accepted_encodings(accept_encoding: str | None) -> set[str]:
+    """Content codings an Accept-Encoding header allows (q=0 excluded)."""
+    accepted = set()
+    for part in (accept_encoding or "").lower().split(","):
+        name, _, params = part.partition(";")
+        q = params.strip().removeprefix("q=")
+        if name.strip() and q not in ("0", "0.0", "0.00", "0.000"):
+            accepted.add(name.strip())
+    return accepted
+
+
+def negotiate(accept_encoding: str | None, available: Iterable[str] = ENCODINGS) -> str | None:
+    """Pick the preferred available coding the client accepts (None: identity)."""
+    accepted = accepted_encodings(accept_encoding)
+    return next((e for e in ENCODINGS if e in available and e in accepted), None)
+
+
+def encode_json(body: bytes, accept_encoding: str | None = None) -> tuple[bytes, str | None]:
+    """Compress an uncached body if the client accepts it.
+
+    Returns:
+        The body to send and its content coding (None: identity)
+    """
+    encoding = negotiate(accept_encoding) if len(body) >= MIN_COMPRESS_SIZE else None
+    return (encode_body(body, encoding), encoding) if encoding else (body, None)
+
+
+def json_response(body: bytes, encoding: str | None = None) -> Response:
+    """JSON response for an uncached body already encoded by ``encode_json``."""
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized JSON response body with its validators."""
+
+    body: bytes
+    etag: str
+    last_modified: str | None
+    version: str | None
+    max_age: int
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """Bytes held by the entry, including compressed copies."""
+        return len(self.body) + sum(len(body) for body in self.encoded.values())
+
+    def negotiate(self, accept_encoding: str | None) -> str | None:
+        """Pick the preferred stored encoding the client accepts (None: identity)."""
+        return negotiate(accept_encoding, self.encoded)
+
+    def etag_for(self, encoding: str | None) -> str:
+        """ETag of one representation; compressed bodies get a suffixed tag."""
+        return self.etag if encoding is None else f'{self.etag[:-1]}-{encoding}"'
+
+    def headers_for(self, encoding: str | None = None) -> dict[str, str]:
+        """Caching headers sent with both 200 and 304 responses."""
+        headers = {
+            "ETag": self.etag_for(encoding),
+            "Cache-Control": f"public, max-age={self.max_age}",
+        }
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+        if self.encoded:
+            headers["Vary"] = "Accept-Encoding"
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return headers
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Caching headers of the uncompressed representation."""
+        return self.headers_for(None)
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Whether an If-None-Match header matches any representation's ETag."""
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        current = {self.etag_for(None), *(self.etag_for(e) for e in self.encoded)}
+        return "*" in tags or bool(tags & current)
+
+    def response(
+        self, if_none_match: str | None = None, accept_encoding: str | None = None
+    ) -> Response:
+        """Build a 200 response, or a bodiless 304 if the client's copy is current.
+
+        The body is sent in the best pre-compressed encoding the client
+        accepts.
+        """
+        encoding = self.negotiate(accept_encoding)
+        headers = self.headers_for(encoding)
+        if self.matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+        body = self.encoded[encoding] if encoding else self.body
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def http_date(day: date) -> str:
+    """Format a date as an HTTP-date (midnight UTC)."""
+    return format_datetime(datetime(day.year, day.month, day.day, tzinfo=timezone.utc), usegmt=True)
+
+
+class ResponseCache:
+    """Size-bounded LRU of serialized responses.
+
+    Used from the event loop only, so it needs no locking.
+
+    Args:
+        max_bytes: Total body bytes to keep (0 disables storage, but
+            responses still get ETags and 304 handling)
+        max_age: Cache-Control max-age sent to clients, in seconds
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES, max_age: int = DEFAULT_MAX_AGE):
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, version: str | None) -> CachedResponse | None:
+        """Look up a response built from the given data version."""
+        entry = self._entries.get(key)
+        if entry is None or version is None or entry.version != version:
+            if entry is not None:
+                self._evict(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def build(
+        self,
+        body: bytes,
+        version: str | None,
+        last_modified: date | None = None,
+    ) -> CachedResponse:
+        """Hash and compress a serialized body into an entry, without storing it.
+
+        Touches no cache state, so it is safe to call from a worker thread.
+        """
+        return CachedResponse(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            last_modified=http_date(last_modified) if last_modified else None,
+            version=version,
+            max_age=self.max_age,
+            encoded=compress_body(body),
+        )
+
+    def store(self, key: Hashable, entry: CachedResponse) -> CachedResponse:
+        """Keep a built entry, evicting the least recently used ones to fit.
+
+        Entries from storage without a data version (``version`` None) are
+        not kept.
+        """
+        if entry.version is None or entry.size > self.max_bytes:
+            return entry
+
+        if key in self._entries:
+            self._evict(key)
+        self._entries[key] = entry
+        self.size += entry.size
+        while self.size > self.max_bytes:
+            self._evict(next(iter(self._entries)))
+        return entry
+
+    def put(
+        self,
+        key: Hashable,
+        version: str | None,
+        body: bytes,
+        last_modified: date | None = None,
+    ) -> CachedResponse:
+        """Store a serialized body; the ETag is a hash of its content.
+
+        Responses from storage without a data version (``version`` None) get
+        validators but are not kept.
+        """
+        return self.store(key, self.build(body, version, last_modified))
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self.size = 0
+
+    def _evict(self, key: Hashable) -> None:
+        self.size -= self._entries.pop(key).size
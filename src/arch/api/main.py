@@ -1,14 +1,42 @@
 """FastAPI application for the law archive REST API."""
 
+import hashlib
+import os
+import zlib
+from collections.abc import Callable
 from datetime import date
+from functools import partial
 from pathlib import Path
+from typing import Any, Literal
 
-from fastapi import FastAPI, HTTPException, Query
+import anyio
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from arch.api.cache import (
+    DEFAULT_CACHE_BYTES,
+    DEFAULT_MAX_AGE,
+    CachedResponse,
+    ResponseCache,
+    accepted_encodings,
+    encode_json,
+    json_response,
+)
+from arch.api.metrics import (
+    CONTENT_TYPE,
+    MetricsMiddleware,
+    MetricsRegistry,
+    instrument_storage,
+)
+from arch.api.serialize import dumps, search_payload, section_payload
 from arch.archive import Arch
 from arch.models import Citation, SearchResult, Section
+from arch.storage.sharded import open_storage
+
+# Sections read and serialized per chunk of a streamed export
+EXPORT_BATCH_SIZE = 500
 
 
 # Response models
@@ -62,8 +90,9 @@ class SearchResponse(BaseModel):
     """API response for search endpoint."""
 
     query: str
-    total: int
+    total: int | None
     results: list[SearchResultResponse]
+    next_cursor: str | None = None
 
 
 class TitleResponse(BaseModel):
@@ -84,11 +113,87 @@ class ReferencesResponse(BaseModel):
     referenced_by: list[str]
 
 
-def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
+class GraphNodeResponse(BaseModel):
+    """A section reached in a graph traversal."""
+
+    citation: str
+    depth: int
+
+
+class GraphClosureResponse(BaseModel):
+    """API response for transitive dependency queries."""
+
+    citation: str
+    direction: str
+    max_depth: int | None
+    total: int
+    sections: list[GraphNodeResponse]
+
+
+class CitedSectionResponse(BaseModel):
+    """A section with the number of sections citing it."""
+
+    citation: str
+    cited_by: int
+
+
+class SuggestionResponse(BaseModel):
+    """A typeahead suggestion."""
+
+    citation: str
+    heading: str
+    cited_by: int
+
+
+class BatchSectionsRequest(BaseModel):
+    """API request for fetching many sections at once."""
+
+    citations: list[str] = Field(..., min_length=1, max_length=1000)
+    as_of: date | None = None
+
+
+class BatchSectionsResponse(BaseModel):
+    """API response for batched section lookups."""
+
+    sections: list[SectionResponse]
+    not_found: list[str]
+
+
+def create_app(
+    db_path: Path | str = "atlas.db",
+    read_only: bool = True,
+    max_workers: int | None = None,
+    cache_bytes: int = DEFAULT_CACHE_BYTES,
+    cache_max_age: int = DEFAULT_MAX_AGE,
+    metrics: bool | None = None,
+) -> FastAPI:
     """Create and configure the FastAPI application.
 
+    Storage calls are blocking, so handlers run them on a bounded pool of
+    worker threads. With ``read_only`` (the default) each worker thread
+    queries through its own read-only WAL connection.
+
+    Section responses carry an ETag (hash of the body), Cache-Control and
+    Last-Modified headers, and are answered with 304 when If-None-Match
+    matches. Serialized bodies are kept in an LRU that is invalidated when
+    the storage's data version for the title changes (i.e. on re-ingest).
+
+    Hot endpoints serialize straight to JSON bytes (see arch.api.serialize)
+    rather than through their pydantic response models, and responses are
+    compressed when the client accepts it: cached sections are stored
+    pre-compressed, other responses are compressed per request.
+
+    With ``metrics`` on, ``/metrics`` serves Prometheus metrics: per-route
+    latency, response sizes, in-flight requests, storage operation timings
+    and row counts, and cache hit counts. With it off nothing is recorded.
+
     Args:
-        db_path: Path to SQLite database
+        db_path: Path to SQLite database, or a directory of title shards
+        read_only: Open the database in concurrent read-only mode
+        max_workers: Maximum concurrent storage calls (default: cores + 4, max 32)
+        cache_bytes: Size bound of the response cache (0 disables it)
+        cache_max_age: Cache-Control max-age for section responses, in seconds
+        metrics: Expose /metrics (default: the ARCH_METRICS environment variable)
 
     Returns:
         Configured FastAPI application
@@ -111,7 +216,74 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
     )
 
     # Initialize archive
-    archive = Arch(db_path=db_path)
+    archive = Arch(storage=open_storage(db_path, read_only=read_only))
+
+    # Bounded offload of blocking storage calls
+    limiter = anyio.CapacityLimiter(max_workers or min(32, (os.cpu_count() or 1) + 4))
+
+    async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return await anyio.to_thread.run_sync(partial(func, *args, **kwargs), limiter=limiter)
+
+    async def json_reply(request: Request, payload: Callable[[], Any]) -> Response:
+        """Build, serialize and compress a JSON body in a worker thread."""
+        accept_encoding = request.headers.get("accept-encoding")
+        body, encoding = await run_blocking(lambda: encode_json(dumps(payload()), accept_encoding))
+        return json_response(body, encoding)
+
+    cache = ResponseCache(max_bytes=cache_bytes, max_age=cache_max_age)
+    app.state.response_cache = cache
+
+    if metrics is None:
+        metrics = os.environ.get("ARCH_METRICS", "").lower() in ("1", "true", "yes")
+    if metrics:
+        registry = MetricsRegistry()
+        app.state.metrics = registry
+        app.add_middleware(MetricsMiddleware, registry=registry)
+        instrument_storage(archive.storage, registry)
+        registry.callback(
+            "arch_response_cache_hits_total", "Response cache hits", lambda: cache.hits, "counter"
+        )
+        registry.callback(
+            "arch_response_cache_misses_total",
+            "Response cache misses",
+            lambda: cache.misses,
+            "counter",
+        )
+        registry.callback(
+            "arch_response_cache_bytes", "Bytes held by the response cache", lambda: cache.size
+        )
+        registry.callback(
+            "arch_response_cache_entries", "Entries in the response cache", lambda: len(cache)
+        )
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics_endpoint():
+            """Prometheus metrics in the text exposition format."""
+            return Response(content=registry.render(), media_type=CONTENT_TYPE)
+
+    async def section_response(
+        request: Request, citation: Citation, as_of: date | None, not_found: str
+    ) -> Response:
+        """Serve a section from the response cache, loading it on a miss."""
+        key = ("section", citation.title, citation.section, citation.subsection, as_of)
+        version = archive.storage.data_version(citation.title)
+        entry = cache.get(key, version)
+        if entry is None:
+
+            def load() -> CachedResponse | None:
+                result = archive.get(citation, as_of=as_of)
+                if not result:
+                    return None
+                body = dumps(section_payload(result))
+                return cache.build(body, version, last_modified=result.retrieved_at)
+
+            entry = await run_blocking(load)
+            if entry is None:
+                raise HTTPException(status_code=404, detail=not_found)
+            cache.store(key, entry)
+        return entry.response(
+            request.headers.get("if-none-match"), request.headers.get("accept-encoding")
+        )
 
     @app.get("/")
     async def root():
@@ -125,7 +297,7 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
     @app.get("/v1/titles", response_model=list[TitleResponse])
     async def list_titles():
         """List all available US Code titles."""
-        titles = archive.list_titles()
+        titles = await run_blocking(archive.list_titles)
         return [
             TitleResponse(
                 number=t.number,
@@ -137,8 +309,72 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
             for t in titles
         ]
 
+    def export_chunk(title: int, after: str | None) -> tuple[bytes, str | None, int]:
+        """Read and serialize one page of a title as NDJSON."""
+        page = archive.storage.get_title_sections(title, after=after, limit=EXPORT_BATCH_SIZE)
+        body = b"".join(dumps(section_payload(s)) + b"\n" for s in page)
+        return body, page[-1].citation.section if page else None, len(page)
+
+    @app.get("/v1/titles/{title}/export")
+    async def export_title(
+        request: Request,
+        title: int,
+        after: str | None = Query(None, description="Resume after this section number"),
+    ):
+        """Stream every section of a title as NDJSON.
+
+        Each line is a section in the same shape as /v1/sections, ordered by
+        section number. The body is gzip-encoded when the client accepts it.
+
+        To resume an interrupted download, pass the section number of the
+        last complete line as ``after`` and the original ETag as If-Match;
+        412 means the title was re-ingested since, so start over.
+
+        Examples:
+            - /v1/titles/42/export
+            - /v1/titles/42/export?after=1395w-4 (with If-Match)
+        """
+        version = archive.storage.data_version(title)
+        etag = f'"{hashlib.sha256(version.encode()).hexdigest()[:32]}"' if version else None
+        if_match = request.headers.get("if-match")
+        if if_match and etag and not {"*", etag} & {t.strip() for t in if_match.split(",")}:
+            raise HTTPException(
+                status_code=412, detail=f"Title {title} changed since the export started"
+            )
+
+        first = await run_blocking(export_chunk, title, after)
+        if not first[2] and after is None:
+            raise HTTPException(status_code=404, detail=f"Title {title} not found")
+
+        gzip_body = "gzip" in accepted_encodings(request.headers.get("accept-encoding"))
+
+        async def stream():
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            body, last, count = first
+            while count:
+                if gzip_body:
+                    # Sync-flush each chunk so a dropped transfer still decodes
+                    body = compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                yield body
+                if count < EXPORT_BATCH_SIZE:
+                    break
+                body, last, count = await run_blocking(export_chunk, title, last)
+            if gzip_body:
+                yield compressor.flush()
+
+        headers = {
+            "Vary": "Accept-Encoding",
+            "Content-Disposition": f'attachment; filename="usc{title:02d}.ndjson"',
+        }
+        if etag:
+            headers["ETag"] = etag
+        if gzip_body:
+            headers["Content-Encoding"] = "gzip"
+        return StreamingResponse(stream(), media_type="application/x-ndjson", headers=headers)
+
     @app.get("/v1/sections/{title}/{section}", response_model=SectionResponse)
     async def get_section(
+        request: Request,
         title: int,
         section: str,
         as_of: date | None = Query(None, description="Historical version date"),
@@ -149,47 +385,68 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
             - /v1/sections/26/32 - Get IRC § 32 (EITC)
             - /v1/sections/26/32?as_of=2020-01-01 - Historical version
         """
-        result = archive.get(
+        return await section_response(
+            request,
             Citation(title=title, section=section),
-            as_of=as_of,
+            as_of,
+            not_found=f"Section {title} USC {section} not found",
         )
-        if not result:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Section {title} USC {section} not found",
-            )
-        return SectionResponse.from_section(result)
 
     @app.get("/v1/sections/{title}/{section}/{subsection:path}", response_model=SectionResponse)
     async def get_subsection(
+        request: Request,
         title: int,
         section: str,
         subsection: str,
         as_of: date | None = Query(None, description="Historical version date"),
     ):
-        """Get a specific subsection.
+        """Get a specific subsection and its descendants.
 
         Examples:
             - /v1/sections/26/32/a/1 - Get IRC § 32(a)(1)
         """
-        # For now, get the full section and let the client navigate
-        # TODO: Return just the subsection
-        result = archive.get(
+        return await section_response(
+            request,
             Citation(title=title, section=section, subsection=subsection),
-            as_of=as_of,
+            as_of,
+            not_found=f"Section {title} USC {section}({subsection}) not found",
         )
-        if not result:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Section {title} USC {section}({subsection}) not found",
-            )
-        return SectionResponse.from_section(result)
+
+    @app.post("/v1/sections:batch", response_model=BatchSectionsResponse)
+    async def get_sections_batch(request: Request, batch: BatchSectionsRequest):
+        """Get many sections in one request.
+
+        Example body:
+            {"citations": ["26 USC 32", "26 USC 24(a)"], "as_of": null}
+        """
+        try:
+            citations = [Citation.from_string(c) for c in batch.citations]
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+        def payload() -> dict:
+            results = archive.get_many(citations, as_of=batch.as_of)
+            return {
+                "sections": [section_payload(r) for r in results if r is not None],
+                "not_found": [
+                    cite for cite, r in zip(batch.citations, results, strict=True) if r is None
+                ],
+            }
+
+        return await json_reply(request, payload)
 
     @app.get("/v1/search", response_model=SearchResponse)
     async def search(
+        request: Request,
         q: str = Query(..., min_length=1, description="Search query"),
         title: int | None = Query(None, description="Limit to specific title"),
+        jurisdiction: str | None = Query(None, description="Limit to jurisdiction"),
+        doc_type: str | None = Query(None, description="Limit to document type"),
         limit: int = Query(20, ge=1, le=100, description="Maximum results"),
+        cursor: str | None = Query(None, description="next_cursor from the previous page"),
+        include_total: bool = Query(
+            False, description="Count all matches (first page only; costs a full match scan)"
+        ),
     ):
         """Full-text search across sections.
 
@@ -198,13 +455,28 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
             - Phrases: "child tax credit"
             - Boolean: child AND credit
             - Prefix: tax*
+
+        Pass the returned next_cursor as ``cursor`` to fetch the next page.
+        With ``include_total``, the first page also reports how many sections
+        match; later pages never count, so deep pages stay cheap.
         """
-        results = archive.search(q, title=title, limit=limit)
-        return SearchResponse(
-            query=q,
-            total=len(results),
-            results=[SearchResultResponse.from_result(r) for r in results],
-        )
+
+        def payload() -> dict:
+            page = archive.search_page(
+                q,
+                title=title,
+                jurisdiction=jurisdiction,
+                doc_type=doc_type,
+                limit=limit,
+                cursor=cursor,
+                include_total=include_total and cursor is None,
+            )
+            return search_payload(q, page)
+
+        try:
+            return await json_reply(request, payload)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
 
     @app.get("/v1/references/{title}/{section}", response_model=ReferencesResponse)
     async def get_references(title: int, section: str):
@@ -213,15 +485,68 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
         Returns sections that this section references and sections that
         reference this section.
         """
-        refs = archive.get_references(Citation(title=title, section=section))
+        refs = await run_blocking(archive.get_references, Citation(title=title, section=section))
         return ReferencesResponse(
             citation=f"{title} USC {section}",
             references_to=refs["references_to"],
             referenced_by=refs["referenced_by"],
         )
 
+    @app.get("/v1/graph/most-cited", response_model=list[CitedSectionResponse])
+    async def most_cited(limit: int = Query(20, ge=1, le=1000, description="Maximum results")):
+        """Sections ranked by how many other sections cite them."""
+        graph = await run_blocking(lambda: archive.graph)
+        return [
+            CitedSectionResponse(citation=cite, cited_by=count)
+            for cite, count in graph.most_cited(limit)
+        ]
+
+    @app.get("/v1/graph/{title}/{section}/{direction}", response_model=GraphClosureResponse)
+    async def graph_closure(
+        title: int,
+        section: str,
+        direction: Literal["dependencies", "dependents"],
+        depth: int | None = Query(None, ge=1, description="Maximum hops (default: all)"),
+    ):
+        """Transitive cross-references of a section.
+
+        Examples:
+            - /v1/graph/26/32/dependencies?depth=2 - Sections 26 USC 32 relies on
+            - /v1/graph/26/62/dependents - Everything that transitively cites § 62
+        """
+        lookup = archive.get_dependencies if direction == "dependencies" else archive.get_dependents
+        reached = await run_blocking(lookup, Citation(title=title, section=section), depth)
+        nodes = sorted(reached.items(), key=lambda item: (item[1], item[0]))
+        return GraphClosureResponse(
+            citation=f"{title} USC {section}",
+            direction=direction,
+            max_depth=depth,
+            total=len(nodes),
+            sections=[GraphNodeResponse(citation=c, depth=d) for c, d in nodes],
+        )
+
+    @app.get("/v1/suggest", response_model=list[SuggestionResponse])
+    async def suggest(
+        request: Request,
+        q: str = Query(..., min_length=1, description="Partial citation or heading"),
+        limit: int = Query(10, ge=1, le=50, description="Maximum suggestions"),
+    ):
+        """Typeahead suggestions for a partially typed citation or heading.
+
+        Matches citation and heading prefixes, most cited sections first.
+
+        Examples:
+            - /v1/suggest?q=26 USC 3
+            - /v1/suggest?q=earned inc
+        """
+        # Building the index reads every heading; later lookups are in-memory
+        return await json_reply(
+            request, lambda: [s.model_dump() for s in archive.suggest_index.suggest(q, limit=limit)]
+        )
+
     @app.get("/v1/citation/{citation:path}", response_model=SectionResponse)
     async def get_by_citation(
+        request: Request,
         citation: str,
         as_of: date | None = Query(None, description="Historical version date"),
     ):
@@ -236,13 +561,9 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e)) from e
 
-        result = archive.get(parsed, as_of=as_of)
-        if not result:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Section {citation} not found",
-            )
-        return SectionResponse.from_section(result)
+        return await section_response(
+            request, parsed, as_of, not_found=f"Section {citation} not found"
+        )
 
     return app
 
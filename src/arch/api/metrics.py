@@ -0,0 +1,336 @@
+"""Prometheus metrics for the REST API and its storage backend.
+
+A small in-process registry rendered in the Prometheus text exposition
+format at ``/metrics``. It records:
+
+- request latency histograms, response sizes and in-flight requests per
+  route (labelled by route template, so path parameters don't explode the
+  label set)
+- storage operation latency and rows returned per backend and operation
+- response cache hits, misses and size (read at scrape time)
+
+Nothing is installed unless metrics are enabled in create_app, so a server
+without metrics pays nothing; with them on, recording an observation is a
+bisect and two additions under a lock.
+
+Example:
+    >>> registry = MetricsRegistry()
+    >>> latency = registry.histogram("op_seconds", "Operation latency", ["op"])
+    >>> latency.observe(0.012, "search")
+    >>> print(registry.render())
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any
+
+from arch.models import SearchPage, Section
+
+# Latency buckets in seconds, from sub-millisecond cached lookups up to
+# slow full-text searches
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Storage methods timed by instrument_storage
+INSTRUMENTED_OPERATIONS = (
+    "get_section",
+    "get_sections",
+    "get_title_sections",
+    "search",
+    "search_page",
+    "list_titles",
+    "get_references_to",
+    "get_referenced_by",
+)
+
+# Set while an instrumented storage operation runs, so operations it calls
+# internally (search -> search_page) are not recorded a second time
+_in_storage_operation: ContextVar[bool] = ContextVar("_in_storage_operation", default=False)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric:
+    """Base for labelled metrics; values are keyed by label-value tuples."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        return self.header() + self.samples()
+
+
+class Counter(Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, *label_values: str) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labels, k)} {_number(v)}" for k, v in items]
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, *label_values: str) -> None:
+        self.inc(-amount, *label_values)
+
+
+class Histogram(Metric):
+    """Cumulative bucket counts, sum and count per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (last is +Inf), sum]
+        self._values: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                entry = self._values[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def count(self, *label_values: str) -> int:
+        entry = self._values.get(label_values)
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, (list(v[0]), v[1])) for k, v in self._values.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts, strict=True):
+                cumulative += count
+                le = 'le="+Inf"' if bound == "+Inf" else f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labels, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labels, key)} {cumulative}")
+        return lines
+
+
+class CallbackMetric(Metric):
+    """Unlabelled value read from a function at scrape time."""
+
+    def __init__(self, name: str, help: str, kind: str, func: Callable[[], float]):
+        super().__init__(name, help)
+        self.kind = kind
+        self.func = func
+
+    def samples(self) -> list[str]:
+        return [f"{self.name} {_number(self.func())}"]
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def _register(self, metric: Metric) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def callback(
+        self, name: str, help: str, func: Callable[[], float], kind: str = "gauge"
+    ) -> CallbackMetric:
+        """Register a value computed when scraped (no recording cost)."""
+        return self._register(CallbackMetric(name, help, kind, func))
+
+    def get(self, name: str) -> Metric:
+        return self._metrics[name]
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = [line for metric in self._metrics.values() for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording per-route latency, response size and in-flight requests."""
+
+    def __init__(self, app, registry: MetricsRegistry):
+        self.app = app
+        self.in_flight = registry.gauge(
+            "arch_http_requests_in_flight", "HTTP requests currently being served"
+        )
+        self.duration = registry.histogram(
+            "arch_http_request_duration_seconds",
+            "HTTP request latency",
+            ["method", "route", "status"],
+        )
+        self.response_bytes = registry.counter(
+            "arch_http_response_bytes_total",
+            "HTTP response body bytes sent (after compression)",
+            ["method", "route"],
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        start = time.perf_counter()
+        self.in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.in_flight.dec()
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            template = getattr(route, "path", "<unmatched>")
+            method = scope["method"]
+            self.duration.observe(time.perf_counter() - start, method, template, str(status))
+            self.response_bytes.inc(size, method, template)
+
+
+def _row_count(result: Any) -> int:
+    if result is None:
+        return 0
+    if isinstance(result, Section):
+        return 1
+    if isinstance(result, SearchPage):
+        return len(result.results)
+    if isinstance(result, list):
+        return sum(item is not None for item in result)
+    return 1
+
+
+def instrument_storage(storage: Any, registry: MetricsRegistry) -> None:
+    """Time a storage backend's read operations and count the rows they return.
+
+    Wraps the methods on this instance only, so other users of the backend
+    class are unaffected. Only the outermost operation of a call is
+    recorded: when ``get_sections`` calls ``get_section`` for each citation,
+    the request counts as one ``get_sections`` operation.
+    """
+    backend = type(storage).__name__
+    duration = registry.histogram(
+        "arch_storage_operation_duration_seconds",
+        "Storage operation latency",
+        ["backend", "operation"],
+    )
+    rows = registry.counter(
+        "arch_storage_rows_total", "Rows returned by storage operations", ["backend", "operation"]
+    )
+
+    def timed(operation: str, method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            if _in_storage_operation.get():
+                return method(*args, **kwargs)
+            token = _in_storage_operation.set(True)
+            start = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                _in_storage_operation.reset(token)
+            duration.observe(time.perf_counter() - start, backend, operation)
+            rows.inc(_row_count(result), backend, operation)
+            return result
+
+        return wrapper
+
+    for operation in INSTRUMENTED_OPERATIONS:
+        method = getattr(storage, operation, None)
+        if method is not None:
+            setattr(storage, operation, timed(operation, method))
@@ -0,0 +1,86 @@
+"""Fast JSON serialization of API responses.
+
+Response bodies are built as plain dicts and encoded straight to bytes, so
+the hot endpoints skip constructing, validating and re-serializing pydantic
+response models. The output matches the response models field for field,
+which keep documenting the schema in OpenAPI.
+
+orjson is used when installed (``pip install cosilico-arch[fast]``);
+otherwise the standard library encoder produces the same compact JSON.
+
+Example:
+    >>> body = dumps(section_payload(section))
+    >>> Response(content=body, media_type="application/json")
+"""
+
+import json
+from datetime import date
+from typing import Any
+
+from arch.models import SearchPage, SearchResult, Section, Subsection
+
+# Lazy import - only load if fast extras installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> str:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode a payload as compact UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default).encode()
+
+
+def subsection_payload(subsection: Subsection) -> dict:
+    """Subsection tree as a dict (same shape as ``Subsection.model_dump()``)."""
+    return {
+        "identifier": subsection.identifier,
+        "heading": subsection.heading,
+        "text": subsection.text,
+        "children": [subsection_payload(child) for child in subsection.children],
+    }
+
+
+def section_payload(section: Section) -> dict:
+    """Section body as served by the API (the SectionResponse shape)."""
+    return {
+        "citation": section.citation.usc_cite,
+        "title_name": section.title_name,
+        "section_title": section.section_title,
+        "text": section.text,
+        "subsections": [subsection_payload(s) for s in section.subsections],
+        "source_url": section.source_url,
+        "retrieved_at": section.retrieved_at,
+        "references_to": section.references_to,
+        "referenced_by": section.referenced_by,
+    }
+
+
+def search_result_payload(result: SearchResult) -> dict:
+    """Search hit as served by the API (the SearchResultResponse shape)."""
+    return {
+        "citation": result.citation.usc_cite,
+        "section_title": result.section_title,
+        "snippet": result.snippet,
+        "score": result.score,
+    }
+
+
+def search_payload(query: str, page: SearchPage) -> dict:
+    """Search page as served by the API (the SearchResponse shape)."""
+    return {
+        "query": query,
+        "total": page.total,
+        "results": [search_result_payload(r) for r in page.results],
+        "next_cursor": page.next_cursor,
+    }
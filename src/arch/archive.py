@@ -1,11 +1,40 @@
 """Main Arch class - the public API."""
 
+import contextlib
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from datetime import date
+from itertools import islice
 from pathlib import Path
-
-from arch.models import Citation, SearchResult, Section, TitleInfo
+from queue import Empty
+
+from lxml import etree
+
+from arch.graph import CrossReferenceGraph
+from arch.models import (
+    Citation,
+    SearchPage,
+    SearchResult,
+    Section,
+    Suggestion,
+    TitleChanges,
+    TitleInfo,
+    TitleIngest,
+)
 from arch.storage.base import StorageBackend
+from arch.storage.sharded import ShardedStorage, open_storage
 from arch.storage.sqlite import SQLiteStorage
+from arch.suggest import SuggestIndex
+
+# Positive law titles (enacted into law directly, not just prima facie evidence)
+POSITIVE_LAW_TITLES = {
+    1, 3, 4, 5, 9, 10, 11, 13, 14, 17, 18, 23, 28, 31,
+    32, 34, 35, 36, 37, 38, 39, 40, 41, 44, 46, 49, 51, 54,
+}  # fmt: skip
 
 
 class Arch:
@@ -30,10 +59,15 @@ class Arch:
         """Initialize Arch.
 
         Args:
-            db_path: Path to SQLite database (ignored if storage is provided)
+            db_path: Path to SQLite database, or a directory of title shards
+                (ignored if storage is provided)
             storage: Optional custom storage backend
         """
-        self.storage = storage or SQLiteStorage(db_path)
+        self.storage = storage or open_storage(db_path)
+        self._graph: CrossReferenceGraph | None = None
+        self._graph_lock = threading.Lock()
+        self._suggest_index: SuggestIndex | None = None
+        self._suggest_lock = threading.Lock()
 
     def get(
         self,
@@ -47,7 +81,8 @@ class Arch:
             as_of: Optional date for historical version
 
         Returns:
-            Section object or None if not found
+            Section object or None if not found. For a subsection citation the
+            Section contains only that subsection and its descendants.
 
         Example:
             >>> atlas.get("26 USC 32")
@@ -64,6 +99,26 @@ class Arch:
             as_of=as_of,
         )
 
+    def get_many(
+        self,
+        citations: Iterable[str | Citation],
+        as_of: date | None = None,
+    ) -> list[Section | None]:
+        """Get many sections in a single batched storage lookup.
+
+        Args:
+            citations: USC citation strings or Citation objects
+            as_of: Optional date for historical version
+
+        Returns:
+            List aligned with ``citations``; None where a section was not found
+
+        Example:
+            >>> atlas.get_many(["26 USC 32", "26 USC 24", "42 USC 9902"])
+        """
+        parsed = [Citation.from_string(c) if isinstance(c, str) else c for c in citations]
+        return self.storage.get_sections(parsed, as_of=as_of)
+
     def search(
         self,
         query: str,
@@ -86,6 +141,62 @@ class Arch:
         """
         return self.storage.search(query, title=title, limit=limit)
 
+    def search_page(
+        self,
+        query: str,
+        title: int | None = None,
+        jurisdiction: str | None = None,
+        doc_type: str | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> SearchPage:
+        """Search with cursor-based pagination.
+
+        Args:
+            query: Search query (supports FTS5 syntax)
+            title: Optional title number to limit search
+            jurisdiction: Optional jurisdiction filter
+            doc_type: Optional document type filter
+            limit: Page size
+            cursor: ``next_cursor`` from the previous page
+            include_total: Also count all matching sections
+
+        Returns:
+            SearchPage with results, next_cursor and optional total
+
+        Example:
+            >>> page = atlas.search_page("earned income", include_total=True)
+            >>> page = atlas.search_page("earned income", cursor=page.next_cursor)
+        """
+        return self.storage.search_page(
+            query,
+            title=title,
+            jurisdiction=jurisdiction,
+            doc_type=doc_type,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
+
+    def iter_title(
+        self, title: int, after: str | None = None, batch_size: int = 500
+    ) -> Iterator[Section]:
+        """Iterate over every section of a title in constant memory.
+
+        Args:
+            title: Title number
+            after: Resume after this section number (from a previous export)
+            batch_size: Sections fetched per storage query
+
+        Example:
+            >>> for section in atlas.iter_title(26):
+            ...     print(section.citation.usc_cite)
+        """
+        while page := self.storage.get_title_sections(title, after=after, limit=batch_size):
+            yield from page
+            after = page[-1].citation.section
+
     def list_titles(self) -> list[TitleInfo]:
         """List all available US Code titles.
 
@@ -116,14 +227,147 @@ class Arch:
             "referenced_by": self.storage.get_referenced_by(citation.title, citation.section),
         }
 
-    def ingest_title(self, xml_path: Path | str) -> int:
+    @property
+    def graph(self) -> CrossReferenceGraph:
+        """Cross-reference graph, loaded on first use (see load_graph)."""
+        with self._graph_lock:
+            if self._graph is None:
+                self._graph = self.load_graph()
+            return self._graph
+
+    def load_graph(self, snapshot_path: Path | str | None = None) -> CrossReferenceGraph:
+        """Load the cross-reference graph, preferring a persisted snapshot.
+
+        The snapshot is reused while the storage's cross-reference fingerprint
+        matches; otherwise the graph is rebuilt from storage and the snapshot
+        rewritten.
+
+        Args:
+            snapshot_path: Snapshot file (default: "<db_path>.graph" for SQLite,
+                "<root>/cross_references.graph" for sharded storage)
+
+        Returns:
+            CrossReferenceGraph
+        """
+        fingerprint = self.storage.cross_reference_fingerprint()
+        if snapshot_path is None and isinstance(self.storage, SQLiteStorage):
+            snapshot_path = f"{self.storage.db_path}.graph"
+        elif snapshot_path is None and isinstance(self.storage, ShardedStorage):
+            snapshot_path = self.storage.root / "cross_references.graph"
+
+        if snapshot_path is not None and fingerprint is not None:
+            try:
+                graph = CrossReferenceGraph.load(snapshot_path)
+                if graph.fingerprint == fingerprint:
+                    return graph
+            except (OSError, ValueError):
+                pass  # Missing or unreadable snapshot - rebuild below
+
+        graph = CrossReferenceGraph.from_edges(
+            self.storage.iter_cross_references(), fingerprint=fingerprint
+        )
+        if snapshot_path is not None and fingerprint is not None:
+            # Snapshot is an optimization; serve from memory regardless
+            with contextlib.suppress(OSError):
+                graph.save(snapshot_path)
+        return graph
+
+    @property
+    def suggest_index(self) -> SuggestIndex:
+        """Typeahead index over US Code citations and headings, built on first use."""
+        with self._suggest_lock:
+            if self._suggest_index is None:
+                self._suggest_index = SuggestIndex.build(
+                    self.storage.iter_section_headings(), popularity=self.graph.in_degree
+                )
+            return self._suggest_index
+
+    def suggest(self, query: str, limit: int = 10) -> list[Suggestion]:
+        """Suggest sections for a partially typed citation or heading.
+
+        Args:
+            query: Prefix such as "26 USC 3" or "earned inc"
+            limit: Maximum suggestions
+
+        Returns:
+            Matching sections, most cited first
+
+        Example:
+            >>> atlas.suggest("26 usc 3")
+        """
+        return self.suggest_index.suggest(query, limit=limit)
+
+    def get_dependencies(
+        self, citation: str | Citation, max_depth: int | None = None
+    ) -> dict[str, int]:
+        """Get every section reachable from a section through its references.
+
+        Args:
+            citation: USC citation string or Citation object
+            max_depth: Maximum number of hops (None for the full closure)
+
+        Returns:
+            Citations mapped to hop distance
+
+        Example:
+            >>> atlas.get_dependencies("26 USC 32", max_depth=2)
+        """
+        return self.graph.reachable(self._section_cite(citation), max_depth=max_depth)
+
+    def get_dependents(
+        self, citation: str | Citation, max_depth: int | None = None
+    ) -> dict[str, int]:
+        """Get every section that transitively cites a section.
+
+        Args:
+            citation: USC citation string or Citation object
+            max_depth: Maximum number of hops (None for the full closure)
+
+        Returns:
+            Citations mapped to hop distance
+
+        Example:
+            >>> atlas.get_dependents("26 USC 62")
+        """
+        return self.graph.reachable(self._section_cite(citation), max_depth=max_depth, reverse=True)
+
+    @staticmethod
+    def _section_cite(citation: str | Citation) -> str:
+        """Normalize a citation to the section-level "26 USC 32" form."""
+        if isinstance(citation, str):
+            citation = Citation.from_string(citation)
+        return f"{citation.title} USC {citation.section}"
+
+    def ingest_title(
+        self,
+        xml_path: Path | str,
+        batch_size: int = 1000,
+        valid_from: date | None = None,
+        incremental: bool = False,
+    ) -> int:
         """Ingest a US Code title from USLM XML.
 
+        Sections are written in bulk transactions via
+        ``StorageBackend.store_sections``. Backends with version history
+        record a new version only for sections whose content changed, dated
+        ``valid_from`` or else the release date recorded in the XML.
+
+        With ``incremental=True`` the title is synced instead (see
+        sync_title): only added, changed and removed sections are written.
+
         Args:
             xml_path: Path to USLM XML file
+            batch_size: Number of sections written per transaction
+            valid_from: Date the release point took effect (default: the
+                release date in the XML's metadata)
+            incremental: Write only the sections that differ from storage
 
         Returns:
-            Number of sections ingested
+            Number of sections ingested (written, when incremental)
+
+        Raises:
+            ValueError: If valid_from is not given and the XML records no
+                release date
 
         Example:
             >>> atlas.ingest_title("data/uscode/usc26.xml")
@@ -131,55 +375,333 @@ class Arch:
         """
         from arch.parsers.us.statutes import USLMParser
 
+        if incremental:
+            return self.sync_title(xml_path, batch_size, valid_from).written
+        return self._ingest_parsed(USLMParser(xml_path), batch_size, valid_from)
+
+    def sync_title(
+        self,
+        xml_path: Path | str,
+        batch_size: int = 1000,
+        valid_from: date | None = None,
+    ) -> TitleChanges:
+        """Re-ingest a title from a new release point, writing only what changed.
+
+        Every section is parsed and its content hash compared with the stored
+        one. New and amended sections are written, sections dropped from the
+        title are removed, and the rest are skipped, so a release point that
+        touches a few sections costs a few writes instead of a full reload.
+
+        Args:
+            xml_path: Path to USLM XML file
+            batch_size: Number of changed sections written per transaction
+            valid_from: Date the release point took effect (default: the
+                release date in the XML's metadata)
+
+        Returns:
+            TitleChanges with the added, changed and removed section numbers
+
+        Raises:
+            ValueError: If valid_from is not given and the XML records no
+                release date
+
+        Example:
+            >>> atlas.sync_title("data/uscode/usc26.xml").summary()
+            'Title 26: 0 added, 14 changed, 1 removed, 2330 unchanged'
+        """
+        from arch.parsers.us.statutes import USLMParser
+
         parser = USLMParser(xml_path)
-        count = 0
+        title_num = parser.get_title_number()
+        title_name = parser.get_title_name()
+
+        print(f"Syncing Title {title_num}: {title_name}")
+        changes = self.storage.sync_title(
+            title_num,
+            parser.iter_sections(streaming=True),
+            valid_from=_release_date(parser, valid_from),
+            batch_size=batch_size,
+        )
+
+        is_positive_law = title_num in POSITIVE_LAW_TITLES
+        self.storage.update_title_metadata(title_num, title_name, is_positive_law)
+        if changes.written:
+            self._graph = None  # Cross-references may have changed; reload on next use
+            self._suggest_index = None
 
+        print(f"Completed: {changes.summary()}")
+        return changes
+
+    def _ingest_parsed(self, parser, batch_size: int, valid_from: date | None) -> int:
+        """Store the sections of an open USLMParser and update title metadata."""
         title_num = parser.get_title_number()
         title_name = parser.get_title_name()
+        valid_from = _release_date(parser, valid_from)
 
         print(f"Ingesting Title {title_num}: {title_name}")
 
-        for section in parser.iter_sections():
-            self.storage.store_section(section)
-            count += 1
-            if count % 100 == 0:
-                print(f"  Processed {count} sections...")
+        def with_progress(sections: Iterator[Section]) -> Iterator[Section]:
+            for i, section in enumerate(sections, 1):
+                yield section
+                if i % 100 == 0:
+                    print(f"  Processed {i} sections...")
+
+        count = self.storage.store_sections(
+            with_progress(parser.iter_sections(streaming=True)),
+            batch_size=batch_size,
+            valid_from=valid_from,
+        )
 
         # Update title metadata
-        # Positive law titles (enacted into law directly, not just prima facie evidence)
-        positive_law_titles = {
-            1,
-            3,
-            4,
-            5,
-            9,
-            10,
-            11,
-            13,
-            14,
-            17,
-            18,
-            23,
-            28,
-            31,
-            32,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            44,
-            46,
-            49,
-            51,
-            54,
-        }
-        is_positive_law = title_num in positive_law_titles
+        is_positive_law = title_num in POSITIVE_LAW_TITLES
 
         self.storage.update_title_metadata(title_num, title_name, is_positive_law)
+        self._graph = None  # Cross-references changed; reload on next use
+        self._suggest_index = None
 
         print(f"Completed: {count} sections from Title {title_num}")
         return count
+
+    def ingest_titles(
+        self,
+        xml_paths: Iterable[Path | str],
+        workers: int | None = None,
+        batch_size: int = 1000,
+        valid_from: date | None = None,
+        progress: Callable[[TitleIngest], None] | None = None,
+    ) -> list[TitleIngest]:
+        """Ingest several US Code titles in parallel.
+
+        Worker processes parse the XML files. With sharded storage each
+        worker also writes its title's shard. Otherwise the workers stream
+        parsed sections back to this process, which is the single writer
+        and stores them in batched transactions as they arrive.
+
+        Args:
+            xml_paths: USLM XML files, one per title (a file listed more than
+                once, under any spelling of its path, is ingested once)
+            workers: Maximum worker processes (default: CPU count)
+            batch_size: Number of sections per transaction and per message
+            valid_from: Date the release point took effect (default: the
+                release date in each file's metadata)
+            progress: Called with each title's result as it finishes parsing
+
+        Returns:
+            One TitleIngest per distinct file, in completion order
+
+        Raises:
+            ValueError: If valid_from is not given and a file records no
+                release date, or (with a single database) the files record
+                different release dates
+
+        Example:
+            >>> atlas.ingest_titles(Path("data/uscode").glob("usc*.xml"), workers=8)
+        """
+        # Duplicates would feed the single writer the same title twice
+        paths = list(dict.fromkeys(Path(p).resolve() for p in xml_paths))
+        released = {path: _release_date_of(path, valid_from) for path in paths}
+        if isinstance(self.storage, ShardedStorage):
+            results = self._ingest_shards(paths, workers, batch_size, released, progress)
+            self.storage.refresh()
+        else:
+            # One writer stores every title in a single load, under one date
+            dates = set(released.values())
+            if len(dates) > 1:
+                raise ValueError(
+                    "Files record different release dates "
+                    f"({', '.join(sorted(d.isoformat() for d in dates))}); "
+                    "pass valid_from or ingest them separately"
+                )
+            results = self._ingest_streamed(paths, workers, batch_size, dates.pop(), progress)
+
+        self._graph = None  # Cross-references changed; reload on next use
+        self._suggest_index = None
+        return results
+
+    def _ingest_shards(
+        self,
+        paths: list[Path],
+        workers: int | None,
+        batch_size: int,
+        released: dict[Path, date],
+        progress: Callable[[TitleIngest], None] | None,
+    ) -> list[TitleIngest]:
+        """Parse and write each title into its own shard in a worker process."""
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_ingest_shard, self.storage.root, path, batch_size, released[path])
+                for path in paths
+            ]
+            try:
+                for future in as_completed(futures):
+                    results.append(future.result())
+                    if progress:
+                        progress(results[-1])
+            except BaseException:
+                # Don't start titles that haven't been picked up yet
+                for future in futures:
+                    future.cancel()
+                raise
+        return results
+
+    def _ingest_streamed(
+        self,
+        paths: list[Path],
+        workers: int | None,
+        batch_size: int,
+        valid_from: date,
+        progress: Callable[[TitleIngest], None] | None,
+    ) -> list[TitleIngest]:
+        """Parse titles in worker processes and write them from this process."""
+        context = multiprocessing.get_context()
+        # Bounded so parsers can't run far ahead of the writer
+        queue = context.Queue(maxsize=4 * (workers or os.cpu_count() or 1))
+        stop = context.Event()  # Set to make parse workers give up early
+        title_names: dict[Path, tuple[int, str]] = {}
+        results: list[TitleIngest] = []
+
+        def receive(futures: list[Future]) -> Iterator[Section]:
+            pending = set(paths)
+            while pending:
+                # Checked on every message: other workers may keep the queue
+                # busy long after one has failed
+                for future in futures:
+                    if future.done() and future.exception():
+                        raise future.exception() from None
+                try:
+                    kind, path, *payload = queue.get(timeout=1)
+                except Empty:
+                    continue
+
+                if kind == "title":
+                    title_names[path] = tuple(payload)
+                elif kind == "sections":
+                    yield from payload[0]
+                else:
+                    count, seconds = payload
+                    pending.discard(path)
+                    title_num, title_name = title_names[path]
+                    results.append(
+                        TitleIngest(
+                            xml_path=str(path),
+                            title=title_num,
+                            title_name=title_name,
+                            sections=count,
+                            seconds=seconds,
+                        )
+                    )
+                    if progress:
+                        progress(results[-1])
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_parse_worker,
+            initargs=(queue, stop),
+        ) as pool:
+            futures = [pool.submit(_parse_title, path, batch_size) for path in paths]
+            try:
+                self.storage.store_sections(
+                    receive(futures), batch_size=batch_size, valid_from=valid_from
+                )
+            except BaseException:
+                # Stop the running workers, and unblock those waiting on a
+                # full queue, so the pool can exit
+                stop.set()
+                for future in futures:
+                    future.cancel()
+                while not all(future.done() for future in futures):
+                    with contextlib.suppress(Empty):
+                        queue.get(timeout=0.1)
+                raise
+
+        for title_num, title_name in title_names.values():
+            self.storage.update_title_metadata(
+                title_num, title_name, title_num in POSITIVE_LAW_TITLES
+            )
+        return results
+
+
+def _release_date(parser, valid_from: date | None) -> date:
+    """Date to record a title's text as taking effect: valid_from, else its release date.
+
+    Raises:
+        ValueError: If valid_from is None and the XML records no release date
+    """
+    if valid_from is not None:
+        return valid_from
+    released = parser.get_release_date()
+    if released is None:
+        raise ValueError(
+            f"{parser.xml_path} records no release date; pass the date the release "
+            "point took effect as valid_from"
+        )
+    return released
+
+
+def _release_date_of(xml_path: Path, valid_from: date | None) -> date:
+    """_release_date for a USLM file, reading only its header."""
+    from arch.parsers.us.statutes import USLMParser
+
+    if valid_from is not None:
+        return valid_from
+    try:
+        return _release_date(USLMParser(xml_path), None)
+    except etree.LxmlError as e:
+        raise ValueError(f"Failed to parse {xml_path}: {e}") from None
+
+
+# Queue to the writer process and its stop event, set in each parse worker
+# by _init_parse_worker
+_parse_queue = None
+_parse_stop = None
+
+
+def _init_parse_worker(queue, stop) -> None:
+    """Install the writer queue and stop event in a parse worker process."""
+    global _parse_queue, _parse_stop
+    _parse_queue = queue
+    _parse_stop = stop
+
+
+def _parse_title(xml_path: Path, batch_size: int) -> None:
+    """Parse a title and stream its sections to the writer (runs in a worker process)."""
+    from arch.parsers.us.statutes import USLMParser
+
+    start = time.perf_counter()
+    try:
+        parser = USLMParser(xml_path)
+        _parse_queue.put(("title", xml_path, parser.get_title_number(), parser.get_title_name()))
+
+        count = 0
+        sections = parser.iter_sections(streaming=True)
+        while batch := list(islice(sections, batch_size)):
+            if _parse_stop.is_set():
+                return  # The writer failed; nothing will read the rest
+            _parse_queue.put(("sections", xml_path, batch))
+            count += len(batch)
+    except etree.LxmlError as e:
+        # lxml errors can't be pickled back to the parent process
+        raise ValueError(f"Failed to parse {xml_path}: {e}") from None
+    _parse_queue.put(("done", xml_path, count, time.perf_counter() - start))
+
+
+def _ingest_shard(root: Path, xml_path: Path, batch_size: int, valid_from: date) -> TitleIngest:
+    """Ingest one title into its shard (runs in a worker process)."""
+    from arch.parsers.us.statutes import USLMParser
+
+    start = time.perf_counter()
+    parser = USLMParser(xml_path)
+    try:
+        count = Arch(storage=ShardedStorage(root))._ingest_parsed(parser, batch_size, valid_from)
+    except etree.LxmlError as e:
+        # lxml errors can't be pickled back to the parent process
+        raise ValueError(f"Failed to parse {xml_path}: {e}") from None
+    return TitleIngest(
+        xml_path=str(xml_path),
+        title=parser.get_title_number(),
+        title_name=parser.get_title_name(),
+        sections=count,
+        seconds=time.perf_counter() - start,
+    )
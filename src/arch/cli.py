@@ -1,5 +1,10 @@
 """Command-line interface for the law archive."""
 
+import gzip
+import json
+import sys
+from contextlib import ExitStack
+from datetime import datetime
 from pathlib import Path
 
 import click
@@ -7,10 +12,12 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from arch.api.serialize import dumps, section_payload
 from arch.archive import Arch
 from arch.fetchers.irs_bulk import IRSBulkFetcher
+from arch.models import Citation
 from arch.models_guidance import GuidanceType
-from arch.parsers.us.statutes import download_title
+from arch.parsers.us.section_index import SectionIndex, index_path
 from arch.storage.guidance import GuidanceStorage
 
 console = Console()
@@ -28,16 +35,22 @@ def main(ctx: click.Context, db: str):
 @main.command()
 @click.argument("citation")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option(
+    "--as-of",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="Return the version in effect on this date",
+)
 @click.pass_context
-def get(ctx: click.Context, citation: str, as_json: bool):
+def get(ctx: click.Context, citation: str, as_json: bool, as_of: datetime | None):
     """Get a section by citation.
 
     Examples:
         atlas get "26 USC 32"
         atlas get "26 USC 32(a)(1)"
+        atlas get "26 USC 32" --as-of 2020-01-01
     """
     archive = Arch(db_path=ctx.obj["db"])
-    section = archive.get(citation)
+    section = archive.get(citation, as_of=as_of.date() if as_of else None)
 
     if not section:
         console.print(f"[red]Not found:[/red] {citation}")
@@ -125,22 +138,319 @@ def titles(ctx: click.Context):
 
 
 @main.command()
-@click.argument("xml_path", type=click.Path(exists=True, path_type=Path))
+@click.argument("xml_paths", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--valid-from",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="Date the release point took effect (default: the release date in the XML metadata)",
+)
+@click.option(
+    "--workers", "-w", type=int, help="Parse titles in this many processes (default: CPU count)"
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Write only sections added, changed or removed since the stored release point",
+)
+@click.option(
+    "--record-changes",
+    is_flag=True,
+    help="With --incremental, record new versions and the crawl log in the Supabase archive",
+)
 @click.pass_context
-def ingest(ctx: click.Context, xml_path: Path):
-    """Ingest a US Code title from USLM XML file.
+def ingest(
+    ctx: click.Context,
+    xml_paths: tuple[Path, ...],
+    valid_from: datetime | None,
+    workers: int | None,
+    incremental: bool,
+    record_changes: bool,
+):
+    """Ingest US Code titles from USLM XML files.
+
+    Several files are parsed in parallel worker processes while a single
+    writer stores the sections. With --incremental each title is compared
+    with what is stored, section by section, and only the differences are
+    written; --record-changes also records each title's changes (sources,
+    versions and crawl log) in the Supabase document archive.
 
     Example:
         atlas ingest data/uscode/usc26.xml
+        atlas ingest data/uscode/usc26.xml --valid-from 2024-12-31
+        atlas ingest data/uscode/*.xml --workers 8
+        atlas ingest data/uscode/*.xml --incremental --valid-from 2025-01-31
+        atlas ingest data/uscode/usc26.xml --incremental --record-changes
     """
+    if record_changes and not incremental:
+        raise click.UsageError("--record-changes needs --incremental")
+
     archive = Arch(db_path=ctx.obj["db"])
-    with console.status(f"Ingesting {xml_path}..."):
-        count = archive.ingest_title(xml_path)
-    console.print(f"[green]Successfully ingested {count} sections[/green]")
+    valid_from_date = valid_from.date() if valid_from else None
+
+    import time
+
+    start = time.perf_counter()
+    done = 0
+
+    def report(result) -> None:
+        nonlocal done
+        done += 1
+        status.update(f"Ingesting {len(xml_paths)} titles... {done}/{len(xml_paths)} parsed")
+        console.print(
+            f"  Title {result.title}: {result.sections} sections in {result.seconds:.1f}s"
+        )
+
+    try:
+        if incremental:
+            ingestor = None
+            if record_changes:
+                from arch.ingest.supabase import SupabaseIngestor
+
+                ingestor = SupabaseIngestor()
+            for xml_path in xml_paths:
+                with console.status(f"Syncing {xml_path}..."):
+                    changes = archive.sync_title(xml_path, valid_from=valid_from_date)
+                console.print(f"[green]{changes.summary()}[/green]")
+                if ingestor is not None:
+                    with console.status(f"Recording Title {changes.title} changes..."):
+                        counts = ingestor.record_title_changes(
+                            changes, published_at=changes.valid_from
+                        )
+                    console.print(
+                        f"  Recorded {counts['versions']} versions and "
+                        f"{counts['crawl_log']} crawl log entries"
+                    )
+            return
+
+        if len(xml_paths) == 1 and workers is None:
+            with console.status(f"Ingesting {xml_paths[0]}..."):
+                count = archive.ingest_title(xml_paths[0], valid_from=valid_from_date)
+            console.print(f"[green]Successfully ingested {count} sections[/green]")
+            return
+
+        with console.status(f"Ingesting {len(xml_paths)} titles...") as status:
+            results = archive.ingest_titles(
+                xml_paths, workers=workers, valid_from=valid_from_date, progress=report
+            )
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1) from e
+
+    table = Table(title="Ingested Titles")
+    table.add_column("Title", justify="right", style="cyan")
+    table.add_column("Name", style="green")
+    table.add_column("Sections", justify="right")
+    table.add_column("Seconds", justify="right")
+    for result in sorted(results, key=lambda r: r.title):
+        table.add_row(
+            str(result.title), result.title_name, str(result.sections), f"{result.seconds:.1f}"
+        )
+    console.print(table)
+    console.print(
+        f"[green]Successfully ingested {sum(r.sections for r in results)} sections "
+        f"from {len(results)} titles in {time.perf_counter() - start:.1f}s[/green]"
+    )
+
+
+def _measure_storage(db_path: Path, citations: list[tuple[int, str]], queries: list[str]) -> dict:
+    """Database size and read latencies (ms) through a fresh connection."""
+    import statistics
+    import time
+
+    from arch.storage.sqlite import SQLiteStorage
+
+    storage = SQLiteStorage(db_path)
+
+    def timed(fn, *args) -> float:
+        start = time.perf_counter()
+        fn(*args)
+        return (time.perf_counter() - start) * 1000
+
+    get_ms = [timed(storage.get_section, title, section) for title, section in citations]
+    search_ms = [timed(storage.search, query) for query in queries]
+    storage.db.close()
+
+    def pct(values: list[float], q: int) -> float:
+        return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else sum(values)
+
+    return {
+        "size_mb": db_path.stat().st_size / 1e6,
+        "get_p50": pct(get_ms, 50),
+        "get_p95": pct(get_ms, 95),
+        "search_p50": pct(search_ms, 50),
+    }
 
 
 @main.command()
-@click.argument("title_num", type=int)
+@click.option(
+    "--codec",
+    type=click.Choice(["zlib", "zstd", "none"]),
+    default="zlib",
+    show_default=True,
+    help="Text format to convert to (zstd needs the compression extra)",
+)
+@click.option("--dict-size", default=64 * 1024, help="Dictionary size per title in bytes")
+@click.option("--sample", "-n", default=200, help="Sections timed for the latency report")
+@click.pass_context
+def compress(ctx: click.Context, codec: str, dict_size: int, sample: int):
+    """Convert stored text to a compressed (or plain) format.
+
+    Trains a dictionary per title, rewrites the text columns, rebuilds the
+    search index and prints size and read latency before and after.
+
+    Examples:
+        arch compress --codec zstd
+        arch compress --codec none
+    """
+    from arch.storage.sqlite import SQLiteStorage
+
+    db_path = Path(ctx.obj["db"])
+    storage = SQLiteStorage(db_path)
+    citations = storage.db.execute(
+        "SELECT title, section FROM sections ORDER BY random() LIMIT ?", [sample]
+    ).fetchall()
+    if not citations:
+        console.print("[yellow]No sections loaded. Use 'arch ingest' to add titles.[/yellow]")
+        return
+    queries = ["income", "tax credit", "definitions", "penalty", "exemption"]
+    before_name = storage.codec.name or "plain"
+
+    # Vacuum first so the size comparison isn't skewed by free pages
+    storage.db.execute("VACUUM")
+    before = _measure_storage(db_path, citations, queries)
+    try:
+        with console.status(f"Converting text to {codec}..."):
+            storage.set_compression(None if codec == "none" else codec, dict_size=dict_size)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1) from e
+    after = _measure_storage(db_path, citations, queries)
+
+    table = Table(title=f"Storage format: {before_name} -> {codec}")
+    table.add_column("Metric", style="cyan")
+    table.add_column(before_name, justify="right")
+    table.add_column(codec, justify="right")
+    table.add_column("Change", justify="right")
+    for key, label in [
+        ("size_mb", "Database size (MB)"),
+        ("get_p50", "get_section p50 (ms)"),
+        ("get_p95", "get_section p95 (ms)"),
+        ("search_p50", "search p50 (ms)"),
+    ]:
+        change = (after[key] / before[key] - 1) * 100 if before[key] else 0.0
+        table.add_row(label, f"{before[key]:.2f}", f"{after[key]:.2f}", f"{change:+.0f}%")
+    console.print(table)
+
+
+def _resume_point(path: Path) -> tuple[int, str] | None:
+    """Find where an interrupted NDJSON export stopped.
+
+    Drops any partially written trailing line and returns the (title,
+    section) of the last complete one, or None if there is none.
+    """
+    with open(path, "r+b") as f:
+        pos = f.seek(0, 2)
+        tail = b""
+        # Read backwards until the last complete line is fully in view
+        while pos > 0 and tail.count(b"\n") < 2:
+            step = min(64 * 1024, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+        complete = tail[: tail.rfind(b"\n") + 1]
+        f.truncate(pos + len(complete))
+
+    lines = complete.splitlines()
+    if not lines:
+        return None
+    citation = Citation.from_string(json.loads(lines[-1])["citation"])
+    return citation.title, citation.section
+
+
+def _version_path(output: Path) -> Path:
+    """Sidecar recording the data versions an export was started from."""
+    return output.with_name(f"{output.name}.version")
+
+
+@main.command()
+@click.argument("title_nums", nargs=-1, required=True, type=int)
+@click.option(
+    "--output", "-o", type=click.Path(path_type=Path), help="Output file (default: stdout)"
+)
+@click.option("--gzip", "use_gzip", is_flag=True, help="Gzip-compress the output")
+@click.option("--resume", is_flag=True, help="Continue an interrupted export to --output")
+@click.pass_context
+def export(
+    ctx: click.Context,
+    title_nums: tuple[int, ...],
+    output: Path | None,
+    use_gzip: bool,
+    resume: bool,
+):
+    """Export whole titles as NDJSON, one section per line.
+
+    Each line has the same shape as the API's /v1/sections responses.
+    Sections are streamed in title and section order, so memory use stays
+    flat however large the title. With --resume, an export to a plain file
+    that was interrupted continues after its last complete line, provided
+    none of the exported titles has changed since it started.
+
+    Examples:
+        arch export 26 -o usc26.ndjson
+        arch export 26 42 --gzip -o usc.ndjson.gz
+        arch export 26 -o usc26.ndjson --resume
+    """
+    if resume and (output is None or use_gzip):
+        raise click.UsageError("--resume needs a plain (non-gzip) --output file")
+
+    archive = Arch(db_path=ctx.obj["db"])
+    versions = json.dumps(
+        {str(t): archive.storage.data_version(t) for t in sorted(title_nums)}, sort_keys=True
+    )
+
+    start = None
+    if resume and output.exists():
+        version_path = _version_path(output)
+        if not version_path.exists() or version_path.read_text() != versions:
+            raise click.ClickException(
+                f"Titles changed since {output} was started; export again without --resume"
+            )
+        start = _resume_point(output)
+    elif output is not None and not use_gzip:
+        _version_path(output).write_text(versions)
+
+    # Progress goes to stderr so stdout can carry the export itself
+    progress = Console(stderr=True)
+    total = 0
+    with ExitStack() as stack:
+        if output is None:
+            out = sys.stdout.buffer
+        else:
+            out = stack.enter_context(open(output, "ab" if resume else "wb"))
+        if use_gzip:
+            out = stack.enter_context(gzip.GzipFile(fileobj=out, mode="wb"))
+
+        for title_num in sorted(title_nums):
+            after = None
+            if start is not None:
+                if title_num < start[0]:
+                    continue
+                if title_num == start[0]:
+                    after = start[1]
+            count = 0
+            with progress.status(f"Exporting Title {title_num}..."):
+                for section in archive.iter_title(title_num, after=after):
+                    out.write(dumps(section_payload(section)) + b"\n")
+                    count += 1
+            total += count
+            progress.print(f"Title {title_num}: {count} sections")
+        out.flush()
+    progress.print(f"[green]Exported {total} sections[/green]")
+
+
+@main.command()
+@click.argument("title_nums", nargs=-1, type=int)
+@click.option("--all", "all_titles", is_flag=True, help="Download every title (1-54)")
 @click.option(
     "--output",
     "-o",
@@ -148,15 +458,68 @@ def ingest(ctx: click.Context, xml_path: Path):
     default=Path("data/uscode"),
     help="Output directory",
 )
-def download(title_num: int, output: Path):
-    """Download a US Code title from uscode.house.gov.
+@click.option("--release-point", help="Release point, e.g. 119-59 (default: current)")
+@click.option(
+    "--extract/--no-extract",
+    default=True,
+    help="Extract the XML, or keep only the zip (parsers read it directly)",
+)
+def download(
+    title_nums: tuple[int, ...],
+    all_titles: bool,
+    output: Path,
+    release_point: str | None,
+    extract: bool,
+):
+    """Download US Code titles from uscode.house.gov.
+
+    Downloads stream to disk and resume if interrupted. Titles unchanged
+    since the last download are skipped with a conditional request, so a
+    nightly refresh of every title only transfers what changed.
 
     Example:
-        atlas download 26 -o data/uscode
+        arch download 26 -o data/uscode
+        arch download --all --no-extract
     """
-    with console.status(f"Downloading Title {title_num}..."):
-        path = download_title(title_num, output)
-    console.print(f"[green]Downloaded to {path}[/green]")
+    import httpx
+
+    from arch.fetchers.uscode import US_CODE_TITLES, USCodeFetcher
+
+    titles = US_CODE_TITLES if all_titles else list(title_nums)
+    if not titles:
+        raise click.UsageError("Give title numbers or --all")
+
+    with USCodeFetcher(output, release_point=release_point) as fetcher:
+        console.print(f"Release point {fetcher.release_point}")
+        for title_num in titles:
+            try:
+                with console.status(f"Downloading Title {title_num}..."):
+                    result = fetcher.download_title(title_num, extract=extract)
+            except httpx.HTTPStatusError as e:
+                console.print(f"[red]Title {title_num}: HTTP {e.response.status_code}[/red]")
+                continue
+            if result.changed:
+                size = result.bytes_downloaded / 1_000_000
+                console.print(f"[green]Title {title_num}: {result.path} ({size:.1f} MB)[/green]")
+            else:
+                console.print(f"[dim]Title {title_num}: unchanged[/dim]")
+
+
+@main.command("index-xml")
+@click.argument("xml_files", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
+def index_xml(xml_files: tuple[Path, ...]):
+    """Build sidecar section indexes for downloaded US Code XML files.
+
+    The index (e.g. usc26.xml.idx) lets single-section lookups read just
+    that section's bytes instead of parsing the whole title.
+
+    Example:
+        arch index-xml data/uscode/usc26.xml
+    """
+    for xml_file in xml_files:
+        index = SectionIndex.build(xml_file)
+        index.save(index_path(xml_file))
+        console.print(f"{xml_file}: {len(index.sections)} sections indexed")
 
 
 @main.command()
@@ -1258,14 +1621,17 @@ def ingest_cfr(ctx: click.Context, xml_path: Path, parts: tuple[int, ...]):
     if parts_list:
         console.print(f"[dim]Filtering to parts: {parts_list}[/dim]")
 
-    count = 0
-    with console.status(f"Parsing {xml_path.name}..."):
-        for regulation in fetcher.parse_title(xml_path, parts=parts_list):
-            storage.store_regulation(regulation)
-            count += 1
+    def with_progress(regulations):
+        for count, regulation in enumerate(regulations, 1):
+            yield regulation
             if count % 100 == 0:
                 console.print(f"  [dim]Processed {count:,} regulations...[/dim]")
 
+    with console.status(f"Parsing {xml_path.name}..."):
+        count = storage.store_regulations(
+            with_progress(fetcher.parse_title(xml_path, parts=parts_list))
+        )
+
     # Update title metadata
     storage.update_cfr_title_metadata(
         title_num,
@@ -1365,18 +1731,42 @@ def get_cfr(ctx: click.Context, citation: str, as_json: bool):
 @click.argument("query")
 @click.option("--title", "-t", type=int, help="Limit to specific CFR title")
 @click.option("--limit", "-n", default=10, help="Maximum results")
+@click.option(
+    "--include-statutes", is_flag=True, help="Also search US Code sections in the same database"
+)
 @click.pass_context
-def search_cfr(ctx: click.Context, query: str, title: int | None, limit: int):
+def search_cfr(
+    ctx: click.Context, query: str, title: int | None, limit: int, include_statutes: bool
+):
     """Search CFR regulations.
 
     Examples:
         arch search-cfr "earned income"
         arch search-cfr "food stamps" --title 7
         arch search-cfr "withholding" -t 26 -n 20
+        arch search-cfr "withholding" -t 26 --include-statutes
     """
     from arch.storage.regulation import RegulationStorage
 
     storage = RegulationStorage(ctx.obj["db"])
+    if include_statutes:
+        combined = storage.search_combined(query, title=title, limit=limit)
+        if not combined:
+            console.print(f"[yellow]No results for:[/yellow] {query}")
+            return
+
+        table = Table(title=f"Statute and Regulation Search: {query}")
+        table.add_column("Citation", style="cyan")
+        table.add_column("Heading", style="green")
+        table.add_column("Snippet")
+        table.add_column("Score", justify="right")
+        for r in combined:
+            heading = r.heading[:35] + "..." if len(r.heading) > 35 else r.heading
+            snippet = r.snippet[:50] + "..." if len(r.snippet) > 50 else r.snippet
+            table.add_row(r.citation, heading, snippet, f"{r.score:.2f}")
+        console.print(table)
+        return
+
     results = storage.search(query, title=title, limit=limit)
 
     if not results:
@@ -1397,6 +1787,53 @@ def search_cfr(ctx: click.Context, query: str, title: int | None, limit: int):
     console.print(table)
 
 
+@main.command("cfr-changes")
+@click.argument("title", type=int)
+@click.argument("part", type=int)
+@click.argument("start", type=click.DateTime(formats=["%Y-%m-%d"]))
+@click.argument("end", type=click.DateTime(formats=["%Y-%m-%d"]))
+@click.option("--offline", is_flag=True, help="Use recorded snapshots only, download nothing")
+@click.pass_context
+def cfr_changes(
+    ctx: click.Context, title: int, part: int, start: datetime, end: datetime, offline: bool
+):
+    """Show which sections of a CFR part changed between two dates.
+
+    Snapshots of the part at both dates are fetched from eCFR (unless
+    already recorded) and kept in the database as deltas, so later queries
+    over the same dates run locally.
+
+    Examples:
+        arch cfr-changes 7 273 2024-01-01 2024-10-01
+        arch cfr-changes 7 273 2024-03-01 2024-10-01 --offline
+    """
+    from arch.converters.ecfr import ECFRConverter
+    from arch.storage.regulation import RegulationStorage
+
+    storage = RegulationStorage(ctx.obj["db"])
+    if not offline:
+        with (
+            ECFRConverter() as converter,
+            console.status(f"Recording {title} CFR {part} snapshots..."),
+        ):
+            converter.track_part(title, part, [start.date(), end.date()], storage)
+
+    try:
+        changes = storage.diff_part(title, part, start.date(), end.date())
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1) from e
+
+    console.print(f"[blue]{changes.summary()}[/blue]")
+    for label, sections, style in (
+        ("Added", changes.added, "green"),
+        ("Changed", changes.changed, "yellow"),
+        ("Removed", changes.removed, "red"),
+    ):
+        for section in sections:
+            console.print(f"  [{style}]{label}:[/{style}] {title} CFR {part}.{section}")
+
+
 @main.command("download-uk")
 @click.argument("citation", required=False)
 @click.option("--sections", "-n", type=int, help="Max sections to download per act")
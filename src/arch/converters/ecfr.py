@@ -18,25 +18,37 @@ Priority titles for tax/benefit modeling:
 - Title 42: Public Health (Medicare/Medicaid at 42 CFR 400+)
 """
 
+import io
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 from xml.etree import ElementTree as ET
 
 import httpx
 
 from arch.models_regulation import (
     CFRCitation,
+    PartChanges,
     Regulation,
     RegulationSubsection,
 )
+from arch.parsers.cfr import CFRTitleStream, element_heading, extract_subsection_id
+
+if TYPE_CHECKING:
+    # Annotation only: converters don't depend on the storage layer
+    from arch.storage.regulation import RegulationStorage
 
 
 # eCFR API base URL
 ECFR_API_BASE = "https://www.ecfr.gov/api/versioner/v1"
 
+# Parsed part trees kept in memory per converter; a large part (26 CFR
+# Part 1) is tens of MB of XML, so only a handful are held at once
+DEFAULT_PART_CACHE_SIZE = 4
+
 # Priority CFR titles for tax/benefit analysis
 PRIORITY_TITLES = {
     7: "Agriculture (SNAP 7 CFR 271-283)",
@@ -98,6 +110,7 @@ class ECFRConverter:
         data_dir: Optional[Path] = None,
         api_base: str = ECFR_API_BASE,
         timeout: float = 120.0,
+        part_cache_size: int = DEFAULT_PART_CACHE_SIZE,
     ):
         """Initialize the converter.
 
@@ -106,11 +119,15 @@ class ECFRConverter:
                      Defaults to ~/.arch/ecfr/
             api_base: Base URL for the eCFR API.
             timeout: HTTP request timeout in seconds.
+            part_cache_size: Number of parsed parts kept in memory
+                     (0 disables the in-memory cache).
         """
         self.api_base = api_base
         self.data_dir = data_dir or Path.home() / ".arch" / "ecfr"
         self.timeout = timeout
+        self.part_cache_size = part_cache_size
         self._client: Optional[httpx.Client] = None
+        self._part_trees: OrderedDict[tuple[int, int, date], ET.Element] = OrderedDict()
 
     @property
     def client(self) -> httpx.Client:
@@ -190,51 +207,29 @@ class ECFRConverter:
         # Fetch the part XML (API doesn't support section-level queries)
         url = self.get_title_url(title, as_of=as_of, part=part)
 
-        try:
-            response = self.client.get(url, follow_redirects=True)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
+        root, error = self._load_part_result(title, part, as_of)
+        if root is None:
             return FetchResult(
-                success=False,
-                citation=citation,
-                error=f"HTTP error {e.response.status_code}: {e.response.text[:200]}",
-                source_url=url,
+                success=False, citation=citation, error=error, source_url=url
             )
-        except httpx.RequestError as e:
-            return FetchResult(
-                success=False,
-                citation=citation,
-                error=f"Request error: {str(e)}",
-                source_url=url,
-            )
-
-        # Parse XML and find the specific section
-        try:
-            regulation = self._parse_section(
-                response.text, title, part, section, url, as_of
-            )
-            if regulation is None:
-                return FetchResult(
-                    success=False,
-                    citation=citation,
-                    error=f"Section {citation.cfr_cite} not found in response",
-                    source_url=url,
-                )
 
-            return FetchResult(
-                success=True,
-                citation=citation,
-                regulation=regulation,
-                source_url=url,
-            )
-        except ET.ParseError as e:
+        # Find the specific section in the part
+        regulation = self._find_section(root, title, part, section, url, as_of)
+        if regulation is None:
             return FetchResult(
                 success=False,
                 citation=citation,
-                error=f"XML parse error: {str(e)}",
+                error=f"Section {citation.cfr_cite} not found in response",
                 source_url=url,
             )
 
+        return FetchResult(
+            success=True,
+            citation=citation,
+            regulation=regulation,
+            source_url=url,
+        )
+
     def fetch_part(
         self,
         title: int,
@@ -254,42 +249,159 @@ class ECFRConverter:
         citation = CFRCitation(title=title, part=part)
         url = self.get_title_url(title, as_of=as_of, part=part)
 
-        try:
-            response = self.client.get(url, follow_redirects=True)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
+        root, error = self._load_part_result(title, part, as_of)
+        if root is None:
             return FetchResult(
-                success=False,
-                citation=citation,
-                error=f"HTTP error {e.response.status_code}: {e.response.text[:200]}",
-                source_url=url,
-            )
-        except httpx.RequestError as e:
-            return FetchResult(
-                success=False,
-                citation=citation,
-                error=f"Request error: {str(e)}",
-                source_url=url,
+                success=False, citation=citation, error=error, source_url=url
             )
 
         # Parse all sections in the part
+        regulations = list(self._iter_part(root, title, part, url, as_of))
+        return FetchResult(
+            success=True,
+            citation=citation,
+            regulations=regulations,
+            source_url=url,
+        )
+
+    def track_part(
+        self,
+        title: int,
+        part: int,
+        dates: Iterable[date],
+        storage: "RegulationStorage",
+    ) -> list[PartChanges]:
+        """Record a part's history at several dates in local storage.
+
+        Dates the storage already has a snapshot for are skipped, so calling
+        this again with overlapping dates downloads nothing new. Snapshots
+        are stored as deltas (see RegulationStorage.record_part_snapshot);
+        once recorded, ``storage.diff_part`` answers which sections changed
+        between any two covered dates without the API.
+
+        History is kept in date order. If a requested date precedes the
+        latest recorded one, the part's history is rebuilt from all of its
+        dates; dated parts are cached on disk, so only the new dates are
+        downloaded. Every date is downloaded and parsed before the stored
+        history is cleared, so a failed request leaves it as it was.
+
+        Args:
+            title: CFR title number
+            part: Part number within the title
+            dates: Point-in-time dates to capture
+            storage: Regulation storage holding the history
+
+        Returns:
+            Changes found by each newly recorded snapshot, in date order
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status
+            httpx.RequestError: If the request fails
+            ET.ParseError: If a response is not valid XML
+
+        Example:
+            >>> with ECFRConverter() as converter:
+            ...     converter.track_part(7, 273, [date(2024, 1, 1), date(2024, 10, 1)], storage)
+            >>> storage.diff_part(7, 273, date(2024, 1, 1), date(2024, 10, 1)).sections
+        """
+        recorded = storage.part_snapshot_dates(title, part)
+        new_dates = sorted(set(dates) - set(recorded))
+        if not new_dates:
+            return []
+
+        replay = recorded if recorded and new_dates[0] < recorded[-1] else []
+
+        snapshots = []
+        for as_of in sorted(set(replay) | set(new_dates)):
+            url = self.get_title_url(title, as_of=as_of, part=part)
+            root = self._load_part(title, part, as_of)
+            snapshots.append((as_of, list(self._iter_part(root, title, part, url, as_of))))
+
+        if replay:
+            storage.clear_part_history(title, part)
+        changes = []
+        for as_of, regulations in snapshots:
+            snapshot = storage.record_part_snapshot(title, part, regulations, as_of)
+            if as_of in new_dates:
+                changes.append(snapshot)
+        return changes
+
+    def _get_part_cache_path(self, title: int, part: int, as_of: date) -> Path:
+        """Get the cache file path for one part at a date."""
+        return self.data_dir / "parts" / f"title-{title}_part-{part}_{as_of.isoformat()}.xml"
+
+    def _load_part(
+        self,
+        title: int,
+        part: int,
+        as_of: Optional[date] = None,
+    ) -> ET.Element:
+        """Get the parsed XML of a part, downloading it at most once per date.
+
+        Parsed trees are kept in an in-memory LRU keyed by (title, part,
+        date). The raw XML of an explicitly dated version is also cached on
+        disk under data_dir/parts, since a point-in-time version never
+        changes; the current version (as_of None) is cached in memory only.
+
+        Args:
+            title: CFR title number
+            part: Part number within the title
+            as_of: Point-in-time date (defaults to current)
+
+        Returns:
+            Root element of the part XML
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status
+            httpx.RequestError: If the request fails
+            ET.ParseError: If the response is not valid XML
+        """
+        key = (title, part, as_of or date.today())
+        root = self._part_trees.get(key)
+        if root is not None:
+            self._part_trees.move_to_end(key)
+            return root
+
+        cache_path = self._get_part_cache_path(title, part, as_of) if as_of else None
+        from_disk = cache_path is not None and cache_path.exists()
+        if from_disk:
+            xml_content = cache_path.read_text(encoding="utf-8")
+        else:
+            url = self.get_title_url(title, as_of=as_of, part=part)
+            response = self.client.get(url, follow_redirects=True)
+            response.raise_for_status()
+            xml_content = response.text
+
+        root = self._parse_root(xml_content)
+
+        # Only cache XML that parsed, so a truncated download is fetched again
+        if cache_path is not None and not from_disk:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            partial = cache_path.with_name(cache_path.name + ".part")
+            partial.write_text(xml_content, encoding="utf-8")
+            partial.replace(cache_path)
+
+        if self.part_cache_size > 0:
+            self._part_trees[key] = root
+            while len(self._part_trees) > self.part_cache_size:
+                self._part_trees.popitem(last=False)
+        return root
+
+    def _load_part_result(
+        self,
+        title: int,
+        part: int,
+        as_of: Optional[date] = None,
+    ) -> tuple[Optional[ET.Element], Optional[str]]:
+        """Load a part, returning (root, None) or (None, error message)."""
         try:
-            regulations = list(
-                self._parse_part(response.text, title, part, url, as_of)
-            )
-            return FetchResult(
-                success=True,
-                citation=citation,
-                regulations=regulations,
-                source_url=url,
-            )
+            return self._load_part(title, part, as_of), None
+        except httpx.HTTPStatusError as e:
+            return None, f"HTTP error {e.response.status_code}: {e.response.text[:200]}"
+        except httpx.RequestError as e:
+            return None, f"Request error: {str(e)}"
         except ET.ParseError as e:
-            return FetchResult(
-                success=False,
-                citation=citation,
-                error=f"XML parse error: {str(e)}",
-                source_url=url,
-            )
+            return None, f"XML parse error: {str(e)}"
 
     def fetch_title(
         self,
@@ -299,6 +411,10 @@ class ECFRConverter:
     ) -> Iterator[Regulation]:
         """Fetch all sections in a CFR title.
 
+        The title is never held in memory whole: the download is streamed to
+        the cache file (or, with cache=False, parsed straight off the HTTP
+        body) and sections are parsed one DIV8 at a time.
+
         Args:
             title: CFR title number
             as_of: Point-in-time date (defaults to current)
@@ -309,22 +425,25 @@ class ECFRConverter:
         """
         url = self.get_title_url(title, as_of=as_of)
 
-        # Check cache
-        cache_path = self._get_cache_path(title, as_of)
-        if cache and cache_path.exists():
-            xml_content = cache_path.read_text()
-        else:
-            response = self.client.get(url, follow_redirects=True)
-            response.raise_for_status()
-            xml_content = response.text
-
-            # Cache if requested
-            if cache:
-                cache_path.parent.mkdir(parents=True, exist_ok=True)
-                cache_path.write_text(xml_content)
+        if not cache:
+            with self.client.stream("GET", url, follow_redirects=True) as response:
+                response.raise_for_status()
+                body = _ChunkReader(response.iter_bytes())
+                yield from self._iter_title(CFRTitleStream(body), title, url, as_of)
+            return
 
-        # Parse all sections
-        yield from self._parse_title(xml_content, title, url, as_of)
+        cache_path = self._get_cache_path(title, as_of)
+        if not cache_path.exists():
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            partial = cache_path.with_name(cache_path.name + ".part")
+            with self.client.stream("GET", url, follow_redirects=True) as response:
+                response.raise_for_status()
+                with open(partial, "wb") as f:
+                    for chunk in response.iter_bytes():
+                        f.write(chunk)
+            partial.replace(cache_path)
+
+        yield from self._iter_title(CFRTitleStream(cache_path), title, url, as_of)
 
     def _get_cache_path(self, title: int, as_of: Optional[date] = None) -> Path:
         """Get the cache file path for a title."""
@@ -353,13 +472,28 @@ class ECFRConverter:
         Returns:
             Regulation object or None if not found
         """
-        # Wrap content to ensure valid XML with a root
+        return self._find_section(
+            self._parse_root(xml_content), title, part, section, source_url, as_of
+        )
+
+    def _parse_root(self, xml_content: str) -> ET.Element:
+        """Parse XML content, wrapping it in a root element if it has several."""
         try:
-            root = ET.fromstring(xml_content)
+            return ET.fromstring(xml_content)
         except ET.ParseError:
             # Try wrapping in a root element
-            root = ET.fromstring(f"<root>{xml_content}</root>")
+            return ET.fromstring(f"<root>{xml_content}</root>")
 
+    def _find_section(
+        self,
+        root: ET.Element,
+        title: int,
+        part: int,
+        section: str,
+        source_url: str,
+        as_of: Optional[date] = None,
+    ) -> Optional[Regulation]:
+        """Find a section in a parsed part (see _parse_section)."""
         # Find the section by N attribute (e.g., "§ 1.32-1")
         target_patterns = [
             f"§ {part}.{section}",
@@ -398,11 +532,19 @@ class ECFRConverter:
         Yields:
             Regulation objects
         """
-        try:
-            root = ET.fromstring(xml_content)
-        except ET.ParseError:
-            root = ET.fromstring(f"<root>{xml_content}</root>")
+        yield from self._iter_part(
+            self._parse_root(xml_content), title, part, source_url, as_of
+        )
 
+    def _iter_part(
+        self,
+        root: ET.Element,
+        title: int,
+        part: int,
+        source_url: str,
+        as_of: Optional[date] = None,
+    ) -> Iterator[Regulation]:
+        """Yield the sections of a parsed part (see _parse_part)."""
         # Get authority from the part
         authority = self._extract_authority(root)
 
@@ -437,38 +579,37 @@ class ECFRConverter:
         Yields:
             Regulation objects
         """
-        try:
-            root = ET.fromstring(xml_content)
-        except ET.ParseError:
-            root = ET.fromstring(f"<root>{xml_content}</root>")
+        stream = CFRTitleStream(io.BytesIO(xml_content.encode("utf-8")))
+        yield from self._iter_title(stream, title, source_url, as_of)
 
-        # Track current authority by part
-        current_authority = ""
-        current_part = None
-
-        for elem in root.iter():
-            # Update authority when we enter a new part
-            if elem.tag == "DIV5" and elem.get("TYPE") == "PART":
-                auth_elem = elem.find(".//AUTH")
+    def _iter_title(
+        self,
+        stream: CFRTitleStream,
+        title: int,
+        source_url: str,
+        as_of: Optional[date] = None,
+    ) -> Iterator[Regulation]:
+        """Convert the sections of a streamed title, one DIV8 at a time."""
+        current_part, authority = None, ""
+        for elem, part_elem in stream:
+            # Authority comes from the enclosing part
+            if part_elem is not current_part:
+                current_part = part_elem
+                auth_elem = part_elem.find(".//AUTH") if part_elem is not None else None
+                authority = ""
                 if auth_elem is not None:
-                    current_authority = self._clean_text(
+                    authority = self._clean_text(
                         ET.tostring(auth_elem, encoding="unicode", method="text")
                     )
-                # Extract part number
-                part_n = elem.get("N", "")
-                if part_n.isdigit():
-                    current_part = int(part_n)
 
-            # Parse sections
-            if elem.tag == "DIV8" and elem.get("TYPE") == "SECTION":
-                try:
-                    reg = self._element_to_regulation(
-                        elem, title, source_url, as_of, current_authority
-                    )
-                    if reg:
-                        yield reg
-                except Exception:
-                    continue
+            try:
+                reg = self._element_to_regulation(
+                    elem, title, source_url, as_of, authority
+                )
+                if reg:
+                    yield reg
+            except Exception:
+                continue
 
     def _element_to_regulation(
         self,
@@ -518,22 +659,17 @@ class ECFRConverter:
         paragraphs = []
         subsections = []
 
-        for p_elem in elem.findall(".//P"):
+        for p_elem in elem.iter("P"):
             p_text = self._get_element_text(p_elem)
             paragraphs.append(p_text)
 
             # Check for subsection marker
-            subsec_match = re.match(r"^\s*\(([a-zA-Z0-9]+)\)", p_text)
-            if subsec_match:
-                subsec_id = subsec_match.group(1)
-                # Extract heading from italic text
-                heading_match = re.search(r"<I>([^<]+?)\.</I>",
-                    ET.tostring(p_elem, encoding="unicode"))
-                subsec_heading = heading_match.group(1) if heading_match else None
-
+            subsec_id = extract_subsection_id(p_text)
+            if subsec_id:
                 subsections.append(RegulationSubsection(
                     id=subsec_id,
-                    heading=subsec_heading,
+                    # Extract heading from italic text
+                    heading=element_heading(p_elem),
                     text=p_text,
                 ))
 
@@ -591,7 +727,7 @@ class ECFRConverter:
 
     def _clean_text(self, text: str) -> str:
         """Clean text by normalizing whitespace."""
-        return re.sub(r"\s+", " ", text).strip()
+        return " ".join(text.split())
 
     # Convenience methods for priority titles
 
@@ -668,6 +804,28 @@ class ECFRConverter:
         return self.fetch_part(20, part, as_of=as_of)
 
 
+class _ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks (a streamed HTTP body)."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = chunk
+        n = min(len(buffer), len(self._buffer))
+        buffer[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
 # Convenience functions
 
 def fetch_regulation(
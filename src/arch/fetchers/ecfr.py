@@ -114,10 +114,9 @@ class ECFRFetcher:
         Yields:
             Regulation objects for each section
         """
-        content = xml_path.read_text()
-        parser = CFRParser(content)
+        parser = CFRParser(Path(xml_path))
 
-        for reg in parser.iter_sections():
+        for reg in parser.iter_sections(streaming=True):
             if parts is None or reg.citation.part in parts:
                 yield reg
 
@@ -130,8 +129,8 @@ class ECFRFetcher:
         Returns:
             Dict with title_number, title_name, amendment_date
         """
-        content = xml_path.read_text()
-        parser = CFRParser(content)
+        # Reads only the header, which precedes the first section
+        parser = CFRParser(Path(xml_path))
 
         return {
             "title_number": parser.title_number,
@@ -0,0 +1,239 @@
+"""Downloader for US Code release points from uscode.house.gov.
+
+The Office of the Law Revision Counsel publishes each title as a zip of USLM
+XML per release point (e.g. ``xml_usc26@119-59.zip``). The current release
+point is read from the download page, so a refresh picks up new ones without
+code changes.
+
+Downloads stream to disk in chunks and resume from a ``.part`` file with a
+Range request if interrupted. The ETag and Last-Modified of each title are
+kept in a small state file next to the zip, so re-running a download sends
+a conditional request and skips titles the server reports unchanged (304).
+
+Example:
+    >>> fetcher = USCodeFetcher(Path("data/uscode"))
+    >>> result = fetcher.download_title(26)
+    >>> result.path, result.changed
+    (PosixPath('data/uscode/usc26.xml'), True)
+"""
+
+import json
+import re
+import shutil
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from arch.parsers.us.section_index import build_section_index
+from arch.parsers.us.statutes import zip_xml_member
+
+DOWNLOAD_PAGE_URL = "https://uscode.house.gov/download/download.shtml"
+RELEASE_POINT_BASE_URL = "https://uscode.house.gov/download/releasepoints/us/pl"
+
+# Positive titles are numbered 1-54 (53 is reserved and has no download)
+US_CODE_TITLES = list(range(1, 55))
+
+# Copy buffer for extracting zip members
+CHUNK_SIZE = 1024 * 1024
+
+# Release point links on the download page, e.g. xml_usc26@119-59.zip or
+# xml_uscAll@118-200not159.zip
+_RELEASE_POINT_LINK = re.compile(r"xml_usc(?:\d{2}|All)@(\d+-[0-9a-z]+)\.zip")
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of downloading one title."""
+
+    title: int
+    path: Path  # Zip, or extracted XML for download_title
+    release_point: str
+    changed: bool  # False if the server reported the title unchanged
+    bytes_downloaded: int
+
+
+def release_point_url(title: int, release_point: str) -> str:
+    """Zip URL for a title at a release point (e.g. 26, "119-59")."""
+    congress, law = release_point.split("-", 1)
+    return f"{RELEASE_POINT_BASE_URL}/{congress}/{law}/xml_usc{title:02d}@{release_point}.zip"
+
+
+def discover_release_point(client: httpx.Client) -> str:
+    """Find the current release point on the uscode.house.gov download page.
+
+    Raises:
+        ValueError: If the page lists no release point downloads
+    """
+    response = client.get(DOWNLOAD_PAGE_URL)
+    response.raise_for_status()
+    match = _RELEASE_POINT_LINK.search(response.text)
+    if not match:
+        raise ValueError(f"No release point downloads found on {DOWNLOAD_PAGE_URL}")
+    return match.group(1)
+
+
+def extract_xml(zip_path: Path, xml_path: Path) -> Path:
+    """Stream a title zip's XML member to a file without holding it in memory."""
+    partial = xml_path.with_name(xml_path.name + ".part")
+    with (
+        zipfile.ZipFile(zip_path) as zf,
+        zf.open(zip_xml_member(zf)) as src,
+        open(partial, "wb") as dst,
+    ):
+        shutil.copyfileobj(src, dst, CHUNK_SIZE)
+    partial.replace(xml_path)
+    return xml_path
+
+
+class USCodeFetcher:
+    """Streaming, resumable, conditional downloads of US Code titles."""
+
+    def __init__(
+        self,
+        output_dir: Path | str = Path("data/uscode"),
+        release_point: str | None = None,
+        client: httpx.Client | None = None,
+    ):
+        """Initialize the fetcher.
+
+        Args:
+            output_dir: Directory for zips, extracted XML and download state
+            release_point: Release point to download (e.g. "119-59");
+                discovered from the download page if not given
+            client: HTTP client to use (one is created if not given)
+        """
+        self.output_dir = Path(output_dir)
+        self._release_point = release_point
+        self.client = client or httpx.Client(timeout=120.0, follow_redirects=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.client.close()
+
+    @property
+    def release_point(self) -> str:
+        """Release point being downloaded, discovered on first use."""
+        if self._release_point is None:
+            self._release_point = discover_release_point(self.client)
+        return self._release_point
+
+    def zip_path(self, title: int) -> Path:
+        return self.output_dir / f"usc{title}.zip"
+
+    def xml_path(self, title: int) -> Path:
+        return self.output_dir / f"usc{title}.xml"
+
+    def _state_path(self, title: int) -> Path:
+        return self.output_dir / f"usc{title}.zip.json"
+
+    def _load_state(self, title: int) -> dict:
+        try:
+            return json.loads(self._state_path(title).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, title: int, state: dict) -> None:
+        self._state_path(title).write_text(json.dumps(state))
+
+    def download_zip(self, title: int) -> DownloadResult:
+        """Download a title's zip, resuming or skipping it when possible.
+
+        A complete zip from the same URL is revalidated with If-None-Match /
+        If-Modified-Since. A partial download is continued with a Range
+        request guarded by If-Range, so a changed file restarts from zero.
+
+        Args:
+            title: Title number (1-54)
+
+        Returns:
+            DownloadResult for the zip
+
+        Raises:
+            httpx.HTTPStatusError: If the server returns an error status
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        release_point = self.release_point
+        url = release_point_url(title, release_point)
+        zip_path = self.zip_path(title)
+        partial = zip_path.with_name(zip_path.name + ".part")
+        state = self._load_state(title)
+        if state.get("url") != url:
+            state = {}
+        validator = state.get("etag") or state.get("last_modified")
+
+        headers = {}
+        offset = 0
+        if state.get("complete") and zip_path.exists():
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("last_modified"):
+                headers["If-Modified-Since"] = state["last_modified"]
+        elif validator and partial.exists():
+            offset = partial.stat().st_size
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+
+        received = 0
+        with self.client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304:
+                return DownloadResult(title, zip_path, release_point, False, 0)
+            if response.status_code == 416:
+                # The partial file is not a prefix of the current zip; start over
+                partial.unlink()
+                return self.download_zip(title)
+            response.raise_for_status()
+
+            resumed = response.status_code == 206
+            if resumed and not response.headers.get("content-range", "").startswith(
+                f"bytes {offset}-"
+            ):
+                raise ValueError(f"Unexpected Content-Range for {url}")
+
+            state = {
+                "url": url,
+                "release_point": release_point,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "complete": False,
+            }
+            self._save_state(title, state)
+
+            with open(partial, "ab" if resumed else "wb") as f:
+                for chunk in response.iter_bytes():
+                    f.write(chunk)
+                    received += len(chunk)
+
+        partial.replace(zip_path)
+        state["complete"] = True
+        self._save_state(title, state)
+        return DownloadResult(title, zip_path, release_point, True, received)
+
+    def download_title(self, title: int, extract: bool = True) -> DownloadResult:
+        """Download a title and (by default) extract its XML.
+
+        The XML is re-extracted, and its section index rebuilt, only when the
+        zip changed or the XML is missing. With extract=False the zip is kept
+        as is; USLMParser reads the XML straight from it.
+
+        Args:
+            title: Title number (1-54)
+            extract: Extract the XML next to the zip
+
+        Returns:
+            DownloadResult whose path is the XML file (or the zip)
+        """
+        result = self.download_zip(title)
+        if not extract:
+            return result
+
+        xml_path = self.xml_path(title)
+        if result.changed or not xml_path.exists():
+            extract_xml(result.path, xml_path)
+            # Sidecar index for single-section lookups (USLMParser.get_section)
+            build_section_index(xml_path)
+        result.path = xml_path
+        return result
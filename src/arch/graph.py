@@ -0,0 +1,250 @@
+"""In-memory cross-reference graph for transitive citation queries.
+
+The graph is stored in CSR (compressed sparse row) form: nodes are numbered
+0..n-1 and each node's out-edges are the slice
+``targets[offsets[i]:offsets[i + 1]]`` of a flat integer array. A second CSR
+holds the reversed edges, so "what does X depend on" and "what cites X" are
+both simple array walks.
+
+Example:
+    >>> graph = CrossReferenceGraph.from_edges([("26 USC 32", "26 USC 152")])
+    >>> graph.reachable("26 USC 32")
+    {'26 USC 152': 1}
+"""
+
+import heapq
+import json
+import sys
+from array import array
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+
+SNAPSHOT_MAGIC = b"ARCHGRAPH1\n"
+
+
+def _build_csr(n: int, sources: array, targets: array) -> tuple[array, array]:
+    """Counting-sort an edge list into (offsets, targets) CSR arrays."""
+    offsets = array("i", [0]) * (n + 1)
+    for s in sources:
+        offsets[s + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+
+    out = array("i", [0]) * len(targets)
+    cursor = offsets[:-1]
+    for s, t in zip(sources, targets, strict=True):
+        out[cursor[s]] = t
+        cursor[s] += 1
+    return offsets, out
+
+
+class CrossReferenceGraph:
+    """Directed citation graph in CSR form.
+
+    Nodes are citation strings (e.g. "26 USC 32"); an edge A -> B means
+    section A references section B.
+    """
+
+    def __init__(
+        self,
+        nodes: list[str],
+        offsets: array,
+        targets: array,
+        rev_offsets: array,
+        rev_targets: array,
+        fingerprint: str | None = None,
+    ):
+        self.nodes = nodes
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.offsets = offsets
+        self.targets = targets
+        self.rev_offsets = rev_offsets
+        self.rev_targets = rev_targets
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_edges(
+        cls, edges: Iterable[tuple[str, str]], fingerprint: str | None = None
+    ) -> "CrossReferenceGraph":
+        """Build a graph from (from_citation, to_citation) pairs."""
+        index: dict[str, int] = {}
+        sources, targets = array("i"), array("i")
+        for source, target in edges:
+            sources.append(index.setdefault(source, len(index)))
+            targets.append(index.setdefault(target, len(index)))
+
+        n = len(index)
+        offsets, out = _build_csr(n, sources, targets)
+        rev_offsets, rev_out = _build_csr(n, targets, sources)
+        return cls(list(index), offsets, out, rev_offsets, rev_out, fingerprint)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, citation: str) -> bool:
+        return citation in self.index
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges in the graph."""
+        return len(self.targets)
+
+    def _neighbors(self, i: int, reverse: bool = False) -> array:
+        offsets, targets = (
+            (self.rev_offsets, self.rev_targets) if reverse else (self.offsets, self.targets)
+        )
+        return targets[offsets[i] : offsets[i + 1]]
+
+    def references_to(self, citation: str) -> list[str]:
+        """Sections this section cites directly."""
+        i = self.index.get(citation)
+        return [] if i is None else [self.nodes[j] for j in self._neighbors(i)]
+
+    def referenced_by(self, citation: str) -> list[str]:
+        """Sections that cite this section directly."""
+        i = self.index.get(citation)
+        return [] if i is None else [self.nodes[j] for j in self._neighbors(i, reverse=True)]
+
+    def in_degree(self, citation: str) -> int:
+        """Number of sections that cite this section."""
+        i = self.index.get(citation)
+        return 0 if i is None else self.rev_offsets[i + 1] - self.rev_offsets[i]
+
+    def reachable(
+        self,
+        citation: str,
+        max_depth: int | None = None,
+        reverse: bool = False,
+    ) -> dict[str, int]:
+        """Breadth-first closure from a section.
+
+        Args:
+            citation: Starting section
+            max_depth: Maximum number of hops (None for the full closure)
+            reverse: Follow edges backwards ("everything that cites X")
+
+        Returns:
+            Reachable citations mapped to their hop distance, excluding the start
+        """
+        start = self.index.get(citation)
+        if start is None:
+            return {}
+
+        depth = {start: 0}
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            if max_depth is not None and depth[i] >= max_depth:
+                continue
+            for j in self._neighbors(i, reverse):
+                if j not in depth:
+                    depth[j] = depth[i] + 1
+                    queue.append(j)
+
+        del depth[start]
+        return {self.nodes[i]: d for i, d in depth.items()}
+
+    def most_cited(self, limit: int = 20) -> list[tuple[str, int]]:
+        """Sections ranked by in-degree, highest first."""
+        ro = self.rev_offsets
+        top = heapq.nlargest(limit, range(len(self.nodes)), key=lambda i: ro[i + 1] - ro[i])
+        return [(self.nodes[i], ro[i + 1] - ro[i]) for i in top]
+
+    def strongly_connected_components(self, min_size: int = 2) -> list[list[str]]:
+        """Strongly connected components (mutually citing groups of sections).
+
+        Uses an iterative Tarjan's algorithm so deep chains don't hit the
+        recursion limit.
+
+        Args:
+            min_size: Smallest component to return (2 skips singletons)
+
+        Returns:
+            Components as lists of citations, largest first
+        """
+        n = len(self.nodes)
+        index = array("i", [-1]) * n
+        low = array("i", [0]) * n
+        on_stack = bytearray(n)
+        stack: list[int] = []
+        components: list[list[str]] = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            work = [(root, self.offsets[root])]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+
+            while work:
+                v, edge = work[-1]
+                if edge < self.offsets[v + 1]:
+                    work[-1] = (v, edge + 1)
+                    w = self.targets[edge]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = 1
+                        work.append((w, self.offsets[w]))
+                    elif on_stack[w]:
+                        low[v] = min(low[v], index[w])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[v])
+                if low[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component.append(self.nodes[w])
+                        if w == v:
+                            break
+                    if len(component) >= min_size:
+                        components.append(component)
+
+        return sorted(components, key=len, reverse=True)
+
+    def save(self, path: Path | str) -> None:
+        """Write a binary snapshot of the graph."""
+        header = {
+            "fingerprint": self.fingerprint,
+            "byteorder": sys.byteorder,
+            "nodes": self.nodes,
+            "edges": len(self.targets),
+        }
+        with open(path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(json.dumps(header).encode() + b"\n")
+            for arr in (self.offsets, self.targets, self.rev_offsets, self.rev_targets):
+                arr.tofile(f)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "CrossReferenceGraph":
+        """Read a snapshot written by save().
+
+        Raises:
+            ValueError: If the file is not a graph snapshot
+        """
+        with open(path, "rb") as f:
+            if f.readline() != SNAPSHOT_MAGIC:
+                raise ValueError(f"Not a cross-reference graph snapshot: {path}")
+            header = json.loads(f.readline())
+            n, m = len(header["nodes"]), header["edges"]
+
+            arrays = []
+            for size in (n + 1, m, n + 1, m):
+                arr = array("i")
+                arr.fromfile(f, size)
+                if header["byteorder"] != sys.byteorder:
+                    arr.byteswap()
+                arrays.append(arr)
+
+        return cls(header["nodes"], *arrays, fingerprint=header["fingerprint"])
@@ -14,6 +14,7 @@ Usage:
 
 import os
 import re
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Iterator
 from uuid import uuid4, uuid5, NAMESPACE_URL
@@ -24,7 +25,7 @@ from arch.parsers.canada import CanadaStatuteParser
 from arch.parsers.us.statutes import USLMParser
 from arch.parsers.clml import parse_act_metadata, parse_section
 from arch.models_canada import CanadaSection, CanadaSubsection
-from arch.models import Section, Subsection
+from arch.models import Section, Subsection, TitleChanges
 from arch.models_uk import UKSection, UKSubsection
 
 
@@ -33,6 +34,120 @@ def _deterministic_id(citation_path: str) -> str:
     return str(uuid5(NAMESPACE_URL, f"cosilico:{citation_path}"))
 
 
+def _section_paths(changes: TitleChanges, sections: list[str]) -> list[str]:
+    return [f"us/statute/{changes.title}/{section}" for section in sections]
+
+
+def title_change_sources(changes: TitleChanges, retrieved_at: datetime) -> list[dict]:
+    """Source rows for a title sync: the title and every section it touched.
+
+    Rows carry no id; they are upserted on their unique ``path`` so sections
+    already in the archive keep theirs (see record_title_changes).
+
+    Args:
+        changes: Result of Arch.sync_title / StorageBackend.sync_title
+        retrieved_at: When the release point was fetched
+
+    Returns:
+        Rows for the sources table, the title first
+    """
+    title_path = f"us/statute/{changes.title}"
+    names = {title_path: f"Title {changes.title}"}
+    for section in [*changes.added, *changes.changed, *changes.removed]:
+        names[f"{title_path}/{section}"] = f"{changes.title} USC {section}"
+    return [
+        {
+            "path": path,
+            "jurisdiction": "us",
+            "doc_type": "statute",
+            "title": name,
+            "last_crawl_at": retrieved_at.isoformat(),
+        }
+        for path, name in names.items()
+    ]
+
+
+def title_change_versions(
+    changes: TitleChanges,
+    source_ids: dict[str, str],
+    retrieved_at: datetime,
+    published_at: date | None = None,
+) -> list[dict]:
+    """Current version rows for each added or changed section.
+
+    Versions are keyed by content hash, which covers the parsed section
+    rather than a raw file. Nothing is uploaded to R2 here, so versions have
+    no ``r2_key`` or ``mime_type`` until an upload sets them.
+
+    Args:
+        changes: Result of Arch.sync_title / StorageBackend.sync_title
+        source_ids: Source id of each section path
+        retrieved_at: When the release point was fetched
+        published_at: Date the release point took effect
+
+    Returns:
+        Rows for the versions table, without ids (upserted on
+        source_id and content_hash)
+    """
+    sections = [*changes.added, *changes.changed]
+    return [
+        {
+            "source_id": source_ids[path],
+            "content_hash": changes.content_hashes[section],
+            "r2_key": None,
+            "mime_type": None,
+            "published_at": published_at.isoformat() if published_at else None,
+            "retrieved_at": retrieved_at.isoformat(),
+            "is_current": True,
+        }
+        for section, path in zip(sections, _section_paths(changes, sections), strict=True)
+    ]
+
+
+def title_change_crawl_log(
+    changes: TitleChanges,
+    source_ids: dict[str, str],
+    version_ids: dict[str, str],
+    retrieved_at: datetime,
+) -> list[dict]:
+    """Crawl log rows for a title sync.
+
+    The title gets an entry marked ``no_change`` when nothing was written;
+    added and changed sections a ``success`` entry pointing at their new
+    version; removed sections a ``removed`` entry. Ids are deterministic, so
+    recording the same sync twice is idempotent.
+
+    Args:
+        changes: Result of Arch.sync_title / StorageBackend.sync_title
+        source_ids: Source id of the title and each section path
+        version_ids: New version id of each added or changed section path
+        retrieved_at: When the release point was fetched
+
+    Returns:
+        Rows for the crawl_log table, the title first
+    """
+    retrieved = retrieved_at.isoformat()
+    title_path = f"us/statute/{changes.title}"
+    entries = [(title_path, "success" if changes.written else "no_change")]
+    entries += [
+        (path, "success") for path in _section_paths(changes, [*changes.added, *changes.changed])
+    ]
+    entries += [(path, "removed") for path in _section_paths(changes, changes.removed)]
+    rows = []
+    for path, status in entries:
+        row = {
+            "id": _deterministic_id(f"crawl:{path}@{retrieved}"),
+            "source_id": source_ids[path],
+            "started_at": retrieved,
+            "completed_at": retrieved,
+            "status": status,
+        }
+        if path in version_ids:
+            row["new_version_id"] = version_ids[path]
+        rows.append(row)
+    return rows
+
+
 class SupabaseIngestor:
     """Ingest parsed statutes into Supabase rules table."""
 
@@ -138,6 +253,88 @@ class SupabaseIngestor:
         """Insert rules (deprecated, use _upsert_rules)."""
         return self._upsert_rules(rules, max_retries)
 
+    def _rest_headers(self) -> dict[str, str]:
+        """Headers for writes to the public-schema document archive tables."""
+        return {
+            "apikey": self.key,
+            "Authorization": f"Bearer {self.key}",
+            "Content-Type": "application/json",
+            "Prefer": "resolution=merge-duplicates,return=minimal",
+        }
+
+    def record_title_changes(
+        self,
+        changes: TitleChanges,
+        retrieved_at: datetime | None = None,
+        published_at: date | None = None,
+    ) -> dict[str, int]:
+        """Record an incremental title sync in the document archive tables.
+
+        Sources are upserted on their path and versions on (source_id,
+        content_hash), and the ids the database holds are read back, so rows
+        created by other crawlers are reused rather than duplicated. Previous
+        versions of changed and removed sections stop being current, then the
+        new versions and the crawl log are written.
+
+        Args:
+            changes: Result of Arch.sync_title
+            retrieved_at: When the release point was fetched (default: now)
+            published_at: Date the release point took effect
+
+        Returns:
+            Number of rows written per table
+        """
+        retrieved = retrieved_at or datetime.now(timezone.utc)
+        # Upserts return the stored rows, so existing ids are used downstream
+        headers = {
+            **self._rest_headers(),
+            "Prefer": "resolution=merge-duplicates,return=representation",
+        }
+
+        with httpx.Client(timeout=httpx.Timeout(60.0, connect=30.0)) as client:
+
+            def upsert(table: str, rows: list[dict], on_conflict: str) -> list[dict]:
+                if not rows:
+                    return []
+                response = client.post(
+                    f"{self.rest_url}/{table}",
+                    params={"on_conflict": on_conflict, "select": f"id,{on_conflict}"},
+                    headers=headers,
+                    json=rows,
+                )
+                response.raise_for_status()
+                return response.json()
+
+            sources = title_change_sources(changes, retrieved)
+            source_ids = {row["path"]: row["id"] for row in upsert("sources", sources, "path")}
+
+            superseded = [
+                source_ids[path]
+                for path in _section_paths(changes, [*changes.changed, *changes.removed])
+            ]
+            if superseded:
+                response = client.patch(
+                    f"{self.rest_url}/versions",
+                    params={"source_id": f"in.({','.join(superseded)})", "is_current": "is.true"},
+                    headers=self._rest_headers(),
+                    json={"is_current": False},
+                )
+                response.raise_for_status()
+
+            versions = title_change_versions(changes, source_ids, retrieved, published_at)
+            path_of = {source_id: path for path, source_id in source_ids.items()}
+            version_ids = {
+                path_of[row["source_id"]]: row["id"]
+                for row in upsert("versions", versions, "source_id,content_hash")
+            }
+
+            crawl_log = title_change_crawl_log(changes, source_ids, version_ids, retrieved)
+            response = client.post(
+                f"{self.rest_url}/crawl_log", headers=self._rest_headers(), json=crawl_log
+            )
+            response.raise_for_status()
+        return {"sources": len(sources), "versions": len(versions), "crawl_log": len(crawl_log)}
+
     def _section_to_rules(
         self,
         section: CanadaSection,
@@ -1,5 +1,7 @@
 """Data models for statute representation."""
 
+import hashlib
+import json
 from datetime import date
 
 from pydantic import BaseModel, Field
@@ -103,6 +105,32 @@ class Section(BaseModel):
 
     model_config = {"extra": "forbid"}
 
+    def content_hash(self) -> str:
+        """Hash of the section's normalized legal content.
+
+        Covers the heading, text and subsection tree with whitespace
+        collapsed, so retrieval metadata and formatting noise do not count
+        as changes.
+        """
+
+        def normalize(value: str | None) -> str:
+            return " ".join((value or "").split())
+
+        def subsection(sub: Subsection) -> list:
+            return [
+                sub.identifier,
+                normalize(sub.heading),
+                normalize(sub.text),
+                [subsection(c) for c in sub.children],
+            ]
+
+        payload = [
+            normalize(self.section_title),
+            normalize(self.text),
+            [subsection(s) for s in self.subsections],
+        ]
+        return hashlib.sha256(json.dumps(payload).encode()).hexdigest()
+
 
 class SearchResult(BaseModel):
     """A search result with relevance scoring."""
@@ -115,6 +143,26 @@ class SearchResult(BaseModel):
     model_config = {"extra": "forbid"}
 
 
+class SearchPage(BaseModel):
+    """One page of search results with a cursor for the next page."""
+
+    results: list[SearchResult]
+    next_cursor: str | None = Field(None, description="Opaque cursor for the next page")
+    total: int | None = Field(None, description="Total matching sections, if requested")
+
+    model_config = {"extra": "forbid"}
+
+
+class Suggestion(BaseModel):
+    """A typeahead suggestion for a partially typed citation or heading."""
+
+    citation: str = Field(..., description="Citation string (e.g., '26 USC 32')")
+    heading: str = Field(..., description="Section heading")
+    cited_by: int = Field(0, description="Number of sections citing this one")
+
+    model_config = {"extra": "forbid"}
+
+
 class TitleInfo(BaseModel):
     """Metadata about a US Code title."""
 
@@ -127,3 +175,47 @@ class TitleInfo(BaseModel):
     )
 
     model_config = {"extra": "forbid"}
+
+
+class TitleIngest(BaseModel):
+    """Outcome of ingesting one US Code title."""
+
+    xml_path: str
+    title: int
+    title_name: str
+    sections: int
+    seconds: float = Field(..., description="Wall time from start of parse to last section")
+
+    model_config = {"extra": "forbid"}
+
+
+class TitleChanges(BaseModel):
+    """Sections added, changed and removed by an incremental title re-ingest."""
+
+    title: int
+    added: list[str] = Field(default_factory=list, description="Section numbers new to the title")
+    changed: list[str] = Field(
+        default_factory=list, description="Section numbers whose content hash changed"
+    )
+    removed: list[str] = Field(
+        default_factory=list, description="Section numbers no longer in the title"
+    )
+    unchanged: int = Field(0, description="Number of sections left as stored")
+    content_hashes: dict[str, str] = Field(
+        default_factory=dict, description="Content hash of each added or changed section"
+    )
+    valid_from: date | None = Field(None, description="Date the new text took effect")
+
+    model_config = {"extra": "forbid"}
+
+    @property
+    def written(self) -> int:
+        """Number of sections inserted, rewritten or deleted."""
+        return len(self.added) + len(self.changed) + len(self.removed)
+
+    def summary(self) -> str:
+        """One-line change summary (e.g. "Title 26: 3 added, 12 changed, ...")."""
+        return (
+            f"Title {self.title}: {len(self.added)} added, {len(self.changed)} changed, "
+            f"{len(self.removed)} removed, {self.unchanged} unchanged"
+        )
@@ -1,5 +1,7 @@
 """Data models for federal regulations (Code of Federal Regulations)."""
 
+import hashlib
+import json
 import re
 from datetime import date
 from typing import Optional
@@ -181,6 +183,65 @@ class Regulation(BaseModel):
         """Return the standard CFR citation format."""
         return self.citation.cfr_cite
 
+    def content_hash(self) -> str:
+        """Hash of the regulation's normalized text.
+
+        Covers the heading, full text and subsection tree with whitespace
+        collapsed, so retrieval metadata and formatting noise do not count
+        as changes.
+        """
+
+        def normalize(value: Optional[str]) -> str:
+            return " ".join((value or "").split())
+
+        def subsection(sub: RegulationSubsection) -> list:
+            return [
+                sub.id,
+                normalize(sub.heading),
+                normalize(sub.text),
+                [subsection(c) for c in sub.children],
+            ]
+
+        payload = [
+            normalize(self.heading),
+            normalize(self.full_text),
+            [subsection(s) for s in self.subsections],
+        ]
+        return hashlib.sha256(json.dumps(payload).encode()).hexdigest()
+
+
+class PartChanges(BaseModel):
+    """Sections of a CFR part that differ between two dates."""
+
+    title: int = Field(..., description="CFR title number")
+    part: int = Field(..., description="Part number within the title")
+    start: Optional[date] = Field(None, description="Earlier date (None before any snapshot)")
+    end: date = Field(..., description="Later date")
+    added: list[str] = Field(default_factory=list, description="Sections new at the later date")
+    changed: list[str] = Field(
+        default_factory=list, description="Sections whose content hash changed"
+    )
+    removed: list[str] = Field(
+        default_factory=list, description="Sections no longer present at the later date"
+    )
+    unchanged: int = Field(0, description="Number of sections identical at both dates")
+
+    model_config = {"extra": "forbid"}
+
+    @property
+    def sections(self) -> list[str]:
+        """Every added, changed or removed section, sorted."""
+        return sorted(self.added + self.changed + self.removed)
+
+    def summary(self) -> str:
+        """One-line change summary (e.g. "7 CFR 273, 2024-01-01 to 2024-10-01: ...")."""
+        span = f"{self.start} to {self.end}" if self.start else f"through {self.end}"
+        return (
+            f"{self.title} CFR {self.part}, {span}: {len(self.added)} added, "
+            f"{len(self.changed)} changed, {len(self.removed)} removed, "
+            f"{self.unchanged} unchanged"
+        )
+
 
 class RegulationSearchResult(BaseModel):
     """A search result for regulations."""
@@ -192,3 +253,15 @@ class RegulationSearchResult(BaseModel):
     effective_date: date = Field(..., description="Current effective date")
 
     model_config = {"extra": "forbid"}
+
+
+class CombinedSearchResult(BaseModel):
+    """A search hit from either the US Code or the CFR."""
+
+    doc_type: str = Field(..., description="'statute' or 'regulation'")
+    citation: str = Field(..., description="Citation string (e.g., '26 USC 32', '26 CFR 1.32-1')")
+    heading: str = Field(..., description="Section heading")
+    snippet: str = Field(..., description="Relevant text snippet with highlights")
+    score: float = Field(..., description="Relevance score (0-1)")
+
+    model_config = {"extra": "forbid"}
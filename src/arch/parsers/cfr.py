@@ -9,12 +9,19 @@ The eCFR XML uses a hierarchical DIV structure:
 - DIV7 TYPE="SUBJGRP": Subject groups
 - DIV8 TYPE="SECTION": Individual regulation sections
 
+Whole titles run to hundreds of MB (Titles 7 and 26), so CFRParser can also
+stream a title from a file or an HTTP body with iterparse (CFRTitleStream),
+holding one section at a time instead of the whole document.
+
 Source: https://github.com/usgpo/bulk-data/blob/main/ECFR-XML-User-Guide.md
 """
 
+import io
 import re
 from datetime import date
-from typing import Iterator, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Union
 from xml.etree import ElementTree as ET
 
 from arch.models_regulation import (
@@ -23,6 +30,27 @@ from arch.models_regulation import (
     RegulationSubsection,
 )
 
+# Patterns applied to every paragraph and section, compiled once
+_SUBSECTION_ID = re.compile(r"^\s*\(([a-zA-Z0-9]+)\)")
+_ITALIC_HEADING = re.compile(r"<I>([^<]+?)\.</I>")
+_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+_SECTION_NUMBER = re.compile(r"§?\s*(\d+)\.(\d+(?:-\d+)?)")
+_HEADING_PREFIX = re.compile(r"^§\s*[\d.-]+\s*")
+_CITA_TYPE = re.compile(r"^\[?TYPE=[^]]*\]?\s*")
+_CITA_DATE = re.compile(r"(\w+\.?\s+\d+,\s+\d{4})")
+
+# Characters escaped when text is serialized as HTML
+_HTML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def _escape_html(text: str) -> str:
+    """Escape text as ElementTree's HTML serializer does."""
+    # Most paragraphs need no escaping, and the checks are cheaper than translate
+    if "&" in text or "<" in text or ">" in text:
+        return text.translate(_HTML_ESCAPES)
+    return text
+
 
 def extract_subsection_id(text: str) -> Optional[str]:
     """Extract subsection ID from paragraph text.
@@ -33,7 +61,7 @@ def extract_subsection_id(text: str) -> Optional[str]:
     Returns:
         Subsection ID like "a", "1", "i" or None
     """
-    match = re.match(r"^\s*\(([a-zA-Z0-9]+)\)", text)
+    match = _SUBSECTION_ID.match(text)
     if match:
         return match.group(1)
     return None
@@ -49,7 +77,7 @@ def extract_heading(text: str) -> Optional[str]:
         Heading text without trailing period, or None
     """
     # Look for <I>heading.</I> pattern in the text
-    match = re.search(r"<I>([^<]+?)\.</I>", text)
+    match = _ITALIC_HEADING.search(text)
     if match:
         return match.group(1).strip()
     return None
@@ -58,12 +86,64 @@ def extract_heading(text: str) -> Optional[str]:
 def clean_text(text: str) -> str:
     """Clean text by removing XML tags and extra whitespace."""
     # Remove XML tags
-    text = re.sub(r"<[^>]+>", "", text)
+    text = _TAG.sub("", text)
     # Normalize whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE.sub(" ", text)
     return text.strip()
 
 
+def element_text(elem: ET.Element) -> str:
+    """Whitespace-normalized text of an element, read straight from the tree.
+
+    Gives the same result as ``clean_text`` of the element's HTML
+    serialization without building the string: the text of the element and
+    its descendants plus its tail, with ``&``, ``<`` and ``>`` escaped as
+    the serializer writes them.
+
+    Args:
+        elem: Element such as a P, CITA or AUTH
+
+    Returns:
+        Text with runs of whitespace collapsed to single spaces
+    """
+    text = "".join(elem.itertext())
+    if elem.tail:
+        text += elem.tail
+    return " ".join(_escape_html(text).split())
+
+
+def element_heading(elem: ET.Element) -> Optional[str]:
+    """Heading from the first italic run ending in a period, found structurally.
+
+    Matches what ``extract_heading`` finds in the element's serialized
+    markup: an ``I`` element with no attributes or children whose text ends
+    with a period.
+
+    Args:
+        elem: Paragraph element
+
+    Returns:
+        Heading text without trailing period (escaped as in ``element_text``)
+        or None
+    """
+    for italic in elem.iter("I"):
+        text = italic.text
+        if text and len(text) > 1 and text[-1] == "." and not italic.attrib and not len(italic):
+            return _escape_html(text[:-1])
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_source_date(text: str) -> Optional[date]:
+    """Parse a date like "Mar. 15, 2021" from a source citation (memoized)."""
+    try:
+        from dateutil.parser import parse as parse_date
+
+        return parse_date(text).date()
+    except (ImportError, ValueError):
+        return None
+
+
 def parse_section(xml_str: str) -> Regulation:
     """Parse a CFR section from XML string.
 
@@ -112,7 +192,7 @@ def _parse_section_element(section_elem: ET.Element, authority: str = "") -> Reg
                 pass
 
     # Parse section number from N attribute
-    section_match = re.search(r"§?\s*(\d+)\.(\d+(?:-\d+)?)", section_n)
+    section_match = _SECTION_NUMBER.search(section_n)
     if section_match:
         part = int(section_match.group(1))
         section = section_match.group(2)
@@ -121,7 +201,7 @@ def _parse_section_element(section_elem: ET.Element, authority: str = "") -> Reg
     head_elem = section_elem.find("HEAD")
     full_heading = head_elem.text if head_elem is not None and head_elem.text else ""
     # Remove section number prefix from heading
-    heading = re.sub(r"^§\s*[\d.-]+\s*", "", full_heading).strip()
+    heading = _HEADING_PREFIX.sub("", full_heading).strip()
     # Remove trailing period from heading
     heading = heading.rstrip(".")
 
@@ -129,16 +209,17 @@ def _parse_section_element(section_elem: ET.Element, authority: str = "") -> Reg
     paragraphs = []
     subsections = []
 
-    for p_elem in section_elem.findall(".//P"):
+    for p_elem in section_elem.iter("P"):
         # Get full text including nested elements
-        p_text = ET.tostring(p_elem, encoding="unicode", method="html")
-        p_clean = clean_text(p_text)
+        p_clean = element_text(p_elem)
         paragraphs.append(p_clean)
 
         # Check for subsection
         subsec_id = extract_subsection_id(p_clean)
         if subsec_id:
-            subsec_heading = extract_heading(p_text)
+            subsec_heading = element_heading(p_elem)
+            if subsec_heading is not None:
+                subsec_heading = subsec_heading.strip()
             subsections.append(RegulationSubsection(
                 id=subsec_id,
                 heading=subsec_heading,
@@ -151,20 +232,16 @@ def _parse_section_element(section_elem: ET.Element, authority: str = "") -> Reg
     cita_elem = section_elem.find(".//CITA")
     source = ""
     if cita_elem is not None:
-        source = clean_text(ET.tostring(cita_elem, encoding="unicode", method="html"))
+        source = element_text(cita_elem)
         # Remove the CITA type annotation
-        source = re.sub(r"^\[?TYPE=[^]]*\]?\s*", "", source)
+        source = _CITA_TYPE.sub("", source)
         source = source.strip("[] \n")
 
     # Parse effective date from source if available
     effective_date = date.today()
-    date_match = re.search(r"(\w+\.?\s+\d+,\s+\d{4})", source)
+    date_match = _CITA_DATE.search(source)
     if date_match:
-        try:
-            from dateutil.parser import parse as parse_date
-            effective_date = parse_date(date_match.group(1)).date()
-        except (ImportError, ValueError):
-            pass
+        effective_date = _parse_source_date(date_match.group(1)) or effective_date
 
     return Regulation(
         citation=CFRCitation(title=title, part=part, section=section),
@@ -197,7 +274,7 @@ def parse_part(xml_str: str) -> dict:
     auth_elem = part_elem.find(".//AUTH")
     authority = ""
     if auth_elem is not None:
-        authority = clean_text(ET.tostring(auth_elem, encoding="unicode", method="html"))
+        authority = element_text(auth_elem)
 
     # Parse all sections
     sections = []
@@ -214,55 +291,160 @@ def parse_part(xml_str: str) -> dict:
     }
 
 
+def _parse_title_number(text: Optional[str]) -> int:
+    """Title number from an IDNO element's text (0 if missing or invalid)."""
+    try:
+        return int(text.strip())
+    except (AttributeError, ValueError):
+        return 0
+
+
+def _parse_title_name(text: Optional[str]) -> str:
+    """Title name from TITLESTMT/TITLE ("Title 26: Internal Revenue" -> "Internal Revenue")."""
+    title_text = (text or "").strip()
+    match = re.match(r"Title\s+\d+:\s*(.+)", title_text)
+    return match.group(1) if match else title_text
+
+
+def _parse_amendment_date(text: Optional[str]) -> Optional[date]:
+    """Amendment date from an AMDDATE element's text, if it parses."""
+    if not text:
+        return None
+    try:
+        from dateutil.parser import parse as parse_date
+
+        return parse_date(text.strip()).date()
+    except (ImportError, ValueError):
+        return None
+
+
+class CFRTitleStream:
+    """A single streaming pass over a CFR title XML document.
+
+    Iterating yields (section, part) for each DIV8 section, where part is
+    the enclosing DIV5 part element (None outside a part). A part keeps its
+    own HEAD and AUTH children, but each section is detached as soon as the
+    consumer moves on and each part once it ends, so memory is bounded by
+    the largest section rather than the title.
+
+    Header metadata is recorded as it streams past (it precedes the first
+    section) in title_number, title_name and amendment_date.
+
+    Example:
+        >>> stream = CFRTitleStream(Path("title-26.xml"))
+        >>> for section, part in stream:
+        ...     print(stream.title_number, section.get("N"))
+    """
+
+    def __init__(self, source: Union[Path, BinaryIO]):
+        """Initialize the stream.
+
+        Args:
+            source: Path to the XML file, or a binary file object such as a
+                streamed HTTP body
+        """
+        self.source = source
+        self.title_number = 0
+        self.title_name = ""
+        self.amendment_date: Optional[date] = None
+
+    def __iter__(self) -> Iterator[tuple[ET.Element, Optional[ET.Element]]]:
+        stack: list[ET.Element] = []  # Open elements, innermost last
+        parts: list[ET.Element] = []
+        for event, elem in ET.iterparse(self.source, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                if elem.tag == "DIV5" and elem.get("TYPE") == "PART":
+                    parts.append(elem)
+                continue
+
+            stack.pop()
+            if elem.tag == "DIV8" and elem.get("TYPE") == "SECTION":
+                yield elem, (parts[-1] if parts else None)
+            elif elem.tag == "DIV5" and elem.get("TYPE") == "PART":
+                parts.pop()
+            else:
+                # Header fields; the first occurrence wins, as with find()
+                if elem.tag == "IDNO" and elem.get("TYPE") == "title":
+                    self.title_number = self.title_number or _parse_title_number(elem.text)
+                elif elem.tag == "TITLE" and stack and stack[-1].tag == "TITLESTMT":
+                    self.title_name = self.title_name or _parse_title_name(elem.text)
+                elif elem.tag == "AMDDATE" and self.amendment_date is None:
+                    self.amendment_date = _parse_amendment_date(elem.text)
+                continue
+
+            # Detach the finished section or part so it can be freed
+            if stack:
+                stack[-1].remove(elem)
+            else:
+                elem.clear()
+
+
 class CFRParser:
     """Parser for complete CFR title XML files.
 
     Handles the full document structure from govinfo.gov bulk downloads.
+    Given XML content the document is parsed up front; given a path or a
+    file object it is streamed (see iter_sections).
     """
 
-    def __init__(self, xml_content: str):
-        """Initialize parser with XML content.
+    def __init__(self, source: Union[str, Path, BinaryIO]):
+        """Initialize parser with XML content or a file to stream.
 
         Args:
-            xml_content: Full XML content of a CFR title
+            source: Full XML content of a CFR title, or a path or binary
+                file object (e.g. a streamed HTTP body) to parse
+                incrementally. A file object can be read once, so its
+                header metadata is only set by iter_sections(streaming=True).
+        """
+        self.source = source
+        self._root: Optional[ET.Element] = None
+        self.title_number = 0
+        self.title_name = ""
+        self.amendment_date: Optional[date] = None
+
+        if isinstance(source, str):
+            self._root = ET.fromstring(source)
+            self._parse_header()
+        elif isinstance(source, Path):
+            # The header precedes the first section, so stop streaming there
+            stream = CFRTitleStream(source)
+            sections = iter(stream)
+            next(sections, None)
+            sections.close()
+            self._copy_header(stream)
+
+    @property
+    def root(self) -> ET.Element:
+        """Root of the parsed document (a path source is parsed on first use).
+
+        Raises:
+            ValueError: If the source is a file object, which can only be streamed
         """
-        self.root = ET.fromstring(xml_content)
-        self._parse_header()
+        if self._root is None:
+            if not isinstance(self.source, Path):
+                raise ValueError("A file object source can only be read with streaming=True")
+            self._root = ET.parse(self.source).getroot()
+        return self._root
 
     def _parse_header(self):
         """Parse title metadata from header."""
-        # Extract title number
         idno_elem = self.root.find(".//IDNO[@TYPE='title']")
-        if idno_elem is not None and idno_elem.text:
-            try:
-                self.title_number = int(idno_elem.text.strip())
-            except ValueError:
-                self.title_number = 0
-        else:
-            self.title_number = 0
+        self.title_number = _parse_title_number(idno_elem.text if idno_elem is not None else None)
 
-        # Extract title name
         title_elem = self.root.find(".//TITLESTMT/TITLE")
-        if title_elem is not None and title_elem.text:
-            # Parse "Title 26: Internal Revenue" -> "Internal Revenue"
-            title_text = title_elem.text.strip()
-            match = re.match(r"Title\s+\d+:\s*(.+)", title_text)
-            if match:
-                self.title_name = match.group(1)
-            else:
-                self.title_name = title_text
-        else:
-            self.title_name = ""
+        self.title_name = _parse_title_name(title_elem.text if title_elem is not None else None)
 
-        # Extract amendment date
         amddate_elem = self.root.find(".//AMDDATE")
-        self.amendment_date = None
-        if amddate_elem is not None and amddate_elem.text:
-            try:
-                from dateutil.parser import parse as parse_date
-                self.amendment_date = parse_date(amddate_elem.text.strip()).date()
-            except (ImportError, ValueError):
-                pass
+        self.amendment_date = _parse_amendment_date(
+            amddate_elem.text if amddate_elem is not None else None
+        )
+
+    def _copy_header(self, stream: CFRTitleStream) -> None:
+        """Take title metadata found so far by a stream."""
+        self.title_number = stream.title_number
+        self.title_name = stream.title_name
+        self.amendment_date = stream.amendment_date
 
     def iter_parts(self) -> Iterator[dict]:
         """Iterate over all parts in the title.
@@ -278,7 +460,7 @@ class CFRParser:
             auth_elem = part_elem.find(".//AUTH")
             authority = ""
             if auth_elem is not None:
-                authority = clean_text(ET.tostring(auth_elem, encoding="unicode", method="html"))
+                authority = element_text(auth_elem)
 
             yield {
                 "part_number": part_n,
@@ -286,12 +468,20 @@ class CFRParser:
                 "element": part_elem,
             }
 
-    def iter_sections(self) -> Iterator[Regulation]:
+    def iter_sections(self, streaming: bool = False) -> Iterator[Regulation]:
         """Iterate over all sections in the title.
 
+        Args:
+            streaming: Parse incrementally with CFRTitleStream instead of
+                walking the whole document tree; required for file objects
+
         Yields:
             Regulation objects for each section
         """
+        if streaming:
+            yield from self._iter_streamed_sections()
+            return
+
         for part_info in self.iter_parts():
             authority = part_info["authority"]
             part_elem = part_info["element"]
@@ -310,6 +500,36 @@ class CFRParser:
                 except Exception:
                     continue
 
+    def _iter_streamed_sections(self) -> Iterator[Regulation]:
+        """Stream sections, parsing each DIV8 as it completes."""
+        source = self.source
+        if isinstance(source, str):
+            source = io.BytesIO(source.encode("utf-8"))
+        stream = CFRTitleStream(source)
+
+        current_part, authority = None, ""
+        for section_elem, part_elem in stream:
+            self._copy_header(stream)
+            if part_elem is None:
+                continue  # As in tree mode, only sections within parts
+            if part_elem is not current_part:
+                current_part = part_elem
+                auth_elem = part_elem.find(".//AUTH")
+                authority = ""
+                if auth_elem is not None:
+                    authority = element_text(auth_elem)
+            try:
+                section = _parse_section_element(section_elem, authority)
+                section.citation = CFRCitation(
+                    title=self.title_number,
+                    part=section.citation.part,
+                    section=section.citation.section,
+                    subsection=section.citation.subsection,
+                )
+                yield section
+            except Exception:
+                continue
+
     def get_section(self, part: int, section: str) -> Optional[Regulation]:
         """Get a specific section by part and section number.
 
@@ -320,7 +540,7 @@ class CFRParser:
         Returns:
             Regulation if found, None otherwise
         """
-        for reg in self.iter_sections():
+        for reg in self.iter_sections(streaming=self._root is None):
             if reg.citation.part == part and reg.citation.section == section:
                 return reg
         return None
@@ -0,0 +1,185 @@
+"""Sidecar byte-offset index for random access to sections of USLM XML files.
+
+Building the index scans the raw bytes of a title once and records where
+each section element starts and ends. The index is saved next to the XML
+(``usc26.xml.idx``), so a later lookup can seek to a section and parse just
+that fragment instead of the whole title.
+
+The scan matches section start and end tags textually (skipping comments
+and CDATA) and tracks nesting, so sections quoted inside notes get their own
+entries. When an identifier occurs more than once, the first occurrence in
+document order is kept, as a tree walk would find it.
+
+Example:
+    >>> index = SectionIndex.build("data/uscode/usc26.xml")
+    >>> index.save(index_path("data/uscode/usc26.xml"))
+    >>> elem = index.read_section("data/uscode/usc26.xml", "/us/usc/t26/s32")
+"""
+
+import json
+import mmap
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from lxml import etree
+
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+
+# Section start/end tags (any namespace prefix); comments and CDATA are
+# matched too so tags inside them are skipped
+_SECTION_TAG = re.compile(
+    rb"<!--.*?-->|<!\[CDATA\[.*?\]\]>|<(/?)(?:[\w.-]+:)?section(?=[\s/>])([^>]*)>", re.DOTALL
+)
+_IDENTIFIER = re.compile(rb"""\sidentifier\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_ROOT_TAG = re.compile(rb"<(?![?!])[^>]*>")
+_NAMESPACE_DECL = re.compile(rb"""\sxmlns(?::[\w.-]+)?\s*=\s*(?:"[^"]*"|'[^']*')""")
+
+
+def index_path(xml_path: Path | str) -> Path:
+    """Sidecar index path for an XML file (``usc26.xml`` -> ``usc26.xml.idx``)."""
+    xml_path = Path(xml_path)
+    return xml_path.with_name(xml_path.name + INDEX_SUFFIX)
+
+
+@dataclass
+class SectionIndex:
+    """Byte ranges of the section elements in one USLM XML file."""
+
+    size: int  # Source file size and mtime, to detect a replaced file
+    mtime_ns: int
+    namespaces: str  # Root element xmlns declarations, for parsing fragments
+    sections: dict[str, tuple[int, int]] = field(default_factory=dict)  # id -> (start, end)
+
+    @classmethod
+    def build(cls, xml_path: Path | str) -> "SectionIndex":
+        """Scan an XML file and record the byte range of every section.
+
+        Args:
+            xml_path: USLM XML file
+
+        Returns:
+            SectionIndex for the file as it is now
+        """
+        xml_path = Path(xml_path)
+        stat = xml_path.stat()
+        sections: dict[str, tuple[int, int]] = {}
+        namespaces = ""
+
+        with open(xml_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            root = _ROOT_TAG.search(data)
+            if root:
+                namespaces = b"".join(_NAMESPACE_DECL.findall(root.group())).decode()
+
+            open_sections: list[tuple[int, str | None]] = []  # (start, identifier)
+            for match in _SECTION_TAG.finditer(data):
+                closing, attrs = match.group(1), match.group(2)
+                if attrs is None:
+                    continue  # Comment or CDATA
+                if closing:
+                    if open_sections:
+                        start, identifier = open_sections.pop()
+                        if identifier is not None:
+                            sections[identifier] = (start, match.end())
+                    continue
+
+                identifier = None
+                found = _IDENTIFIER.search(attrs)
+                if found:
+                    value = (found.group(1) or found.group(2) or b"").decode()
+                    # Reserve the entry so an earlier-starting duplicate wins
+                    if value and value not in sections:
+                        sections[value] = (match.start(), -1)
+                        identifier = value
+                if attrs.endswith(b"/"):
+                    if identifier is not None:
+                        sections[identifier] = (match.start(), match.end())
+                else:
+                    open_sections.append((match.start(), identifier))
+
+        return cls(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            namespaces=namespaces,
+            sections={k: v for k, v in sections.items() if v[1] >= 0},
+        )
+
+    def save(self, path: Path | str) -> None:
+        """Write the index as compact JSON."""
+        data = {
+            "version": INDEX_VERSION,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "namespaces": self.namespaces,
+            # [identifier, start, length] in file order
+            "sections": [
+                [identifier, start, end - start]
+                for identifier, (start, end) in sorted(self.sections.items(), key=lambda i: i[1])
+            ],
+        }
+        Path(path).write_text(json.dumps(data, separators=(",", ":")))
+
+    @classmethod
+    def load(cls, path: Path | str) -> "SectionIndex | None":
+        """Read a saved index; None if it is missing, unreadable or another version."""
+        try:
+            data = json.loads(Path(path).read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        return cls(
+            size=data["size"],
+            mtime_ns=data["mtime_ns"],
+            namespaces=data["namespaces"],
+            sections={
+                identifier: (start, start + length)
+                for identifier, start, length in data["sections"]
+            },
+        )
+
+    def is_current(self, xml_path: Path | str) -> bool:
+        """Whether the index still describes the file (same size and mtime)."""
+        try:
+            stat = Path(xml_path).stat()
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+    def read_section(self, xml_path: Path | str, identifier: str) -> etree._Element | None:
+        """Parse one section element from the file by seeking to its byte range.
+
+        Args:
+            xml_path: The indexed XML file
+            identifier: USLM identifier (e.g. "/us/usc/t26/s32")
+
+        Returns:
+            The section element, or None if the index has no such section
+        """
+        span = self.sections.get(identifier)
+        if span is None:
+            return None
+        start, end = span
+        with open(xml_path, "rb") as f:
+            f.seek(start)
+            fragment = f.read(end - start)
+        # Wrap the fragment so prefixes declared on the root still resolve
+        wrapper = etree.fromstring(
+            b"<fragment" + self.namespaces.encode() + b">" + fragment + b"</fragment>"
+        )
+        return wrapper[0]
+
+
+def build_section_index(xml_path: Path | str) -> Path:
+    """Build and save the sidecar index for a USLM XML file.
+
+    Args:
+        xml_path: USLM XML file
+
+    Returns:
+        Path to the written index
+    """
+    path = index_path(xml_path)
+    SectionIndex.build(xml_path).save(path)
+    return path
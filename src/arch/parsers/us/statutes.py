@@ -6,18 +6,129 @@ the Law Revision Counsel at uscode.house.gov.
 Schema documentation: https://uscode.house.gov/download/resources/USLM-User-Guide.pdf
 """
 
+import zipfile
 from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from datetime import date
 from pathlib import Path
+from typing import IO
 
 from lxml import etree
 
 from arch.models import Citation, Section, Subsection
+from arch.parsers.us.section_index import SectionIndex, index_path
 
 # USLM namespaces - the actual namespace varies by source
 USLM_NS_GPO = {"uslm": "http://schemas.gpo.gov/xml/uslm"}
 USLM_NS_HOUSE = {"uslm": "http://xml.house.gov/schemas/uslm/1.0"}
 
+# Elements reported by the streaming parser: the title header, and sections
+STREAM_TAGS = ("{*}docNumber", "{*}created", "{*}title", "{*}heading", "{*}section")
+
+# Subsection levels, in the order they are collected under a parent
+SUBSECTION_TAGS = ("subsection", "paragraph", "subparagraph", "clause", "subclause")
+
+# Children whose full text is part of the enclosing subsection's own text
+CONTENT_TAGS = frozenset({"content", "chapeau", "text", "continuation"})
+
+
+def _namespace_for(uri: str, root_tag: str = "") -> dict[str, str]:
+    """Map a document's namespace URI to the matching USLM namespace dict."""
+    if "xml.house.gov" in uri:
+        return USLM_NS_HOUSE
+    elif "schemas.gpo.gov" in uri:
+        return USLM_NS_GPO
+    # Try to detect from root element
+    if "house.gov" in root_tag:
+        return USLM_NS_HOUSE
+    return USLM_NS_GPO
+
+
+def zip_xml_member(zf: zipfile.ZipFile) -> str:
+    """Name of the title XML inside a release point zip.
+
+    Raises:
+        ValueError: If the archive has no XML file
+    """
+    xml_files = [n for n in zf.namelist() if n.lower().endswith(".xml")]
+    if not xml_files:
+        raise ValueError(f"No XML files found in {zf.filename}")
+    # The first (usually only) XML file is the title
+    return xml_files[0]
+
+
+class _SectionVisitor:
+    """Single pass over a section's hierarchy with precomputed namespaced tags.
+
+    Each section and subsection element's children are visited once, yielding
+    its heading, its own text and its subsections together, instead of one
+    path lookup per subsection level and another for the heading. Full text
+    and references are gathered with lxml's C iterators over the section.
+    """
+
+    def __init__(self, ns_uri: str):
+        prefix = f"{{{ns_uri}}}"
+        self.heading_tag = prefix + "heading"
+        self.ref_tag = prefix + "ref"
+        self.levels = {prefix + tag: level for level, tag in enumerate(SUBSECTION_TAGS)}
+
+    def visit(
+        self, elem: etree._Element, direct_text: bool = True
+    ) -> tuple[str | None, str, list[Subsection]]:
+        """Heading, own text (excluding child subsections) and subsections of an element."""
+        heading = None
+        parts = [elem.text.strip()] if direct_text and elem.text else []
+        found: list[tuple[int, Subsection]] = []
+
+        for child in elem:
+            tag = child.tag
+            level = self.levels.get(tag)
+            if level is not None:
+                subsection = self._subsection(child)
+                if subsection is not None:
+                    found.append((level, subsection))
+            elif heading is None and tag == self.heading_tag:
+                heading = "".join(child.itertext()).strip()
+
+            if direct_text:
+                # Comments and processing instructions contribute only their tail
+                if isinstance(tag, str):
+                    local = tag.rpartition("}")[2]
+                    if local in CONTENT_TAGS:
+                        parts.append("".join(child.itertext()).strip())
+                    elif local not in SUBSECTION_TAGS and child.text:
+                        parts.append(child.text.strip())
+                if child.tail:
+                    parts.append(child.tail.strip())
+
+        # Group by level (subsections, then paragraphs, ...), document order within each
+        found.sort(key=lambda item: item[0])
+        return heading, " ".join(filter(None, parts)), [subsection for _, subsection in found]
+
+    def _subsection(self, elem: etree._Element) -> Subsection | None:
+        identifier = elem.get("identifier", "")
+        # Extract the local identifier (e.g., "a" from "/us/usc/t26/s32/a")
+        local_id = identifier.split("/")[-1] if identifier else ""
+        if not local_id:
+            return None
+        heading, text, children = self.visit(elem)
+        return Subsection(identifier=local_id, heading=heading, text=text, children=children)
+
+    def references(self, elem: etree._Element) -> list[str]:
+        """Distinct cross-references to other US Code sections, in document order."""
+        references: dict[str, None] = {}
+        for ref in elem.iter(self.ref_tag):
+            href = ref.get("href", "")
+            if href.startswith("/us/usc/"):
+                # Convert USLM reference to citation
+                # /us/usc/t26/s32 -> 26 USC 32
+                parts = href.split("/")
+                if len(parts) >= 5:
+                    title = parts[3].replace("t", "")
+                    section = parts[4].replace("s", "")
+                    references[f"{title} USC {section}"] = None
+        return list(references)
+
 
 class USLMParser:
     """Parser for USLM XML files from uscode.house.gov."""
@@ -26,26 +137,21 @@ class USLMParser:
         """Initialize parser with path to USLM XML file.
 
         Args:
-            xml_path: Path to the USLM XML file (e.g., usc26.xml for Title 26)
+            xml_path: Path to the USLM XML file (e.g., usc26.xml for Title 26),
+                or to a release point zip (usc26.zip), read without extracting
         """
         self.xml_path = Path(xml_path)
         self._tree: etree._ElementTree | None = None
         self._ns: dict[str, str] = {}  # Detected namespace
+        # (number, name, release date) read from the start of the file
+        self._header: tuple[int | None, str | None, date | None] | None = None
+        self._visitor: _SectionVisitor | None = None
+        self._section_index: SectionIndex | None = None
 
     def _detect_namespace(self) -> dict[str, str]:
         """Detect which USLM namespace the document uses."""
         root = self.tree.getroot()
-        ns = root.nsmap.get(None, "")  # Default namespace
-
-        if "xml.house.gov" in ns:
-            return USLM_NS_HOUSE
-        elif "schemas.gpo.gov" in ns:
-            return USLM_NS_GPO
-        else:
-            # Try to detect from root element
-            if "house.gov" in str(root.tag):
-                return USLM_NS_HOUSE
-            return USLM_NS_GPO
+        return _namespace_for(root.nsmap.get(None, ""), str(root.tag))
 
     @property
     def ns(self) -> dict[str, str]:
@@ -54,15 +160,81 @@ class USLMParser:
             self._ns = self._detect_namespace()
         return self._ns
 
+    @property
+    def visitor(self) -> _SectionVisitor:
+        """Section visitor for the document's namespace."""
+        if self._visitor is None:
+            self._visitor = _SectionVisitor(self.ns.get("uslm", ""))
+        return self._visitor
+
     @property
     def tree(self) -> etree._ElementTree:
         """Lazily load and return the XML tree."""
         if self._tree is None:
-            self._tree = etree.parse(str(self.xml_path))
+            with self._open() as source:
+                self._tree = etree.parse(source)
         return self._tree
 
+    @property
+    def is_zip(self) -> bool:
+        """Whether the XML is read from inside a release point zip."""
+        return self.xml_path.suffix.lower() == ".zip"
+
+    @contextmanager
+    def _open(self) -> Iterator[str | IO[bytes]]:
+        """Source for lxml: the file path, or the XML member of a zip archive."""
+        if not self.is_zip:
+            yield str(self.xml_path)
+            return
+        with zipfile.ZipFile(self.xml_path) as zf, zf.open(zip_xml_member(zf)) as member:
+            yield member
+
+    def _iterparse(self) -> Iterator[tuple[str, etree._Element]]:
+        """Start and end events for STREAM_TAGS elements."""
+        with self._open() as source:
+            yield from etree.iterparse(source, events=("start", "end"), tag=STREAM_TAGS)
+
+    def _read_header_event(self, event: str, elem: etree._Element, header: dict) -> None:
+        """Record the title number or name from a streamed header element."""
+        name = etree.QName(elem).localname
+        if event == "end" and name == "docNumber" and elem.text and "number" not in header:
+            header["number"] = int(elem.text.strip())
+        elif event == "end" and name == "created" and elem.text and "released" not in header:
+            # dcterms:created in the meta block, e.g. 2025-01-31T10:15:00
+            with suppress(ValueError):
+                header["released"] = date.fromisoformat(elem.text.strip()[:10])
+        elif event == "start" and name == "title" and "/t" in elem.get("identifier", ""):
+            # Format: /us/usc/t26 -> 26
+            header.setdefault("title_id_number", int(elem.get("identifier").split("/t")[-1]))
+        elif event == "end" and name == "heading" and elem.text and "name" not in header:
+            parent = elem.getparent()
+            if parent is not None and etree.QName(parent).localname == "title":
+                header["name"] = elem.text.strip()
+
+    def _read_header(self) -> tuple[int | None, str | None, date | None]:
+        """Title number, name and release date, read without loading the tree.
+
+        Stops at the first section; the meta block and title heading come
+        before it.
+        """
+        if self._header is None:
+            header: dict = {}
+            for event, elem in self._iterparse():
+                if etree.QName(elem).localname == "section":
+                    break
+                self._read_header_event(event, elem, header)
+            self._header = (
+                header.get("number", header.get("title_id_number")),
+                header.get("name"),
+                header.get("released"),
+            )
+        return self._header
+
     def get_title_number(self) -> int:
         """Extract the title number from the XML."""
+        if self._tree is None and (number := self._read_header()[0]) is not None:
+            return number
+
         root = self.tree.getroot()
         # Try to get from docNumber in meta first (most reliable)
         doc_num = root.find(".//docNumber", self.ns)
@@ -91,6 +263,9 @@ class USLMParser:
 
     def get_title_name(self) -> str:
         """Extract the title name (e.g., 'Internal Revenue Code')."""
+        if self._tree is None and (name := self._read_header()[1]) is not None:
+            return name
+
         root = self.tree.getroot()
         # Try with namespace
         heading = root.find(".//uslm:title/uslm:heading", self.ns)
@@ -104,44 +279,150 @@ class USLMParser:
                 return heading.text.strip()
         return f"Title {self.get_title_number()}"
 
-    def iter_sections(self) -> Iterator[Section]:
+    def get_release_date(self) -> date | None:
+        """Date the release point was published, from dcterms:created in the meta block.
+
+        Returns:
+            The release date, or None if the file does not record one
+        """
+        return self._read_header()[2]
+
+    def iter_sections(self, streaming: bool = False) -> Iterator[Section]:
         """Iterate over all sections in the title.
 
+        Args:
+            streaming: Parse incrementally instead of loading the whole tree.
+                Each section is freed once parsed, so memory stays bounded by
+                the largest section rather than the title. Yields the same
+                sections in the same order.
+
         Yields:
             Section objects for each section in the title
         """
+        if streaming:
+            yield from self._iter_sections_streaming()
+            return
+
         root = self.tree.getroot()
         title_num = self.get_title_number()
         title_name = self.get_title_name()
         ns_uri = self.ns.get("uslm", "")
 
         for section_elem in root.iter(f"{{{ns_uri}}}section"):
-            try:
-                section = self._parse_section(section_elem, title_num, title_name)
+            section = self._parse_section_safely(section_elem, title_num, title_name)
+            if section:
+                yield section
+
+    def _iter_sections_streaming(self) -> Iterator[Section]:
+        """Parse sections from iterparse end events, clearing each when done."""
+        header: dict = {}
+        title_num = title_name = None
+        depth = 0  # Open section elements
+
+        for event, elem in self._iterparse():
+            if not self._ns:
+                self._ns = _namespace_for(etree.QName(elem).namespace or "")
+            if etree.QName(elem).localname != "section":
+                if depth == 0:
+                    self._read_header_event(event, elem, header)
+                continue
+
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth:
+                continue  # Nested section, parsed with its enclosing section
+
+            if title_num is None:
+                number = header.get("number", header.get("title_id_number"))
+                if number is None:
+                    raise ValueError(f"Cannot determine title number from {self.xml_path}")
+                self._header = (number, header.get("name"), header.get("released"))
+                title_num, title_name = number, header.get("name") or f"Title {number}"
+
+            # Same order as the tree walk: this section, then any nested ones
+            for section_elem in elem.iter(elem.tag):
+                section = self._parse_section_safely(section_elem, title_num, title_name)
                 if section:
                     yield section
-            except Exception as e:
-                # Log but continue - don't let one bad section stop everything
-                identifier = section_elem.get("identifier", "unknown")
-                print(f"Warning: Failed to parse section {identifier}: {e}")
+
+            # Free the parsed section and everything before it
+            elem.clear(keep_tail=True)
+            parent = elem.getparent()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    def _parse_section_safely(
+        self, elem: etree._Element, title_num: int, title_name: str
+    ) -> Section | None:
+        """Parse a section, logging and skipping it on failure."""
+        try:
+            return self._parse_section(elem, title_num, title_name)
+        except Exception as e:
+            # Log but continue - don't let one bad section stop everything
+            identifier = elem.get("identifier", "unknown")
+            print(f"Warning: Failed to parse section {identifier}: {e}")
+            return None
+
+    @property
+    def section_index(self) -> SectionIndex | None:
+        """The sidecar section index, if one exists and matches the file."""
+        if self._section_index is None and not self.is_zip:
+            index = SectionIndex.load(index_path(self.xml_path))
+            if index is None or not index.is_current(self.xml_path):
+                return None
+            self._section_index = index
+        return self._section_index
+
+    def build_index(self) -> Path:
+        """Write a sidecar byte-offset index so get_section can skip full parses.
+
+        Returns:
+            Path to the index file (next to the XML, e.g. ``usc26.xml.idx``)
+
+        Raises:
+            ValueError: If the parser reads from a zip (offsets need the extracted XML)
+        """
+        if self.is_zip:
+            raise ValueError(f"Cannot index {self.xml_path}; extract the XML first")
+        index = SectionIndex.build(self.xml_path)
+        path = index_path(self.xml_path)
+        index.save(path)
+        self._section_index = index
+        return path
 
     def get_section(self, section_num: str) -> Section | None:
         """Get a specific section by number.
 
+        With a current sidecar index (see build_index), only that section's
+        bytes are read and parsed; otherwise the whole title is loaded and
+        scanned.
+
         Args:
             section_num: Section number (e.g., "32" or "32A")
 
         Returns:
             Section object or None if not found
         """
-        root = self.tree.getroot()
         title_num = self.get_title_number()
         title_name = self.get_title_name()
-        ns_uri = self.ns.get("uslm", "")
 
         # USLM identifier format: /us/usc/t26/s32
         target_id = f"/us/usc/t{title_num}/s{section_num}"
 
+        index = self.section_index if self._tree is None else None
+        if index is not None:
+            section_elem = index.read_section(self.xml_path, target_id)
+            if section_elem is None:
+                return None
+            if not self._ns:
+                self._ns = _namespace_for(etree.QName(section_elem).namespace or "")
+            return self._parse_section(section_elem, title_num, title_name)
+
+        root = self.tree.getroot()
+        ns_uri = self.ns.get("uslm", "")
+
         for section_elem in root.iter(f"{{{ns_uri}}}section"):
             if section_elem.get("identifier") == target_id:
                 return self._parse_section(section_elem, title_num, title_name)
@@ -161,20 +442,13 @@ class USLMParser:
         if not section_num:
             return None
 
-        # Get section heading
-        heading_elem = elem.find("uslm:heading", self.ns)
-        section_title = ""
-        if heading_elem is not None:
-            section_title = self._get_text_content(heading_elem)
-
-        # Get full text content
-        text = self._get_section_text(elem)
-
-        # Parse subsections
-        subsections = self._parse_subsections(elem)
-
-        # Extract cross-references
-        references = self._extract_references(elem)
+        # Heading and subsection tree in one pass; full text and references
+        # (which include notes and nested sections) from the whole element
+        visitor = self.visitor
+        heading, _, subsections = visitor.visit(elem, direct_text=False)
+        section_title = heading or ""
+        text = "".join(elem.itertext()).strip()
+        references = visitor.references(elem)
 
         # Get source URL
         source_url = f"https://uscode.house.gov/view.xhtml?req={title_num}+USC+{section_num}"
@@ -191,129 +465,37 @@ class USLMParser:
             uslm_id=identifier,
         )
 
-    def _parse_subsections(self, parent: etree._Element) -> list[Subsection]:
-        """Recursively parse subsection hierarchy."""
-        subsections = []
-
-        # USLM uses various elements for subsection levels
-        subsection_tags = ["subsection", "paragraph", "subparagraph", "clause", "subclause"]
-
-        for tag in subsection_tags:
-            for sub_elem in parent.findall(f"uslm:{tag}", self.ns):
-                identifier = sub_elem.get("identifier", "")
-                # Extract the local identifier (e.g., "a" from "/us/usc/t26/s32/a")
-                local_id = identifier.split("/")[-1] if identifier else ""
-
-                heading_elem = sub_elem.find("uslm:heading", self.ns)
-                heading = self._get_text_content(heading_elem) if heading_elem is not None else None
-
-                # Get text content (excluding child subsections)
-                text = self._get_direct_text(sub_elem)
-
-                # Recursively parse children
-                children = self._parse_subsections(sub_elem)
-
-                if local_id:
-                    subsections.append(
-                        Subsection(
-                            identifier=local_id,
-                            heading=heading,
-                            text=text,
-                            children=children,
-                        )
-                    )
-
-        return subsections
 
-    def _get_text_content(self, elem: etree._Element) -> str:
-        """Get all text content from an element, including nested elements."""
-        return "".join(elem.itertext()).strip()
-
-    def _get_direct_text(self, elem: etree._Element) -> str:
-        """Get text content directly in this element, not in child subsections."""
-        # Get text from content/chapeau elements, not from child subsections
-        parts = []
-
-        if elem.text:
-            parts.append(elem.text.strip())
-
-        for child in elem:
-            tag = etree.QName(child.tag).localname
-            # Skip subsection children, include content elements
-            if tag in ["content", "chapeau", "text", "continuation"]:
-                parts.append(self._get_text_content(child))
-            elif (
-                tag not in ["subsection", "paragraph", "subparagraph", "clause", "subclause"]
-                and child.text
-            ):
-                # Include other inline content
-                parts.append(child.text.strip())
-            if child.tail:
-                parts.append(child.tail.strip())
-
-        return " ".join(filter(None, parts))
-
-    def _get_section_text(self, elem: etree._Element) -> str:
-        """Get the full text of a section including all subsections."""
-        return self._get_text_content(elem)
-
-    def _extract_references(self, elem: etree._Element) -> list[str]:
-        """Extract cross-references to other sections."""
-        references = []
-        ns_uri = self.ns.get("uslm", "")
-
-        for ref in elem.iter(f"{{{ns_uri}}}ref"):
-            href = ref.get("href", "")
-            if href.startswith("/us/usc/"):
-                # Convert USLM reference to citation
-                # /us/usc/t26/s32 -> 26 USC 32
-                parts = href.split("/")
-                if len(parts) >= 5:
-                    title = parts[3].replace("t", "")
-                    section = parts[4].replace("s", "")
-                    references.append(f"{title} USC {section}")
-
-        return list(set(references))  # Deduplicate
-
-
-def download_title(title_num: int, output_dir: Path) -> Path:
+def download_title(
+    title_num: int,
+    output_dir: Path,
+    release_point: str | None = None,
+    extract: bool = True,
+) -> Path:
     """Download a US Code title from uscode.house.gov.
 
+    Streams the release point zip to disk, resuming an interrupted download
+    and skipping the transfer if the title is unchanged since the last one
+    (see arch.fetchers.uscode).
+
     Args:
         title_num: Title number (1-54)
         output_dir: Directory to save the XML file
+        release_point: Release point such as "119-59" (default: the current one)
+        extract: Extract the XML; otherwise return the zip, which USLMParser
+            can read directly
 
     Returns:
-        Path to the downloaded XML file
+        Path to the downloaded XML file (or zip)
     """
-    import httpx
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = output_dir / f"usc{title_num}.xml"
-
-    # URL format for USLM XML downloads
-    # Current release point as of Dec 2025: 119-59
-    url = f"https://uscode.house.gov/download/releasepoints/us/pl/119/59/xml_usc{title_num:02d}@119-59.zip"
-
-    print(f"Downloading Title {title_num} from {url}...")
-
-    with httpx.Client(timeout=120.0) as client:
-        response = client.get(url)
-        response.raise_for_status()
-
-        # It's a zip file, extract the XML
-        import io
-        import zipfile
-
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-            # Find the main XML file
-            xml_files = [n for n in zf.namelist() if n.endswith(".xml")]
-            if not xml_files:
-                raise ValueError(f"No XML files found in downloaded archive for Title {title_num}")
+    from arch.fetchers.uscode import USCodeFetcher
 
-            # Extract the first (usually only) XML file
-            xml_content = zf.read(xml_files[0])
-            output_path.write_bytes(xml_content)
+    with USCodeFetcher(output_dir, release_point=release_point) as fetcher:
+        print(f"Downloading Title {title_num} (release point {fetcher.release_point})...")
+        result = fetcher.download_title(title_num, extract=extract)
 
-    print(f"Saved to {output_path}")
-    return output_path
+    if result.changed:
+        print(f"Saved to {result.path}")
+    else:
+        print(f"Title {title_num} unchanged; using {result.path}")
+    return result.path
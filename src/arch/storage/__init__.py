@@ -1,6 +1,7 @@
 """Storage backends for the law archive."""
 
 from arch.storage.base import StorageBackend
+from arch.storage.sharded import ShardedStorage, open_storage
 from arch.storage.sqlite import SQLiteStorage
 
 # PostgreSQL is optional - only import if installed
@@ -16,7 +17,7 @@ except ImportError:
     R2Storage = None  # type: ignore
     get_r2 = None  # type: ignore
 
-__all__ = ["StorageBackend", "SQLiteStorage"]
+__all__ = ["StorageBackend", "SQLiteStorage", "ShardedStorage", "open_storage"]
 if PostgresStorage is not None:
     __all__.append("PostgresStorage")
 if R2Storage is not None:
@@ -1,9 +1,17 @@
 """Abstract base class for storage backends."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import date
 
-from arch.models import SearchResult, Section, TitleInfo
+from arch.models import (
+    Citation,
+    SearchPage,
+    SearchResult,
+    Section,
+    TitleChanges,
+    TitleInfo,
+)
 
 
 class StorageBackend(ABC):
@@ -14,6 +22,40 @@ class StorageBackend(ABC):
         """Store a section in the database."""
         pass
 
+    def store_sections(
+        self,
+        sections: Iterable[Section],
+        batch_size: int = 1000,
+        valid_from: date | None = None,
+    ) -> int:
+        """Store many sections, returning the number stored.
+
+        Backends should override this with a batched implementation; the
+        default simply calls store_section for each section. ``valid_from``
+        dates the stored text for backends that keep version history and is
+        ignored by the default implementation.
+        """
+        count = 0
+        for section in sections:
+            self.store_section(section)
+            count += 1
+        return count
+
+    def sync_title(
+        self,
+        title: int,
+        sections: Iterable[Section],
+        valid_from: date | None = None,
+        batch_size: int = 1000,
+    ) -> TitleChanges:
+        """Make a title's stored sections match a new parse, writing only differences.
+
+        Sections are compared by content hash: new and changed sections are
+        written, sections missing from ``sections`` are removed, and the rest
+        are left untouched.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support incremental ingest")
+
     @abstractmethod
     def get_section(
         self,
@@ -25,6 +67,22 @@ class StorageBackend(ABC):
         """Retrieve a section by citation."""
         pass
 
+    def get_sections(
+        self,
+        citations: Sequence[Citation],
+        as_of: date | None = None,
+    ) -> list[Section | None]:
+        """Retrieve many sections at once.
+
+        Returns a list aligned with ``citations``, with None for citations
+        that were not found. Backends should override this with a single
+        batched query; the default calls get_section for each citation.
+        """
+        return [
+            self.get_section(c.title, c.section, subsection=c.subsection, as_of=as_of)
+            for c in citations
+        ]
+
     @abstractmethod
     def search(
         self,
@@ -35,6 +93,33 @@ class StorageBackend(ABC):
         """Full-text search across sections."""
         pass
 
+    def search_page(
+        self,
+        query: str,
+        title: int | None = None,
+        jurisdiction: str | None = None,
+        doc_type: str | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> SearchPage:
+        """Full-text search returning one page of results and a next-page cursor.
+
+        The default implementation returns a single page without a cursor or
+        total; backends that support keyset pagination override it.
+        """
+        return SearchPage(results=self.search(query, title=title, limit=limit))
+
+    def get_title_sections(
+        self, title: int, after: str | None = None, limit: int = 500
+    ) -> list[Section]:
+        """Get one page of a title's sections, ordered by section number.
+
+        ``after`` is the section number of the last section of the previous
+        page, which makes it usable as a resume token for bulk exports.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support title export")
+
     @abstractmethod
     def list_titles(self) -> list[TitleInfo]:
         """List all available titles with metadata."""
@@ -49,3 +134,25 @@ class StorageBackend(ABC):
     def get_referenced_by(self, title: int, section: str) -> list[str]:
         """Get sections that reference this section."""
         pass
+
+    def iter_cross_references(self) -> Iterator[tuple[str, str]]:
+        """Yield every (from_citation, to_citation) cross-reference edge."""
+        raise NotImplementedError(f"{type(self).__name__} does not support graph export")
+
+    def iter_section_headings(self) -> Iterator[tuple[str, str]]:
+        """Yield (citation, heading) for every current section."""
+        raise NotImplementedError(f"{type(self).__name__} does not support heading export")
+
+    def cross_reference_fingerprint(self) -> str | None:
+        """Cheap token that changes whenever the cross-references change.
+
+        Used to validate persisted graph snapshots; None disables snapshots.
+        """
+        return None
+
+    def data_version(self, title: int | None = None) -> str | None:
+        """Cheap token that changes whenever stored data (for a title) changes.
+
+        Used to invalidate cached API responses; None disables caching.
+        """
+        return None
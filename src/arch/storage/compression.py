@@ -0,0 +1,204 @@
+"""Optional compression of text columns in the SQLite archive.
+
+Long text values (section text, subsection text, JSON subsection trees) can be
+stored as compressed BLOBs. Each BLOB starts with a one-byte tag naming the
+codec and whether the title's trained dictionary was used, so compressed and
+plain rows can coexist and are decoded transparently on read:
+
+    tag 1: zlib                tag 2: zlib with the title's preset dictionary
+    tag 3: zstd                tag 4: zstd with the title's trained dictionary
+
+zlib is always available; zstd requires the optional ``zstandard`` package
+(``pip install cosilico-arch[compression]``).
+
+Example:
+    >>> codec = TextCodec("zlib")
+    >>> blob = codec.compress(26, "The term 'earned income' means ..." * 10)
+    >>> codec.decompress(26, blob)[:8]
+    'The term'
+"""
+
+import re
+import threading
+import zlib
+from collections import Counter
+from collections.abc import Iterable
+
+# Lazy import - only load if compression extras installed
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+CODECS = ("zlib", "zstd")
+
+TAG_ZLIB = 1
+TAG_ZLIB_DICT = 2
+TAG_ZSTD = 3
+TAG_ZSTD_DICT = 4
+
+# Values shorter than this are stored as plain text; the header and codec
+# framing would outweigh any savings
+MIN_COMPRESS_BYTES = 64
+
+# zlib only looks back 32 KiB, so a larger preset dictionary is wasted
+ZLIB_MAX_DICT_SIZE = 32 * 1024
+
+DEFAULT_DICT_SIZE = 64 * 1024
+DEFAULT_LEVEL = {"zlib": 9, "zstd": 19}
+
+# Clause boundaries used to find repeated boilerplate when building a zlib
+# dictionary ("For purposes of this subsection,", "as defined in section ...")
+_FRAGMENT_SPLIT = re.compile(r"(?<=[.;:,])\s+")
+
+
+def train_zlib_dictionary(samples: Iterable[str], size: int = ZLIB_MAX_DICT_SIZE) -> bytes:
+    """Build a zlib preset dictionary from the most repeated clauses.
+
+    Fragments are scored by how many bytes they would save (count x length)
+    and the best are placed at the end of the dictionary, where zlib can
+    reference them with the shortest distances.
+
+    Args:
+        samples: Representative texts
+        size: Maximum dictionary size in bytes (capped at 32 KiB)
+
+    Returns:
+        Dictionary bytes (empty if nothing repeats)
+    """
+    size = min(size, ZLIB_MAX_DICT_SIZE)
+    counts = Counter(
+        fragment
+        for text in samples
+        for fragment in _FRAGMENT_SPLIT.split(text)
+        if len(fragment) >= 8
+    )
+    ranked = sorted(
+        ((count * len(fragment), fragment) for fragment, count in counts.items() if count > 1),
+        reverse=True,
+    )
+
+    chosen, used = [], 0
+    for _, fragment in ranked:
+        encoded = fragment.encode() + b" "
+        if used + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        used += len(encoded)
+    return b"".join(reversed(chosen))
+
+
+class TextCodec:
+    """Compresses and decompresses text column values.
+
+    Args:
+        name: "zlib", "zstd", or None to store text uncompressed
+        dictionaries: Per-title dictionaries, as trained by train()
+        level: Compression level (default: 9 for zlib, 19 for zstd)
+    """
+
+    def __init__(
+        self,
+        name: str | None = None,
+        dictionaries: dict[int, bytes] | None = None,
+        level: int | None = None,
+    ):
+        if name is not None and name not in CODECS:
+            raise ValueError(f"Unknown compression codec {name!r}; expected one of {CODECS}")
+        if name == "zstd" and not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires: pip install cosilico-arch[compression]")
+        self.name = name
+        self.dictionaries = dict(dictionaries or {})
+        self.level = level if level is not None else DEFAULT_LEVEL.get(name or "", 0)
+        # zstd (de)compressor objects are not safe to share between threads
+        self._local = threading.local()
+
+    def train(self, title: int, samples: list[str], size: int = DEFAULT_DICT_SIZE) -> bytes | None:
+        """Train and keep a dictionary for one title.
+
+        Args:
+            title: Title number the dictionary applies to
+            samples: Representative texts from the title
+            size: Target dictionary size in bytes
+
+        Returns:
+            The dictionary, or None if the samples were too few to train one
+        """
+        if self.name == "zlib":
+            dictionary = train_zlib_dictionary(samples, size) or None
+        elif self.name == "zstd":
+            try:
+                dictionary = zstandard.train_dictionary(
+                    size, [s.encode() for s in samples]
+                ).as_bytes()
+            except zstandard.ZstdError:
+                dictionary = None  # Too little sample data
+        else:
+            dictionary = None
+
+        if dictionary:
+            self.dictionaries[title] = dictionary
+        else:
+            self.dictionaries.pop(title, None)
+        return dictionary
+
+    def compress(self, title: int, text: str | None) -> str | bytes | None:
+        """Encode a value for storage; short values stay plain text."""
+        if self.name is None or text is None:
+            return text
+        data = text.encode()
+        if len(data) < MIN_COMPRESS_BYTES:
+            return text
+
+        dictionary = self.dictionaries.get(title)
+        if self.name == "zlib":
+            if dictionary:
+                compressor = zlib.compressobj(self.level, zdict=dictionary)
+                return bytes([TAG_ZLIB_DICT]) + compressor.compress(data) + compressor.flush()
+            return bytes([TAG_ZLIB]) + zlib.compress(data, self.level)
+
+        tag = TAG_ZSTD_DICT if dictionary else TAG_ZSTD
+        key = title if dictionary else None
+        return bytes([tag]) + self._zstd(key, "compressor").compress(data)
+
+    def decompress(self, title: int, value: str | bytes | None) -> str | None:
+        """Decode a stored value; plain text is returned unchanged."""
+        if value is None or isinstance(value, str):
+            return value
+
+        tag, payload = value[0], value[1:]
+        if tag == TAG_ZLIB:
+            return zlib.decompress(payload).decode()
+        if tag == TAG_ZLIB_DICT:
+            decompressor = zlib.decompressobj(zdict=self._dictionary(title))
+            return (decompressor.decompress(payload) + decompressor.flush()).decode()
+        if tag in (TAG_ZSTD, TAG_ZSTD_DICT):
+            if not ZSTD_AVAILABLE:
+                raise ValueError(
+                    "Database holds zstd-compressed text; "
+                    "install it with: pip install cosilico-arch[compression]"
+                )
+            key = title if tag == TAG_ZSTD_DICT else None
+            return self._zstd(key, "decompressor").decompress(payload).decode()
+        raise ValueError(f"Unknown compressed text tag {tag}")
+
+    def _dictionary(self, title: int) -> bytes:
+        try:
+            return self.dictionaries[title]
+        except KeyError:
+            raise ValueError(f"Missing compression dictionary for title {title}") from None
+
+    def _zstd(self, title: int | None, kind: str):
+        """Per-thread cached zstd compressor or decompressor (title=None: no dictionary)."""
+        cache = self._local.__dict__.setdefault(kind, {})
+        if title not in cache:
+            params = {}
+            if title is not None:
+                params["dict_data"] = zstandard.ZstdCompressionDict(self._dictionary(title))
+            if kind == "compressor":
+                cache[title] = zstandard.ZstdCompressor(level=self.level, **params)
+            else:
+                cache[title] = zstandard.ZstdDecompressor(**params)
+        return cache[title]
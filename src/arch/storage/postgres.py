@@ -6,6 +6,7 @@ sections with full-text search using pg_trgm and GIN indexes.
 
 import json
 import os
+from collections.abc import Iterator, Sequence
 from datetime import date
 
 from arch.models import Citation, SearchResult, Section, Subsection, TitleInfo
@@ -276,7 +277,15 @@ class PostgresStorage(StorageBackend):
         as_of: date | None = None,
         jurisdiction: str = "federal",
     ) -> Section | None:
-        """Retrieve a section by citation."""
+        """Retrieve a section by citation.
+
+        If ``subsection`` is given (e.g. "a/1"), the returned Section holds
+        just that node and its descendants, as with SQLiteStorage.
+
+        Raises:
+            NotImplementedError: If ``as_of`` is given (no version history)
+        """
+        self._check_as_of(as_of)
         with self.Session() as session:
             result = session.execute(
                 text("""
@@ -290,7 +299,93 @@ class PostgresStorage(StorageBackend):
             if not result:
                 return None
 
-            return self._row_to_section(result._mapping)
+            found = self._row_to_section(result._mapping)
+        return self._subtree(found, subsection) if subsection else found
+
+    def _check_as_of(self, as_of: date | None) -> None:
+        """Reject point-in-time lookups, which need the SQLite version history."""
+        if as_of is not None:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not support point-in-time (as_of) lookups"
+            )
+
+    def _subtree(self, section: Section, subsection: str) -> Section | None:
+        """Narrow a section to one subsection node and its descendants."""
+        subsection = subsection.strip("/")
+        nodes, node = section.subsections, None
+        for part in subsection.split("/"):
+            node = next((s for s in nodes if s.identifier == part), None)
+            if node is None:
+                return None
+            nodes = node.children
+
+        texts: list[str] = []
+
+        def collect(sub: Subsection) -> None:
+            if sub.text:
+                texts.append(sub.text)
+            for child in sub.children:
+                collect(child)
+
+        collect(node)
+        return section.model_copy(
+            update={
+                "citation": Citation(
+                    title=section.citation.title,
+                    section=section.citation.section,
+                    subsection=subsection,
+                ),
+                "subsections": [node],
+                "text": "\n".join(texts),
+            }
+        )
+
+    def get_sections(
+        self,
+        citations: Sequence[Citation],
+        as_of: date | None = None,
+        jurisdiction: str = "federal",
+    ) -> list[Section | None]:
+        """Retrieve many sections in one query using unnest'd key arrays.
+
+        Citations that name a subsection get just that subtree.
+
+        Raises:
+            NotImplementedError: If ``as_of`` is given (no version history)
+        """
+        self._check_as_of(as_of)
+        keys = list(dict.fromkeys((c.title, c.section) for c in citations))
+        if not keys:
+            return []
+
+        with self.Session() as session:
+            results = session.execute(
+                text("""
+                SELECT s.* FROM sections s
+                JOIN unnest(CAST(:titles AS INTEGER[]), CAST(:sections AS TEXT[]))
+                    AS wanted(title, section)
+                    ON s.title = wanted.title AND s.section = wanted.section
+                WHERE s.jurisdiction = :jurisdiction
+            """),
+                {
+                    "titles": [k[0] for k in keys],
+                    "sections": [k[1] for k in keys],
+                    "jurisdiction": jurisdiction,
+                },
+            ).fetchall()
+
+            found = {}
+            for row in results:
+                section = self._row_to_section(row._mapping)
+                found.setdefault((section.citation.title, section.citation.section), section)
+
+        results = []
+        for c in citations:
+            section = found.get((c.title, c.section))
+            if section is not None and c.subsection:
+                section = self._subtree(section, c.subsection)
+            results.append(section)
+        return results
 
     def _row_to_section(self, row: dict) -> Section:
         """Convert a database row to a Section model."""
@@ -424,6 +519,19 @@ class PostgresStorage(StorageBackend):
 
             return [f"{row.title} USC {row.section}" for row in results]
 
+    def iter_cross_references(self) -> Iterator[tuple[str, str]]:
+        """Yield every (from_citation, to_citation) cross-reference edge."""
+        with self.Session() as session:
+            results = session.execute(
+                text("""
+                SELECT s.title, s.section, cr.to_title, cr.to_section
+                FROM cross_references cr
+                JOIN sections s ON cr.from_id = s.id
+            """)
+            )
+            for row in results:
+                yield f"{row.title} USC {row.section}", f"{row.to_title} USC {row.to_section}"
+
     def update_title_metadata(
         self, title_num: int, name: str, is_positive_law: bool, jurisdiction: str = "federal"
     ) -> None:
@@ -1,7 +1,11 @@
 """SQLite storage backend for CFR regulations."""
 
 import json
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
 from datetime import date
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
@@ -9,10 +13,87 @@ import sqlite_utils
 
 from arch.models_regulation import (
     CFRCitation,
+    CombinedSearchResult,
+    PartChanges,
     Regulation,
     RegulationSearchResult,
     RegulationSubsection,
 )
+from arch.storage.sqlite import (
+    BULK_LOADS_SQL,
+    bulk_load_running,
+    load_codec,
+    register_text_function,
+)
+
+# Columns written for each regulation, in INSERT order
+REGULATION_COLUMNS = (
+    "id",
+    "title",
+    "part",
+    "section",
+    "heading",
+    "authority",
+    "source",
+    "full_text",
+    "subsections_json",
+    "effective_date",
+    "source_statutes_json",
+    "cross_references_json",
+    "amendments_json",
+    "source_url",
+    "retrieved_at",
+)
+
+# Point-in-time history rows: the validity interval, then the regulation
+VERSION_COLUMNS = ("valid_from", "valid_to", "content_hash", *REGULATION_COLUMNS)
+
+INSERT_VERSION_SQL = f"""
+    INSERT INTO regulation_versions ({", ".join(VERSION_COLUMNS)})
+    VALUES ({", ".join("?" for _ in VERSION_COLUMNS)})
+"""
+
+INSERT_REGULATION_SQL = f"""
+    INSERT OR REPLACE INTO regulations ({", ".join(REGULATION_COLUMNS)})
+    VALUES ({", ".join("?" for _ in REGULATION_COLUMNS)})
+"""
+
+# Triggers that keep regulations_fts in sync with regulations, keyed by name
+# so bulk loads can drop and recreate them
+REGULATION_FTS_TRIGGERS = {
+    "regulations_ai": """
+        CREATE TRIGGER IF NOT EXISTS regulations_ai AFTER INSERT ON regulations BEGIN
+            INSERT INTO regulations_fts(rowid, heading, full_text)
+            VALUES (new.rowid, new.heading, new.full_text);
+        END
+    """,
+    "regulations_ad": """
+        CREATE TRIGGER IF NOT EXISTS regulations_ad AFTER DELETE ON regulations BEGIN
+            INSERT INTO regulations_fts(regulations_fts, rowid, heading, full_text)
+            VALUES ('delete', old.rowid, old.heading, old.full_text);
+        END
+    """,
+    "regulations_au": """
+        CREATE TRIGGER IF NOT EXISTS regulations_au AFTER UPDATE ON regulations BEGIN
+            INSERT INTO regulations_fts(regulations_fts, rowid, heading, full_text)
+            VALUES ('delete', old.rowid, old.heading, old.full_text);
+            INSERT INTO regulations_fts(rowid, heading, full_text)
+            VALUES (new.rowid, new.heading, new.full_text);
+        END
+    """,
+}
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of at most ``size`` items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _column_names(cursor: sqlite3.Cursor) -> list[str]:
+    """Names of the columns a query returns, in row order."""
+    return [desc[0] for desc in cursor.description]
 
 
 class RegulationStorage:
@@ -26,10 +107,14 @@ class RegulationStorage:
         """
         self.db_path = Path(db_path)
         self.db = sqlite_utils.Database(str(self.db_path))
+        self._statute_text_registered = False
         self._init_schema()
 
     def _init_schema(self) -> None:
         """Create database tables if they don't exist."""
+        # Bulk loads in progress (see store_regulations)
+        self.db.execute(BULK_LOADS_SQL)
+
         # Main regulations table
         if "regulations" not in self.db.table_names():
             self.db["regulations"].create(
@@ -72,32 +157,9 @@ class RegulationStorage:
             )
 
             # Triggers to keep FTS in sync
-            self.db.execute(
-                """
-                CREATE TRIGGER IF NOT EXISTS regulations_ai AFTER INSERT ON regulations BEGIN
-                    INSERT INTO regulations_fts(rowid, heading, full_text)
-                    VALUES (new.rowid, new.heading, new.full_text);
-                END
-            """
-            )
-            self.db.execute(
-                """
-                CREATE TRIGGER IF NOT EXISTS regulations_ad AFTER DELETE ON regulations BEGIN
-                    INSERT INTO regulations_fts(regulations_fts, rowid, heading, full_text)
-                    VALUES ('delete', old.rowid, old.heading, old.full_text);
-                END
-            """
-            )
-            self.db.execute(
-                """
-                CREATE TRIGGER IF NOT EXISTS regulations_au AFTER UPDATE ON regulations BEGIN
-                    INSERT INTO regulations_fts(regulations_fts, rowid, heading, full_text)
-                    VALUES ('delete', old.rowid, old.heading, old.full_text);
-                    INSERT INTO regulations_fts(rowid, heading, full_text)
-                    VALUES (new.rowid, new.heading, new.full_text);
-                END
-            """
-            )
+            self._create_fts_triggers()
+        else:
+            self._repair_fts_triggers()
 
         # CFR title metadata
         if "cfr_titles" not in self.db.table_names():
@@ -112,70 +174,157 @@ class RegulationStorage:
                 pk="number",
             )
 
+        # Point-in-time history of CFR parts: one row per section version,
+        # written only when a snapshot finds the section's content changed
+        if "regulation_versions" not in self.db.table_names():
+            self.db["regulation_versions"].create(
+                {
+                    "valid_from": str,
+                    "valid_to": str,
+                    "content_hash": str,
+                    **{c: (int if c in ("title", "part") else str) for c in REGULATION_COLUMNS},
+                },
+            )
+            self.db["regulation_versions"].create_index(
+                ["title", "part", "section", "valid_from"], unique=True, if_not_exists=True
+            )
+
+        # Dates each part's history was captured at
+        if "regulation_snapshots" not in self.db.table_names():
+            self.db["regulation_snapshots"].create(
+                {"title": int, "part": int, "as_of": str, "section_count": int},
+                pk=("title", "part", "as_of"),
+            )
+
+    def _create_fts_triggers(self) -> None:
+        """Create the triggers that keep regulations_fts in sync."""
+        for sql in REGULATION_FTS_TRIGGERS.values():
+            self.db.execute(sql)
+
+    def _repair_fts_triggers(self) -> None:
+        """Restore FTS sync triggers left dropped by an interrupted bulk load.
+
+        store_regulations drops the triggers for the duration of a load and
+        records its pid in bulk_loads; if the process dies before its finally
+        block, the index has neither the triggers nor the rows written so far.
+        Both are restored here, unless the loader is still running.
+        """
+        present = {
+            name
+            for (name,) in self.db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+            ).fetchall()
+        }
+        if present.issuperset(REGULATION_FTS_TRIGGERS):
+            return
+        conn = self.db.conn
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if bulk_load_running(self.db, "regulations_fts"):
+                return
+            self._create_fts_triggers()
+            conn.execute("INSERT INTO regulations_fts(regulations_fts) VALUES ('rebuild')")
+
+    def _begin_bulk_load(self) -> None:
+        """Drop the FTS sync triggers and record this process as loading."""
+        conn = self.db.conn
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO bulk_loads (fts, pid) VALUES ('regulations_fts', ?)",
+                [os.getpid()],
+            )
+            self._drop_fts_triggers()
+
+    def _end_bulk_load(self) -> None:
+        """Restore the FTS sync triggers, rebuild regulations_fts and clear the marker."""
+        conn = self.db.conn
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "DELETE FROM bulk_loads WHERE fts = 'regulations_fts' AND pid = ?",
+                [os.getpid()],
+            )
+            self._create_fts_triggers()
+            conn.execute("INSERT INTO regulations_fts(regulations_fts) VALUES ('rebuild')")
+
+    def _drop_fts_triggers(self) -> None:
+        """Drop the FTS sync triggers (used during bulk loads)."""
+        for name in REGULATION_FTS_TRIGGERS:
+            self.db.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    def rebuild_fts(self) -> None:
+        """Rebuild the regulations_fts index from the regulations table."""
+        self.db.execute("INSERT INTO regulations_fts(regulations_fts) VALUES ('rebuild')")
+        self.db.conn.commit()
+
+    def _regulation_to_row(self, regulation: Regulation) -> tuple:
+        """Convert a Regulation to a row tuple matching REGULATION_COLUMNS."""
+        citation = regulation.citation
+        return (
+            f"{citation.title}/{citation.part}/{citation.section}",
+            citation.title,
+            citation.part,
+            citation.section,
+            regulation.heading,
+            regulation.authority,
+            regulation.source,
+            regulation.full_text,
+            json.dumps([self._subsection_to_dict(s) for s in regulation.subsections]),
+            regulation.effective_date.isoformat(),
+            json.dumps(regulation.source_statutes),
+            json.dumps(regulation.cross_references),
+            json.dumps([a.model_dump(mode="json") for a in regulation.amendments]),
+            regulation.source_url,
+            regulation.retrieved_at.isoformat() if regulation.retrieved_at else None,
+        )
+
     def store_regulation(self, regulation: Regulation) -> None:
         """Store a regulation in the database.
 
         Args:
             regulation: Regulation object to store
         """
-        reg_id = f"{regulation.citation.title}/{regulation.citation.part}/{regulation.citation.section}"
+        citation = regulation.citation
+        with self.db.conn:
+            # Delete first so the FTS delete trigger fires; INSERT OR REPLACE
+            # removes the old row without running it
+            self.db.conn.execute(
+                "DELETE FROM regulations WHERE title = ? AND part = ? AND section = ?",
+                [citation.title, citation.part, citation.section],
+            )
+            self.db.conn.execute(INSERT_REGULATION_SQL, self._regulation_to_row(regulation))
 
-        # Serialize nested objects
-        subsections_json = json.dumps(
-            [self._subsection_to_dict(s) for s in regulation.subsections]
-        )
-        amendments_json = json.dumps(
-            [a.model_dump(mode="json") for a in regulation.amendments]
-        )
+    def store_regulations(
+        self,
+        regulations: Iterable[Regulation],
+        batch_size: int = 1000,
+    ) -> int:
+        """Store many regulations using batched transactions.
 
-        record = {
-            "id": reg_id,
-            "title": regulation.citation.title,
-            "part": regulation.citation.part,
-            "section": regulation.citation.section,
-            "heading": regulation.heading,
-            "authority": regulation.authority,
-            "source": regulation.source,
-            "full_text": regulation.full_text,
-            "subsections_json": subsections_json,
-            "effective_date": regulation.effective_date.isoformat(),
-            "source_statutes_json": json.dumps(regulation.source_statutes),
-            "cross_references_json": json.dumps(regulation.cross_references),
-            "amendments_json": amendments_json,
-            "source_url": regulation.source_url,
-            "retrieved_at": (
-                regulation.retrieved_at.isoformat() if regulation.retrieved_at else None
-            ),
-        }
+        FTS triggers are suspended for the duration of the load and
+        regulations_fts is rebuilt once at the end, which is much faster than
+        updating the index row by row.
 
-        # Upsert
-        self.db.execute(
-            """
-            INSERT OR REPLACE INTO regulations (
-                id, title, part, section, heading, authority, source, full_text,
-                subsections_json, effective_date, source_statutes_json,
-                cross_references_json, amendments_json, source_url, retrieved_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                record["id"],
-                record["title"],
-                record["part"],
-                record["section"],
-                record["heading"],
-                record["authority"],
-                record["source"],
-                record["full_text"],
-                record["subsections_json"],
-                record["effective_date"],
-                record["source_statutes_json"],
-                record["cross_references_json"],
-                record["amendments_json"],
-                record["source_url"],
-                record["retrieved_at"],
-            ],
-        )
-        self.db.conn.commit()
+        Args:
+            regulations: Regulations to store (may be a lazy iterator)
+            batch_size: Number of regulations written per transaction
+
+        Returns:
+            Number of regulations stored
+        """
+        count = 0
+        self._begin_bulk_load()
+        try:
+            for batch in _batched(regulations, batch_size):
+                with self.db.conn:
+                    self.db.conn.executemany(
+                        INSERT_REGULATION_SQL, [self._regulation_to_row(r) for r in batch]
+                    )
+                count += len(batch)
+        finally:
+            self._end_bulk_load()
+        return count
 
     def _subsection_to_dict(self, subsec: RegulationSubsection) -> dict:
         """Convert RegulationSubsection to dictionary for JSON."""
@@ -211,15 +360,16 @@ class RegulationStorage:
         Returns:
             Regulation if found, None otherwise
         """
-        row = self.db.execute(
+        cursor = self.db.execute(
             "SELECT * FROM regulations WHERE title = ? AND part = ? AND section = ?",
             [title, part, section],
-        ).fetchone()
+        )
+        row = cursor.fetchone()
 
         if not row:
             return None
 
-        return self._row_to_regulation(row)
+        return self._row_to_regulation(row, _column_names(cursor))
 
     def get_by_citation(self, citation: CFRCitation) -> Optional[Regulation]:
         """Retrieve a regulation by CFR citation.
@@ -234,13 +384,17 @@ class RegulationStorage:
             return None
         return self.get_regulation(citation.title, citation.part, citation.section)
 
-    def _row_to_regulation(self, row: tuple) -> Regulation:
-        """Convert a database row to a Regulation model."""
-        # Get column names
-        cursor = self.db.execute("SELECT * FROM regulations LIMIT 0")
-        columns = [desc[0] for desc in cursor.description]
-        record = dict(zip(columns, row, strict=True))
+    def _row_to_regulation(self, row: tuple, columns: list[str]) -> Regulation:
+        """Convert a database row to a Regulation model.
 
+        Args:
+            row: Row from the regulations table
+            columns: Column names of the row, from its cursor (see _column_names)
+        """
+        return self._record_to_regulation(dict(zip(columns, row, strict=True)))
+
+    def _record_to_regulation(self, record: dict) -> Regulation:
+        """Convert a column-name -> value mapping to a Regulation model."""
         subsections = [
             self._dict_to_subsection(d)
             for d in json.loads(record["subsections_json"] or "[]")
@@ -268,6 +422,201 @@ class RegulationStorage:
             ),
         )
 
+    def part_snapshot_dates(self, title: int, part: int) -> list[date]:
+        """Dates at which a part's history was captured, oldest first."""
+        rows = self.db.execute(
+            """
+            SELECT as_of FROM regulation_snapshots
+            WHERE title = ? AND part = ? ORDER BY as_of
+            """,
+            [title, part],
+        ).fetchall()
+        return [date.fromisoformat(as_of) for (as_of,) in rows]
+
+    def record_part_snapshot(
+        self,
+        title: int,
+        part: int,
+        regulations: Iterable[Regulation],
+        as_of: date,
+    ) -> PartChanges:
+        """Record a part's content at a date, storing only what changed.
+
+        Each regulation's content hash is compared with the open version of
+        its section. A new version is written only for added or changed
+        sections; sections missing from the snapshot have their open
+        version closed. Snapshots must be recorded in date order.
+
+        Args:
+            title: CFR title number
+            part: Part number
+            regulations: Every section of the part as of the date
+            as_of: Date the snapshot describes
+
+        Returns:
+            Changes relative to the previous snapshot
+
+        Raises:
+            ValueError: If a regulation belongs to another part, or the date
+                is not after the part's latest snapshot
+        """
+        starts = as_of.isoformat()
+        with self.db.conn:
+            (latest,) = self.db.conn.execute(
+                "SELECT MAX(as_of) FROM regulation_snapshots WHERE title = ? AND part = ?",
+                [title, part],
+            ).fetchone()
+            if latest is not None and starts <= latest:
+                raise ValueError(
+                    f"{title} CFR {part}: snapshot for {starts} is not after "
+                    f"the latest snapshot ({latest})"
+                )
+
+            current = dict(
+                self.db.conn.execute(
+                    """
+                    SELECT section, content_hash FROM regulation_versions
+                    WHERE title = ? AND part = ? AND valid_to IS NULL
+                    """,
+                    [title, part],
+                ).fetchall()
+            )
+
+            # Later duplicates of a section win, as in the regulations table
+            latest_by_section: dict[str, Regulation] = {}
+            for regulation in regulations:
+                citation = regulation.citation
+                if (citation.title, citation.part) != (title, part):
+                    raise ValueError(f"{regulation.cfr_cite} is not in {title} CFR {part}")
+                latest_by_section[citation.section] = regulation
+
+            changes = PartChanges(
+                title=title,
+                part=part,
+                start=date.fromisoformat(latest) if latest else None,
+                end=as_of,
+            )
+            closes, inserts = [], []
+            for section, regulation in latest_by_section.items():
+                content_hash = regulation.content_hash()
+                if section not in current:
+                    changes.added.append(section)
+                elif current[section] != content_hash:
+                    changes.changed.append(section)
+                    closes.append(section)
+                else:
+                    changes.unchanged += 1
+                    continue
+                inserts.append((starts, None, content_hash, *self._regulation_to_row(regulation)))
+            changes.removed = [s for s in current if s not in latest_by_section]
+            closes.extend(changes.removed)
+
+            self.db.conn.executemany(
+                """
+                UPDATE regulation_versions SET valid_to = ?
+                WHERE title = ? AND part = ? AND section = ? AND valid_to IS NULL
+                """,
+                [(starts, title, part, section) for section in closes],
+            )
+            self.db.conn.executemany(INSERT_VERSION_SQL, inserts)
+            self.db.conn.execute(
+                "INSERT INTO regulation_snapshots (title, part, as_of, section_count) "
+                "VALUES (?, ?, ?, ?)",
+                [title, part, starts, len(latest_by_section)],
+            )
+        return changes
+
+    def clear_part_history(self, title: int, part: int) -> None:
+        """Delete every recorded version and snapshot of a part."""
+        with self.db.conn:
+            for table in ("regulation_versions", "regulation_snapshots"):
+                self.db.conn.execute(
+                    f"DELETE FROM {table} WHERE title = ? AND part = ?", [title, part]
+                )
+
+    def _part_hashes_as_of(self, title: int, part: int, as_of: date) -> dict[str, str]:
+        """Content hash of each section of a part in force on a date."""
+        day = as_of.isoformat()
+        return dict(
+            self.db.execute(
+                """
+                SELECT section, content_hash FROM regulation_versions
+                WHERE title = ? AND part = ? AND valid_from <= ?
+                  AND (valid_to IS NULL OR valid_to > ?)
+                """,
+                [title, part, day, day],
+            ).fetchall()
+        )
+
+    def diff_part(self, title: int, part: int, start: date, end: date) -> PartChanges:
+        """Sections of a part that changed between two dates, from local history.
+
+        Each date resolves to the latest snapshot on or before it, so a
+        change is dated by the first snapshot that saw it, not by its
+        effective date in the Federal Register.
+
+        Args:
+            title: CFR title number
+            part: Part number
+            start: Earlier date
+            end: Later date
+
+        Returns:
+            Sections added, changed and removed between the dates
+
+        Raises:
+            ValueError: If start is after end or precedes the first snapshot
+        """
+        if start > end:
+            raise ValueError(f"Start date {start} is after end date {end}")
+        dates = self.part_snapshot_dates(title, part)
+        if not dates or start < dates[0]:
+            raise ValueError(f"No snapshot of {title} CFR {part} on or before {start}")
+
+        before = self._part_hashes_as_of(title, part, start)
+        after = self._part_hashes_as_of(title, part, end)
+        changes = PartChanges(title=title, part=part, start=start, end=end)
+        for section, content_hash in after.items():
+            if section not in before:
+                changes.added.append(section)
+            elif before[section] != content_hash:
+                changes.changed.append(section)
+            else:
+                changes.unchanged += 1
+        changes.removed = [s for s in before if s not in after]
+        return changes
+
+    def get_regulation_as_of(
+        self,
+        title: int,
+        part: int,
+        section: str,
+        as_of: date,
+    ) -> Optional[Regulation]:
+        """Retrieve a section as recorded in the part history on a date.
+
+        Args:
+            title: CFR title number
+            part: Part number within title
+            section: Section number
+            as_of: Date to look up
+
+        Returns:
+            Regulation in force on the date, or None if there is none
+        """
+        day = as_of.isoformat()
+        row = self.db.execute(
+            f"""
+            SELECT {", ".join(REGULATION_COLUMNS)} FROM regulation_versions
+            WHERE title = ? AND part = ? AND section = ? AND valid_from <= ?
+              AND (valid_to IS NULL OR valid_to > ?)
+            """,
+            [title, part, section, day, day],
+        ).fetchone()
+        if not row:
+            return None
+        return self._record_to_regulation(dict(zip(REGULATION_COLUMNS, row, strict=True)))
+
     def search(
         self,
         query: str,
@@ -327,6 +676,135 @@ class RegulationStorage:
 
         return results
 
+    def search_combined(
+        self,
+        query: str,
+        title: Optional[int] = None,
+        limit: int = 20,
+    ) -> list[CombinedSearchResult]:
+        """Full-text search over US Code sections and CFR regulations together.
+
+        Both FTS indexes are queried in one statement and the hits merged by
+        bm25 score, so "26 USC" and "26 CFR" matches come back as one ranked
+        list. Statutes are only searched when the database also holds the
+        sections table (``arch ingest`` and ``arch ingest-cfr`` into the
+        same file). Scores are computed per index, so term weights reflect
+        each corpus's own statistics.
+
+        Args:
+            query: FTS5 query
+            title: Only match this title number (USC title and CFR title)
+            limit: Maximum results to return
+
+        Returns:
+            Search results from both sources in rank order
+        """
+        arms = [
+            (
+                "regulation",
+                "regulations_fts",
+                "JOIN regulations r ON r.rowid = regulations_fts.rowid",
+                "r.title",
+            )
+        ]
+        if "sections_fts" in self.db.table_names():
+            self._register_statute_text()
+            arms.insert(
+                0,
+                (
+                    "statute",
+                    "sections_fts",
+                    "JOIN sections s ON s.rowid = sections_fts.rowid",
+                    "s.title",
+                ),
+            )
+
+        selects, params = [], []
+        for kind, fts, join, title_column in arms:
+            where = f"{fts} MATCH ?"
+            params.append(query)
+            if title is not None:
+                where += f" AND {title_column} = ?"
+                params.append(title)
+            selects.append(
+                f"SELECT '{kind}' AS kind, {fts}.rowid AS rowid, bm25({fts}) AS score "
+                f"FROM {fts} {join if title is not None else ''} WHERE {where}"
+            )
+        page = self.db.execute(
+            f"""
+            SELECT kind, rowid, score FROM ({" UNION ALL ".join(selects)})
+            ORDER BY score, kind, rowid
+            LIMIT ?
+            """,
+            [*params, limit],
+        ).fetchall()
+
+        details = self._combined_details(
+            query,
+            statute_rowids=[rowid for kind, rowid, _ in page if kind == "statute"],
+            regulation_rowids=[rowid for kind, rowid, _ in page if kind == "regulation"],
+        )
+        return [
+            CombinedSearchResult(
+                doc_type=kind,
+                citation=details[kind, rowid][0],
+                heading=details[kind, rowid][1],
+                snippet=details[kind, rowid][2],
+                score=abs(score),  # BM25 returns negative scores
+            )
+            for kind, rowid, score in page
+        ]
+
+    def _combined_details(
+        self,
+        query: str,
+        statute_rowids: list[int],
+        regulation_rowids: list[int],
+    ) -> dict[tuple[str, int], tuple[str, str, str]]:
+        """Citation, heading and snippet for the rows on a combined results page."""
+        details = {}
+        if statute_rowids:
+            rows = self.db.execute(
+                f"""
+                SELECT sections_fts.rowid, s.title, s.section, s.section_title,
+                       snippet(sections_fts, 1, '<mark>', '</mark>', '...', 32)
+                FROM sections_fts
+                JOIN sections s ON s.rowid = sections_fts.rowid
+                WHERE sections_fts MATCH ?
+                  AND sections_fts.rowid IN ({", ".join("?" * len(statute_rowids))})
+                """,
+                [query, *statute_rowids],
+            ).fetchall()
+            for rowid, title_num, section, heading, snippet in rows:
+                details["statute", rowid] = (f"{title_num} USC {section}", heading, snippet)
+        if regulation_rowids:
+            rows = self.db.execute(
+                f"""
+                SELECT regulations_fts.rowid, r.title, r.part, r.section, r.heading,
+                       snippet(regulations_fts, 1, '<mark>', '</mark>', '...', 32)
+                FROM regulations_fts
+                JOIN regulations r ON r.rowid = regulations_fts.rowid
+                WHERE regulations_fts MATCH ?
+                  AND regulations_fts.rowid IN ({", ".join("?" * len(regulation_rowids))})
+                """,
+                [query, *regulation_rowids],
+            ).fetchall()
+            for rowid, title_num, part, section, heading, snippet in rows:
+                details["regulation", rowid] = (
+                    f"{title_num} CFR {part}.{section}",
+                    heading,
+                    snippet,
+                )
+        return details
+
+    def _register_statute_text(self) -> None:
+        """Let this connection read compressed statute text for snippets."""
+        if self._statute_text_registered:
+            return
+        if "storage_settings" in self.db.table_names():
+            register_text_function(self.db.conn, load_codec(self.db))
+        self._statute_text_registered = True
+
     def list_cfr_titles(self) -> list[dict]:
         """List all CFR titles with metadata.
 
@@ -406,9 +884,10 @@ class RegulationStorage:
         Returns:
             List of Regulation objects
         """
-        rows = self.db.execute(
+        cursor = self.db.execute(
             "SELECT * FROM regulations WHERE title = ? AND part = ? ORDER BY section",
             [title, part],
-        ).fetchall()
+        )
+        columns = _column_names(cursor)
 
-        return [self._row_to_regulation(row) for row in rows]
+        return [self._row_to_regulation(row, columns) for row in cursor.fetchall()]
@@ -0,0 +1,315 @@
+"""Title-sharded SQLite storage.
+
+Each US Code title lives in its own SQLite file (``usc26.db``) under a root
+directory. Titles can then be ingested by parallel processes without sharing a
+writer, and re-ingesting a title rewrites only its shard. Lookups are routed
+to the owning shard; searches fan out to every shard and merge the
+bm25-ranked results.
+
+Example:
+    >>> storage = ShardedStorage("data/atlas")
+    >>> storage.get_section(26, "32")
+    >>> storage.search("child tax credit")
+"""
+
+import heapq
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date
+from itertools import chain, groupby
+from pathlib import Path
+
+from arch.models import (
+    Citation,
+    SearchPage,
+    SearchResult,
+    Section,
+    TitleChanges,
+    TitleInfo,
+)
+from arch.storage.base import StorageBackend
+from arch.storage.sqlite import (
+    DEFAULT_MMAP_SIZE,
+    SQLiteStorage,
+    _decode_cursor,
+    _encode_cursor,
+    matches_scope,
+)
+
+SHARD_PREFIX = "usc"
+
+# Search cursors pack (title, rowid) into one integer so the merged order
+# (score, title, rowid) fits the (score, rowid) cursor format
+ROWID_BITS = 40
+
+
+def shard_path(root: Path | str, title: int) -> Path:
+    """Path of the shard holding a title (e.g. ``root/usc26.db``)."""
+    return Path(root) / f"{SHARD_PREFIX}{title:02d}.db"
+
+
+def open_storage(
+    db_path: Path | str, read_only: bool = False, mmap_size: int = DEFAULT_MMAP_SIZE
+) -> StorageBackend:
+    """Open a database path as single-file or, for a directory, sharded storage."""
+    if Path(db_path).is_dir():
+        return ShardedStorage(db_path, read_only=read_only, mmap_size=mmap_size)
+    return SQLiteStorage(db_path, read_only=read_only, mmap_size=mmap_size)
+
+
+class ShardedStorage(StorageBackend):
+    """SQLite storage split into one database file per title.
+
+    Shards are opened on first use, so a worker process writing one title
+    never touches the other files.
+    """
+
+    def __init__(
+        self,
+        root: Path | str = "atlas",
+        read_only: bool = False,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+    ):
+        """Initialize sharded storage.
+
+        Args:
+            root: Directory holding the shard files (created if missing)
+            read_only: Open shards in read-only mode (see SQLiteStorage)
+            mmap_size: Bytes to memory-map per read-only connection
+        """
+        self.root = Path(root)
+        self.read_only = read_only
+        self.mmap_size = mmap_size
+        if not read_only:
+            self.root.mkdir(parents=True, exist_ok=True)
+        self._shards: dict[int, SQLiteStorage | None] = {}
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Pick up shard files created since the storage was opened."""
+        with self._lock:
+            for path in self.root.glob(f"{SHARD_PREFIX}*.db"):
+                number = path.stem[len(SHARD_PREFIX) :]
+                if number.isdigit():
+                    self._shards.setdefault(int(number), None)
+
+    @property
+    def titles(self) -> list[int]:
+        """Title numbers that have a shard."""
+        return sorted(self._shards)
+
+    def shard(self, title: int, create: bool = False) -> SQLiteStorage | None:
+        """Get the storage for one title's shard.
+
+        Args:
+            title: Title number
+            create: Create the shard if it doesn't exist yet
+
+        Returns:
+            The shard, or None if it doesn't exist and create is False
+        """
+        with self._lock:
+            storage = self._shards.get(title)
+            if storage is None and (title in self._shards or (create and not self.read_only)):
+                storage = self._shards[title] = SQLiteStorage(
+                    shard_path(self.root, title),
+                    read_only=self.read_only,
+                    mmap_size=self.mmap_size,
+                )
+            return storage
+
+    def _all_shards(self) -> Iterator[tuple[int, SQLiteStorage]]:
+        for title in self.titles:
+            storage = self.shard(title)
+            if storage is not None:
+                yield title, storage
+
+    def store_section(self, section: Section, valid_from: date | None = None) -> None:
+        """Store a section in its title's shard."""
+        self.shard(section.citation.title, create=True).store_section(section, valid_from)
+
+    def store_sections(
+        self,
+        sections: Iterable[Section],
+        batch_size: int = 1000,
+        valid_from: date | None = None,
+    ) -> int:
+        """Store many sections, routing each run of a title to its shard."""
+        count = 0
+        for title, run in groupby(sections, key=lambda s: s.citation.title):
+            count += self.shard(title, create=True).store_sections(
+                run, batch_size=batch_size, valid_from=valid_from
+            )
+        return count
+
+    def sync_title(
+        self,
+        title: int,
+        sections: Iterable[Section],
+        valid_from: date | None = None,
+        batch_size: int = 1000,
+    ) -> TitleChanges:
+        """Incrementally sync a title in its shard (see SQLiteStorage.sync_title)."""
+        return self.shard(title, create=True).sync_title(
+            title, sections, valid_from=valid_from, batch_size=batch_size
+        )
+
+    def get_section(
+        self,
+        title: int,
+        section: str,
+        subsection: str | None = None,
+        as_of: date | None = None,
+    ) -> Section | None:
+        """Retrieve a section from its title's shard."""
+        storage = self.shard(title)
+        if storage is None:
+            return None
+        return storage.get_section(title, section, subsection=subsection, as_of=as_of)
+
+    def get_sections(
+        self,
+        citations: Sequence[Citation],
+        as_of: date | None = None,
+    ) -> list[Section | None]:
+        """Retrieve many sections with one batched lookup per shard."""
+        by_title: dict[int, list[int]] = {}
+        for i, citation in enumerate(citations):
+            by_title.setdefault(citation.title, []).append(i)
+
+        found: list[Section | None] = [None] * len(citations)
+        for title, positions in by_title.items():
+            storage = self.shard(title)
+            if storage is None:
+                continue
+            sections = storage.get_sections([citations[i] for i in positions], as_of=as_of)
+            for i, section in zip(positions, sections, strict=True):
+                found[i] = section
+        return found
+
+    def get_title_sections(
+        self, title: int, after: str | None = None, limit: int = 500
+    ) -> list[Section]:
+        """Get one page of a title's sections from its shard."""
+        storage = self.shard(title)
+        return storage.get_title_sections(title, after=after, limit=limit) if storage else []
+
+    def search(
+        self,
+        query: str,
+        title: int | None = None,
+        limit: int = 20,
+    ) -> list[SearchResult]:
+        """Full-text search across all shards."""
+        return self.search_page(query, title=title, limit=limit).results
+
+    def search_page(
+        self,
+        query: str,
+        title: int | None = None,
+        jurisdiction: str | None = None,
+        doc_type: str | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> SearchPage:
+        """Fan a search out to the shards and merge results by bm25 score.
+
+        Each shard returns its best ``limit`` matches after the cursor
+        position; the merged page is ordered by (score, title, rowid), which
+        is also what the cursor encodes. Scores are computed per shard, so
+        term weights reflect each title's own corpus statistics.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if not matches_scope(jurisdiction, doc_type):
+            return SearchPage(results=[], total=0 if include_total else None)
+
+        shards = list(self._all_shards())
+        if title is not None:
+            shards = [(t, s) for t, s in shards if t == title]
+
+        after = None
+        if cursor is not None:
+            last_score, key = _decode_cursor(cursor)
+            after = (last_score, key >> ROWID_BITS, key & ((1 << ROWID_BITS) - 1))
+
+        candidates = []
+        for shard_title, storage in shards:
+            shard_after = None
+            if after is not None:
+                last_score, last_title, last_rowid = after
+                if shard_title < last_title:
+                    shard_after = (last_score, 1 << ROWID_BITS)  # Strictly worse scores only
+                elif shard_title == last_title:
+                    shard_after = (last_score, last_rowid)
+                else:
+                    shard_after = (last_score, -1)  # Ties with the last score still pending
+            candidates.extend(
+                (score, shard_title, rowid, result)
+                for score, rowid, result in storage.search_ranked(
+                    query, limit=limit, after=shard_after
+                )
+            )
+
+        page = heapq.nsmallest(limit, candidates, key=lambda c: c[:3])
+        next_cursor = None
+        if len(page) == limit:
+            last_score, last_title, last_rowid, _ = page[-1]
+            next_cursor = _encode_cursor(last_score, (last_title << ROWID_BITS) | last_rowid)
+
+        total = None
+        if include_total:
+            total = sum(storage.count_matches(query) for _, storage in shards)
+        return SearchPage(
+            results=[result for *_, result in page], next_cursor=next_cursor, total=total
+        )
+
+    def list_titles(self) -> list[TitleInfo]:
+        """List titles from every shard."""
+        return [info for _, storage in self._all_shards() for info in storage.list_titles()]
+
+    def get_references_to(self, title: int, section: str) -> list[str]:
+        """Get sections that this section references."""
+        storage = self.shard(title)
+        return storage.get_references_to(title, section) if storage else []
+
+    def get_referenced_by(self, title: int, section: str) -> list[str]:
+        """Get sections in any shard that reference this section."""
+        return [
+            ref
+            for _, storage in self._all_shards()
+            for ref in storage.get_referenced_by(title, section)
+        ]
+
+    def iter_cross_references(self) -> Iterator[tuple[str, str]]:
+        """Yield cross-reference edges from every shard."""
+        return chain.from_iterable(
+            storage.iter_cross_references() for _, storage in self._all_shards()
+        )
+
+    def iter_section_headings(self) -> Iterator[tuple[str, str]]:
+        """Yield section headings from every shard."""
+        return chain.from_iterable(
+            storage.iter_section_headings() for _, storage in self._all_shards()
+        )
+
+    def cross_reference_fingerprint(self) -> str | None:
+        """Per-shard fingerprints joined in title order."""
+        return ";".join(
+            f"{title}={storage.cross_reference_fingerprint()}"
+            for title, storage in self._all_shards()
+        )
+
+    def data_version(self, title: int | None = None) -> str | None:
+        """Data version of one title's shard, or of every shard if title is None."""
+        if title is not None:
+            storage = self.shard(title)
+            return storage.data_version(title) if storage else "absent"
+        return ";".join(f"{t}={storage.data_version()}" for t, storage in self._all_shards())
+
+    def update_title_metadata(self, title_num: int, name: str, is_positive_law: bool) -> None:
+        """Update metadata for a title in its shard."""
+        self.shard(title_num, create=True).update_title_metadata(title_num, name, is_positive_law)
@@ -1,30 +1,326 @@
 """SQLite storage backend with full-text search."""
 
+import base64
 import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import date
+from itertools import islice
 from pathlib import Path
 
 import sqlite_utils
 
-from arch.models import Citation, SearchResult, Section, Subsection, TitleInfo
+from arch.models import (
+    Citation,
+    SearchPage,
+    SearchResult,
+    Section,
+    Subsection,
+    TitleChanges,
+    TitleInfo,
+)
 from arch.storage.base import StorageBackend
+from arch.storage.compression import DEFAULT_DICT_SIZE, TextCodec
+
+# Columns written for each section, in INSERT order
+SECTION_COLUMNS = (
+    "id",
+    "title",
+    "section",
+    "title_name",
+    "section_title",
+    "text",
+    "subsections_json",
+    "enacted_date",
+    "last_amended",
+    "public_laws_json",
+    "effective_date",
+    "references_to_json",
+    "referenced_by_json",
+    "source_url",
+    "retrieved_at",
+)
+
+# Use INSERT OR REPLACE to handle duplicate (title, section) pairs
+# This can occur when the same section number appears multiple times
+# in the XML with different USLM IDs (e.g., parsing anomalies in Title 10)
+INSERT_SECTION_SQL = f"""
+    INSERT OR REPLACE INTO sections ({", ".join(SECTION_COLUMNS)})
+    VALUES ({", ".join("?" for _ in SECTION_COLUMNS)})
+"""
+
+# Section history: each row is a snapshot of SECTION_COLUMNS that was current
+# for [valid_from, valid_to); valid_to is NULL for the open (latest) version.
+# Snapshots keep the subsection tree in subsections_json.
+VERSION_COLUMNS = ("valid_from", "valid_to", "content_hash", *SECTION_COLUMNS)
+
+INSERT_VERSION_SQL = f"""
+    INSERT OR REPLACE INTO section_versions ({", ".join(VERSION_COLUMNS)})
+    VALUES ({", ".join("?" for _ in VERSION_COLUMNS)})
+"""
+
+# Triggers that count cross-reference writes (see cross_reference_fingerprint)
+CROSS_REFERENCE_TRIGGERS = {
+    event: f"""
+        CREATE TRIGGER IF NOT EXISTS cross_references_count_{event[0].lower()}
+        AFTER {event} ON cross_references BEGIN
+            UPDATE cross_reference_changes SET version = version + 1 WHERE id = 0;
+        END
+    """
+    for event in ("INSERT", "DELETE", "UPDATE")
+}
+
+# Triggers that count writes to a title's rows (see data_version)
+TITLE_VERSION_TRIGGERS = {
+    f"{table}_title_version_{event[0].lower()}": f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_title_version_{event[0].lower()}
+        AFTER {event} ON {table} BEGIN
+            INSERT INTO title_versions (title, version)
+            VALUES ({"old" if event == "DELETE" else "new"}.title, 1)
+            ON CONFLICT (title) DO UPDATE SET version = version + 1;
+        END
+    """
+    for table in ("sections", "subsections", "section_versions")
+    for event in ("INSERT", "DELETE", "UPDATE")
+}
+
+# Subsections are stored one row per node, keyed by a materialized path such
+# as "26/32/a/1"; ordinal is the node's preorder position within its section.
+# Siblings sharing a designation (USLM keeps "so in original" duplicates) get
+# a suffixed path segment ("a~2") so they don't overwrite each other; lookups
+# by designation find the first, as a tree walk would
+DUPLICATE_SEGMENT_SEPARATOR = "~"
+SUBSECTION_COLUMNS = ("path", "title", "section", "ordinal", "identifier", "heading", "text")
+
+INSERT_SUBSECTION_SQL = f"""
+    INSERT OR REPLACE INTO subsections ({", ".join(SUBSECTION_COLUMNS)})
+    VALUES ({", ".join("?" for _ in SUBSECTION_COLUMNS)})
+"""
+
+# Memory-map up to this many bytes of the database file for read connections
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+
+SECTION_SELECT = ", ".join(SECTION_COLUMNS)
+
+# Section metadata only; the text columns are rebuilt from subsection rows
+SECTION_META_SELECT = ", ".join(
+    "NULL" if c in ("text", "subsections_json") else c for c in SECTION_COLUMNS
+)
+
+# (title, section) pairs per batched lookup query; keeps bound parameters
+# well under SQLite's default variable limit
+LOOKUP_CHUNK_SIZE = 400
+
+# Triggers that keep sections_fts in sync with sections, keyed by name so
+# bulk loads can drop and recreate them. {new_text}/{old_text} are the text
+# expressions, which decompress the column when text compression is on.
+FTS_TRIGGERS = {
+    "sections_ai": """
+        CREATE TRIGGER IF NOT EXISTS sections_ai AFTER INSERT ON sections BEGIN
+            INSERT INTO sections_fts(rowid, section_title, text)
+            VALUES (new.rowid, new.section_title, {new_text});
+        END
+    """,
+    "sections_ad": """
+        CREATE TRIGGER IF NOT EXISTS sections_ad AFTER DELETE ON sections BEGIN
+            INSERT INTO sections_fts(sections_fts, rowid, section_title, text)
+            VALUES ('delete', old.rowid, old.section_title, {old_text});
+        END
+    """,
+    "sections_au": """
+        CREATE TRIGGER IF NOT EXISTS sections_au AFTER UPDATE ON sections BEGIN
+            INSERT INTO sections_fts(sections_fts, rowid, section_title, text)
+            VALUES ('delete', old.rowid, old.section_title, {old_text});
+            INSERT INTO sections_fts(rowid, section_title, text)
+            VALUES (new.rowid, new.section_title, {new_text});
+        END
+    """,
+}
+
+# SQL function that decodes a (title, text) column value; registered on every
+# connection so FTS can read compressed text through sections_fts_content
+TEXT_FUNCTION = "arch_text"
+
+# With compressed text, sections_fts is an external-content index over this
+# view, so snippets are built from decompressed text without storing it twice
+FTS_CONTENT_VIEW = f"""
+    CREATE VIEW IF NOT EXISTS sections_fts_content AS
+    SELECT rowid AS rowid, section_title, {TEXT_FUNCTION}(title, text) AS text
+    FROM sections
+"""
+
+
+def _encode_cursor(score: float, rowid: int) -> str:
+    """Encode a (bm25 score, rowid) search position as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps([score, rowid]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[float, int]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        score, rowid = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(score), int(rowid)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid search cursor: {cursor!r}") from e
+
+
+def matches_scope(jurisdiction: str | None, doc_type: str | None) -> bool:
+    """Whether a search scope can match US Code sections."""
+    return jurisdiction in (None, "us", "federal") and doc_type in (None, "statute")
+
+
+def load_codec(db: sqlite_utils.Database) -> TextCodec:
+    """Read the text compression settings stored in a database."""
+    row = db.execute("SELECT value FROM storage_settings WHERE key = 'compression'").fetchone()
+    dictionaries = dict(db.execute("SELECT title, dictionary FROM text_dictionaries").fetchall())
+    return TextCodec(row[0] if row else None, dictionaries)
+
+
+def register_text_function(conn: sqlite3.Connection, codec: TextCodec) -> None:
+    """Register the SQL function that decodes (title, text) column values."""
+    conn.create_function(
+        TEXT_FUNCTION, 2, lambda title, value: codec.decompress(title, value), deterministic=True
+    )
+
+
+# Processes currently bulk loading with an FTS index's triggers dropped
+BULK_LOADS_SQL = """
+    CREATE TABLE IF NOT EXISTS bulk_loads (
+        fts TEXT NOT NULL,
+        pid INTEGER NOT NULL,
+        PRIMARY KEY (fts, pid)
+    )
+"""
+
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process with this pid is running on this host."""
+    if os.name != "posix":
+        # os.kill has no existence probe on Windows (it terminates the process)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def bulk_load_running(db: sqlite_utils.Database, fts: str) -> bool:
+    """Whether a live process is bulk loading into an FTS index.
+
+    Markers left by processes that have exited are deleted; the caller
+    commits.
+    """
+    pids = [
+        pid for (pid,) in db.execute("SELECT pid FROM bulk_loads WHERE fts = ?", [fts]).fetchall()
+    ]
+    stale = [pid for pid in pids if not _process_alive(pid)]
+    db.conn.executemany(
+        "DELETE FROM bulk_loads WHERE fts = ? AND pid = ?", [(fts, pid) for pid in stale]
+    )
+    return len(stale) < len(pids)
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of at most ``size`` items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
 class SQLiteStorage(StorageBackend):
-    """SQLite-based storage with FTS5 full-text search."""
+    """SQLite-based storage with FTS5 full-text search.
+
+    In ``read_only`` mode the database is switched to WAL journaling and each
+    thread gets its own read-only connection (``query_only``, memory-mapped),
+    so many threads can run queries concurrently. This is the mode used by
+    the REST API.
+
+    Text columns can be stored compressed (see set_compression); the format
+    is recorded in the database and decoding is transparent on read.
+    """
 
-    def __init__(self, db_path: Path | str = "atlas.db"):
+    def __init__(
+        self,
+        db_path: Path | str = "atlas.db",
+        read_only: bool = False,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+    ):
         """Initialize SQLite storage.
 
         Args:
             db_path: Path to SQLite database file
+            read_only: Serve reads from per-thread read-only connections
+            mmap_size: Bytes to memory-map per read-only connection
         """
         self.db_path = Path(db_path)
-        self.db = sqlite_utils.Database(str(self.db_path))
+        self.read_only = read_only
+        self.mmap_size = mmap_size
+        self._local = threading.local()
+        self.codec = TextCodec()
+        self._db: sqlite_utils.Database | None = sqlite_utils.Database(str(self.db_path))
+        self._register_functions(self._db.conn)
         self._init_schema()
 
+        if read_only:
+            # WAL lets readers run alongside a writer; the journal mode is
+            # persistent, so it is set once here with the writable connection
+            self._db.enable_wal()
+            self._db.close()
+            self._db = None
+
+    @property
+    def db(self) -> sqlite_utils.Database:
+        """Database handle for the current thread."""
+        if self._db is not None:
+            return self._db
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = self._local.db = self._open_reader()
+        return db
+
+    def _open_reader(self) -> sqlite_utils.Database:
+        """Open a read-only connection tuned for concurrent queries."""
+        conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        self._register_functions(conn)
+        return sqlite_utils.Database(conn)
+
+    def _register_functions(self, conn: sqlite3.Connection) -> None:
+        """Register SQL functions used by the schema on a connection."""
+        conn.create_function(
+            TEXT_FUNCTION,
+            2,
+            lambda title, value: self.codec.decompress(title, value),
+            deterministic=True,
+        )
+
+    def _load_codec(self) -> TextCodec:
+        """Read the text compression settings stored in the database."""
+        return load_codec(self.db)
+
     def _init_schema(self) -> None:
         """Create database tables if they don't exist."""
+        # Storage format settings (e.g. text compression codec)
+        if "storage_settings" not in self.db.table_names():
+            self.db["storage_settings"].create({"key": str, "value": str}, pk="key")
+
+        # Bulk loads in progress (see store_sections)
+        self.db.execute(BULK_LOADS_SQL)
+
+        # Per-title compression dictionaries
+        if "text_dictionaries" not in self.db.table_names():
+            self.db["text_dictionaries"].create(
+                {"title": int, "codec": str, "dictionary": bytes}, pk="title"
+            )
+
+        self.codec = self._load_codec()
+
         # Main sections table
         if "sections" not in self.db.table_names():
             self.db["sections"].create(
@@ -50,58 +346,81 @@ class SQLiteStorage(StorageBackend):
             # Create indexes
             self.db["sections"].create_index(["title", "section"], unique=True, if_not_exists=True)
 
-            # Enable FTS5 full-text search
-            self.db.execute(
-                """
-                CREATE VIRTUAL TABLE IF NOT EXISTS sections_fts USING fts5(
-                    section_title,
-                    text,
-                    content='sections',
-                    content_rowid='rowid'
-                )
-            """
+            # Enable FTS5 full-text search, with triggers to keep it in sync
+            self._create_fts()
+        else:
+            self._repair_fts_triggers()
+
+        # Cross-references table for efficient lookups
+        if "cross_references" not in self.db.table_names():
+            self.db["cross_references"].create(
+                {
+                    "from_title": int,
+                    "from_section": str,
+                    "to_title": int,
+                    "to_section": str,
+                },
+                pk=("from_title", "from_section", "to_title", "to_section"),
             )
+            self.db["cross_references"].create_index(["to_title", "to_section"], if_not_exists=True)
 
-            # Triggers to keep FTS in sync
+        # Counter bumped on every cross-reference insert and delete, so the
+        # graph snapshot fingerprint changes even when references are rewritten
+        # in place with the same row count
+        if "cross_reference_changes" not in self.db.table_names():
             self.db.execute(
-                """
-                CREATE TRIGGER IF NOT EXISTS sections_ai AFTER INSERT ON sections BEGIN
-                    INSERT INTO sections_fts(rowid, section_title, text)
-                    VALUES (new.rowid, new.section_title, new.text);
-                END
-            """
+                "CREATE TABLE cross_reference_changes "
+                "(id INTEGER PRIMARY KEY CHECK (id = 0), version INTEGER NOT NULL)"
             )
+            self.db.execute("INSERT INTO cross_reference_changes VALUES (0, 0)")
+            self.db.conn.commit()
+        for sql in CROSS_REFERENCE_TRIGGERS.values():
+            self.db.execute(sql)
+
+        # Addressable subsection nodes; WITHOUT ROWID clusters rows by path so
+        # a subtree is one contiguous primary-key range
+        if "subsections" not in self.db.table_names():
             self.db.execute(
                 """
-                CREATE TRIGGER IF NOT EXISTS sections_ad AFTER DELETE ON sections BEGIN
-                    INSERT INTO sections_fts(sections_fts, rowid, section_title, text)
-                    VALUES ('delete', old.rowid, old.section_title, old.text);
-                END
+                CREATE TABLE subsections (
+                    path TEXT PRIMARY KEY,
+                    title INTEGER NOT NULL,
+                    section TEXT NOT NULL,
+                    ordinal INTEGER NOT NULL,
+                    identifier TEXT NOT NULL,
+                    heading TEXT,
+                    text TEXT
+                ) WITHOUT ROWID
             """
             )
             self.db.execute(
-                """
-                CREATE TRIGGER IF NOT EXISTS sections_au AFTER UPDATE ON sections BEGIN
-                    INSERT INTO sections_fts(sections_fts, rowid, section_title, text)
-                    VALUES ('delete', old.rowid, old.section_title, old.text);
-                    INSERT INTO sections_fts(rowid, section_title, text)
-                    VALUES (new.rowid, new.section_title, new.text);
-                END
-            """
+                "CREATE INDEX IF NOT EXISTS idx_subsections_section "
+                "ON subsections (title, section, ordinal)"
             )
 
-        # Cross-references table for efficient lookups
-        if "cross_references" not in self.db.table_names():
-            self.db["cross_references"].create(
+        # Point-in-time history of section content
+        if "section_versions" not in self.db.table_names():
+            self.db["section_versions"].create(
                 {
-                    "from_title": int,
-                    "from_section": str,
-                    "to_title": int,
-                    "to_section": str,
+                    "valid_from": str,
+                    "valid_to": str,
+                    "content_hash": str,
+                    **{c: (int if c == "title" else str) for c in SECTION_COLUMNS},
                 },
-                pk=("from_title", "from_section", "to_title", "to_section"),
             )
-            self.db["cross_references"].create_index(["to_title", "to_section"], if_not_exists=True)
+            # Finds the version covering a date with one index seek
+            self.db["section_versions"].create_index(
+                ["title", "section", "valid_from"], unique=True, if_not_exists=True
+            )
+
+        # Write counter per title, bumped by triggers on every row written, so
+        # data_version changes exactly when a title's content does
+        if "title_versions" not in self.db.table_names():
+            self.db.execute(
+                "CREATE TABLE title_versions (title INTEGER PRIMARY KEY, version INTEGER NOT NULL)"
+            )
+        for sql in TITLE_VERSION_TRIGGERS.values():
+            self.db.execute(sql)
 
         # Title metadata
         if "titles" not in self.db.table_names():
@@ -116,66 +435,528 @@ class SQLiteStorage(StorageBackend):
                 pk="number",
             )
 
-    def store_section(self, section: Section) -> None:
-        """Store a section in the database."""
-        # Serialize subsections to JSON
-        subsections_json = json.dumps([self._subsection_to_dict(s) for s in section.subsections])
-
-        record = {
-            "id": section.uslm_id or f"{section.citation.title}/{section.citation.section}",
-            "title": section.citation.title,
-            "section": section.citation.section,
-            "title_name": section.title_name,
-            "section_title": section.section_title,
-            "text": section.text,
-            "subsections_json": subsections_json,
-            "enacted_date": section.enacted_date.isoformat() if section.enacted_date else None,
-            "last_amended": section.last_amended.isoformat() if section.last_amended else None,
-            "public_laws_json": json.dumps(section.public_laws),
-            "effective_date": (
-                section.effective_date.isoformat() if section.effective_date else None
-            ),
-            "references_to_json": json.dumps(section.references_to),
-            "referenced_by_json": json.dumps(section.referenced_by),
-            "source_url": section.source_url,
-            "retrieved_at": section.retrieved_at.isoformat(),
-        }
+    def _create_fts(self) -> None:
+        """Create sections_fts and its sync triggers for the current text format.
 
-        # Use INSERT OR REPLACE to handle duplicate (title, section) pairs
-        # This can occur when the same section number appears multiple times
-        # in the XML with different USLM IDs (e.g., parsing anomalies in Title 10)
+        Plain text is indexed straight from the sections table; compressed
+        text is indexed through the decompressing sections_fts_content view.
+        """
+        content = "sections"
+        if self.codec.name is not None:
+            self.db.execute(FTS_CONTENT_VIEW)
+            content = "sections_fts_content"
         self.db.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS sections_fts USING fts5(
+                section_title,
+                text,
+                content='{content}',
+                content_rowid='rowid'
+            )
+        """
+        )
+        self._create_fts_triggers()
+
+    def _create_fts_triggers(self) -> None:
+        """Create the triggers that keep sections_fts in sync."""
+        if self.codec.name is None:
+            texts = {"new_text": "new.text", "old_text": "old.text"}
+        else:
+            texts = {
+                "new_text": f"{TEXT_FUNCTION}(new.title, new.text)",
+                "old_text": f"{TEXT_FUNCTION}(old.title, old.text)",
+            }
+        for sql in FTS_TRIGGERS.values():
+            self.db.execute(sql.format(**texts))
+
+    def _drop_fts_triggers(self) -> None:
+        """Drop the FTS sync triggers (used during bulk loads)."""
+        for name in FTS_TRIGGERS:
+            self.db.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    def _repair_fts_triggers(self) -> None:
+        """Restore FTS sync triggers left dropped by an interrupted bulk load.
+
+        store_sections drops the triggers for the duration of a load and
+        records its pid in bulk_loads; if the process dies before its finally
+        block, the index has neither the triggers nor the rows written so far.
+        Both are restored here, unless the loader is still running.
+        """
+        present = {
+            name
+            for (name,) in self.db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+            ).fetchall()
+        }
+        if present.issuperset(FTS_TRIGGERS):
+            return
+        conn = self.db.conn
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if bulk_load_running(self.db, "sections_fts"):
+                return
+            self._create_fts_triggers()
+            conn.execute("INSERT INTO sections_fts(sections_fts) VALUES ('rebuild')")
+
+    def _begin_bulk_load(self) -> None:
+        """Drop the FTS sync triggers and record this process as loading."""
+        conn = self.db.conn
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO bulk_loads (fts, pid) VALUES ('sections_fts', ?)",
+                [os.getpid()],
+            )
+            self._drop_fts_triggers()
+
+    def _end_bulk_load(self) -> None:
+        """Restore the FTS sync triggers, rebuild sections_fts and clear the marker."""
+        conn = self.db.conn
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "DELETE FROM bulk_loads WHERE fts = 'sections_fts' AND pid = ?", [os.getpid()]
+            )
+            self._create_fts_triggers()
+            conn.execute("INSERT INTO sections_fts(sections_fts) VALUES ('rebuild')")
+
+    def rebuild_fts(self) -> None:
+        """Rebuild the sections_fts index from the sections table."""
+        self.db.execute("INSERT INTO sections_fts(sections_fts) VALUES ('rebuild')")
+        self.db.conn.commit()
+
+    def set_compression(
+        self,
+        codec: str | None,
+        dict_size: int = DEFAULT_DICT_SIZE,
+        sample_size: int = 2000,
+        batch_size: int = 1000,
+    ) -> None:
+        """Convert all stored text to another format.
+
+        Trains a dictionary per title from a sample of its section and
+        subsection texts, rewrites every text column in one transaction,
+        re-points sections_fts at the plain or decompressing content source
+        and rebuilds it, then vacuums to release the freed pages.
+
+        Args:
+            codec: "zlib", "zstd", or None for plain text
+            dict_size: Target dictionary size per title in bytes
+            sample_size: Texts sampled per title to train its dictionary
+            batch_size: Rows rewritten per statement
+
+        Raises:
+            ValueError: If the storage is read-only or the codec is unavailable
+
+        Example:
+            >>> SQLiteStorage("atlas.db").set_compression("zstd")
+        """
+        if self.read_only:
+            raise ValueError("Cannot change the storage format of a read-only database")
+        old, new = self.codec, TextCodec(codec)
+
+        if codec is not None:
+            for (title,) in self.db.execute("SELECT DISTINCT title FROM sections").fetchall():
+                rows = self.db.execute(
+                    """
+                    SELECT text FROM sections WHERE title = ?
+                    UNION ALL
+                    SELECT text FROM subsections WHERE title = ?
+                    LIMIT ?
+                    """,
+                    [title, title, sample_size],
+                ).fetchall()
+                samples = [old.decompress(title, text) for (text,) in rows if text]
+                new.train(title, samples, dict_size)
+
+        conn = self.db.conn
+        with conn:
+            conn.execute("BEGIN")
+            self._drop_fts_triggers()
+            conn.execute("DROP TABLE IF EXISTS sections_fts")
+            conn.execute("DROP VIEW IF EXISTS sections_fts_content")
+
+            self._recode_table("sections", "rowid", ("text", "subsections_json"), new, batch_size)
+            self._recode_table("subsections", "path", ("text",), new, batch_size)
+            self._recode_table(
+                "section_versions", "rowid", ("text", "subsections_json"), new, batch_size
+            )
+
+            conn.execute("DELETE FROM text_dictionaries")
+            conn.executemany(
+                "INSERT INTO text_dictionaries (title, codec, dictionary) VALUES (?, ?, ?)",
+                [(title, codec, d) for title, d in new.dictionaries.items()],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO storage_settings (key, value) VALUES ('compression', ?)",
+                [codec],
+            )
+
+            self.codec = new
+            self._create_fts()
+            conn.execute("INSERT INTO sections_fts(sections_fts) VALUES ('rebuild')")
+
+        self.db.execute("VACUUM")
+
+    def _recode_table(
+        self,
+        table: str,
+        key: str,
+        columns: tuple[str, ...],
+        new: TextCodec,
+        batch_size: int,
+    ) -> None:
+        """Re-encode text columns of a table from self.codec to ``new``.
+
+        Walks the table in key order so rows are never read while being
+        rewritten. Runs inside the caller's transaction; does not commit.
+        """
+        last = None
+        while True:
+            where = f"WHERE {key} > ?" if last is not None else ""
+            rows = self.db.conn.execute(
+                f"""
+                SELECT {key}, title, {", ".join(columns)} FROM {table}
+                {where} ORDER BY {key} LIMIT ?
+                """,
+                [last, batch_size] if last is not None else [batch_size],
+            ).fetchall()
+            if not rows:
+                return
+            self.db.conn.executemany(
+                f"UPDATE {table} SET {', '.join(f'{c} = ?' for c in columns)} WHERE {key} = ?",
+                [
+                    (
+                        *(new.compress(title, self.codec.decompress(title, v)) for v in values),
+                        row_key,
+                    )
+                    for row_key, title, *values in rows
+                ],
+            )
+            last = rows[-1][0]
+
+    def _section_to_row(self, section: Section) -> tuple:
+        """Convert a Section to a row tuple matching SECTION_COLUMNS.
+
+        Subsections are stored as rows in the subsections table, so
+        subsections_json is left empty (it is only read for legacy rows).
+        """
+        return (
+            section.uslm_id or f"{section.citation.title}/{section.citation.section}",
+            section.citation.title,
+            section.citation.section,
+            section.title_name,
+            section.section_title,
+            self.codec.compress(section.citation.title, section.text),
+            None,
+            section.enacted_date.isoformat() if section.enacted_date else None,
+            section.last_amended.isoformat() if section.last_amended else None,
+            json.dumps(section.public_laws),
+            section.effective_date.isoformat() if section.effective_date else None,
+            json.dumps(section.references_to),
+            json.dumps(section.referenced_by),
+            section.source_url,
+            section.retrieved_at.isoformat(),
+        )
+
+    def store_section(self, section: Section, valid_from: date | None = None) -> None:
+        """Store a section in the database.
+
+        Args:
+            section: Section to store
+            valid_from: Date this text took effect; a new version is recorded
+                only if the content changed. Defaults to section.retrieved_at,
+                the day the text was fetched, so callers that know when it took
+                effect (e.g. a release point's date) should pass it
+        """
+        with self.db.conn:
+            self.db.conn.execute(INSERT_SECTION_SQL, self._section_to_row(section))
+            self._replace_subsections([section])
+            self._replace_cross_references([section])
+            self._append_versions([section], valid_from)
+
+    def store_sections(
+        self,
+        sections: Iterable[Section],
+        batch_size: int = 1000,
+        valid_from: date | None = None,
+    ) -> int:
+        """Store many sections using batched transactions.
+
+        FTS triggers are suspended for the duration of the load and
+        sections_fts is rebuilt once at the end, which is much faster than
+        updating the index row by row.
+
+        Args:
+            sections: Sections to store (may be a lazy iterator)
+            batch_size: Number of sections written per transaction
+            valid_from: Date this text took effect (default: each section's
+                retrieved_at); see store_section. Arch.ingest_title passes
+                the release point's date
+
+        Returns:
+            Number of sections stored
+        """
+        count = 0
+        self._begin_bulk_load()
+        try:
+            for batch in _batched(sections, batch_size):
+                with self.db.conn:
+                    self.db.conn.executemany(
+                        INSERT_SECTION_SQL, [self._section_to_row(s) for s in batch]
+                    )
+                    self._replace_subsections(batch)
+                    self._replace_cross_references(batch)
+                    self._append_versions(batch, valid_from)
+                count += len(batch)
+        finally:
+            self._end_bulk_load()
+        return count
+
+    def sync_title(
+        self,
+        title: int,
+        sections: Iterable[Section],
+        valid_from: date | None = None,
+        batch_size: int = 1000,
+    ) -> TitleChanges:
+        """Bring a stored title in line with a new parse, writing only what changed.
+
+        Each parsed section's content hash is compared with the hash of its
+        open version. Added and changed sections are rewritten with the FTS
+        triggers in place, so the index is updated row by row rather than
+        rebuilt; sections missing from the parse are deleted and their open
+        version is closed. Unchanged sections are not touched.
+
+        Args:
+            title: Title number being synced
+            sections: Every section of the title in the new parse (may be a
+                lazy iterator)
+            valid_from: Date the new text took effect (default: each section's
+                retrieved_at, and today for removals)
+            batch_size: Number of changed sections written per transaction
+
+        Returns:
+            TitleChanges listing the added, changed and removed sections
+
+        Raises:
+            ValueError: If a section belongs to another title, or a change
+                predates the stored version
+        """
+        stored: dict[str, str | None] = dict(
+            self.db.execute(
+                """
+                SELECT s.section, v.content_hash FROM sections s
+                LEFT JOIN section_versions v
+                    ON v.title = s.title AND v.section = s.section AND v.valid_to IS NULL
+                WHERE s.title = ?
+                ORDER BY s.rowid
+                """,
+                [title],
+            ).fetchall()
+        )
+        existed = set(stored)
+        changes = TitleChanges(title=title, valid_from=valid_from)
+        seen: set[str] = set()
+        pending: dict[str, tuple[Section, str]] = {}
+
+        def flush() -> None:
+            batch = [section for section, _ in pending.values()]
+            with self.db.conn:
+                # Delete first so the FTS delete trigger fires; INSERT OR
+                # REPLACE removes the old row without running it
+                self.db.conn.executemany(
+                    "DELETE FROM sections WHERE title = ? AND section = ?",
+                    [(title, number) for number in pending],
+                )
+                self.db.conn.executemany(
+                    INSERT_SECTION_SQL, [self._section_to_row(s) for s in batch]
+                )
+                self._replace_subsections(batch)
+                self._replace_cross_references(batch)
+                self._append_versions(batch, valid_from)
+            for number, (_, content_hash) in pending.items():
+                if number not in changes.content_hashes:
+                    (changes.changed if number in existed else changes.added).append(number)
+                changes.content_hashes[number] = content_hash
+                stored[number] = content_hash
+            pending.clear()
+
+        for section in sections:
+            if section.citation.title != title:
+                raise ValueError(
+                    f"Section {section.citation.usc_cite} does not belong to title {title}"
+                )
+            number = section.citation.section
+            seen.add(number)
+            content_hash = section.content_hash()
+            if content_hash == stored.get(number):
+                # A later duplicate matching the stored text cancels an earlier one
+                pending.pop(number, None)
+                continue
+            pending[number] = (section, content_hash)
+            if len(pending) >= batch_size:
+                flush()
+        if pending:
+            flush()
+
+        changes.removed = [number for number in stored if number not in seen]
+        if changes.removed:
+            self._remove_sections(title, changes.removed, valid_from or date.today())
+        changes.unchanged = len(seen) - len(changes.content_hashes)
+        return changes
+
+    def _remove_sections(self, title: int, numbers: list[str], valid_to: date) -> None:
+        """Delete sections and close their open versions at valid_to.
+
+        Raises:
+            ValueError: If valid_to predates a section's open version
+        """
+        ends = valid_to.isoformat()
+        keys = [(title, number) for number in numbers]
+        for (_, number), (open_from, _) in self._open_versions(keys).items():
+            if ends < open_from:
+                raise ValueError(
+                    f"{title} USC {number}: removal on {ends} predates "
+                    f"stored version from {open_from}"
+                )
+        with self.db.conn:
+            self.db.conn.executemany("DELETE FROM sections WHERE title = ? AND section = ?", keys)
+            self.db.conn.executemany(
+                "DELETE FROM subsections WHERE title = ? AND section = ?", keys
+            )
+            self.db.conn.executemany(
+                "DELETE FROM cross_references WHERE from_title = ? AND from_section = ?", keys
+            )
+            self.db.conn.executemany(
+                """
+                UPDATE section_versions SET valid_to = ?
+                WHERE title = ? AND section = ? AND valid_to IS NULL
+                """,
+                [(ends, *key) for key in keys],
+            )
+
+    def _open_versions(self, keys: list[tuple[int, str]]) -> dict[tuple[int, str], tuple]:
+        """Get (valid_from, content_hash) of the open version for each key."""
+        found = {}
+        for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+            chunk = keys[start : start + LOOKUP_CHUNK_SIZE]
+            values = ", ".join("(?, ?)" for _ in chunk)
+            rows = self.db.conn.execute(
+                f"""
+                WITH wanted(title, section) AS (VALUES {values})
+                SELECT v.title, v.section, v.valid_from, v.content_hash
+                FROM wanted
+                JOIN section_versions v ON v.title = wanted.title AND v.section = wanted.section
+                WHERE v.valid_to IS NULL
+                """,
+                [v for key in chunk for v in key],
+            ).fetchall()
+            for title, section, valid_from, content_hash in rows:
+                found[(title, section)] = (valid_from, content_hash)
+        return found
+
+    def _append_versions(self, sections: list[Section], valid_from: date | None) -> None:
+        """Record a new version for each section whose content hash changed.
+
+        Versions must be appended in chronological order. Runs inside the
+        caller's transaction; does not commit.
+        """
+        # Later duplicates of a (title, section) win, as in the sections table
+        latest = {(s.citation.title, s.citation.section): s for s in sections}
+        current = self._open_versions(list(latest))
+
+        closes, inserts = [], []
+        for key, section in latest.items():
+            starts = (valid_from or section.retrieved_at).isoformat()
+            content_hash = section.content_hash()
+            if key in current:
+                open_from, open_hash = current[key]
+                if open_hash == content_hash:
+                    continue
+                if starts < open_from:
+                    raise ValueError(
+                        f"{key[0]} USC {key[1]}: version from {starts} predates "
+                        f"stored version from {open_from}"
+                    )
+                if starts > open_from:
+                    closes.append((starts, *key, open_from))
+                # Same start date: the new content replaces the open version
+
+            row = list(self._section_to_row(section))
+            row[SECTION_COLUMNS.index("subsections_json")] = self.codec.compress(
+                section.citation.title,
+                json.dumps([self._subsection_to_dict(s) for s in section.subsections]),
+            )
+            inserts.append((starts, None, content_hash, *row))
+
+        self.db.conn.executemany(
             """
-            INSERT OR REPLACE INTO sections (
-                id, title, section, title_name, section_title, text,
-                subsections_json, enacted_date, last_amended, public_laws_json,
-                effective_date, references_to_json, referenced_by_json,
-                source_url, retrieved_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            UPDATE section_versions SET valid_to = ?
+            WHERE title = ? AND section = ? AND valid_from = ?
             """,
-            [
-                record["id"],
-                record["title"],
-                record["section"],
-                record["title_name"],
-                record["section_title"],
-                record["text"],
-                record["subsections_json"],
-                record["enacted_date"],
-                record["last_amended"],
-                record["public_laws_json"],
-                record["effective_date"],
-                record["references_to_json"],
-                record["referenced_by_json"],
-                record["source_url"],
-                record["retrieved_at"],
-            ],
+            closes,
         )
-        # Commit after raw execute (sqlite_utils methods auto-commit, but execute doesn't)
-        self.db.conn.commit()
+        self.db.conn.executemany(INSERT_VERSION_SQL, inserts)
+
+    def _subsection_rows(self, section: Section) -> list[tuple]:
+        """Flatten a section's subsection tree into rows in preorder."""
+        title, section_num = section.citation.title, section.citation.section
+        rows: list[tuple] = []
+
+        def walk(subsections: list[Subsection], prefix: str) -> None:
+            seen: dict[str, int] = {}
+            for sub in subsections:
+                seen[sub.identifier] = count = seen.get(sub.identifier, 0) + 1
+                segment = sub.identifier
+                if count > 1:
+                    segment += f"{DUPLICATE_SEGMENT_SEPARATOR}{count}"
+                path = f"{prefix}/{segment}"
+                text = self.codec.compress(title, sub.text)
+                rows.append(
+                    (path, title, section_num, len(rows), sub.identifier, sub.heading, text)
+                )
+                walk(sub.children, path)
 
-        # Update cross-references
-        self._update_cross_references(section)
+        walk(section.subsections, f"{title}/{section_num}")
+        return rows
+
+    def _replace_subsections(self, sections: list[Section]) -> None:
+        """Replace subsection rows for a batch of sections.
+
+        Runs inside the caller's transaction; does not commit.
+        """
+        self.db.conn.executemany(
+            "DELETE FROM subsections WHERE title = ? AND section = ?",
+            [(s.citation.title, s.citation.section) for s in sections],
+        )
+        self.db.conn.executemany(
+            INSERT_SUBSECTION_SQL, [row for s in sections for row in self._subsection_rows(s)]
+        )
+
+    def _build_subsection_tree(self, title: int, rows: Iterable[tuple]) -> list[Subsection]:
+        """Reassemble (path, identifier, heading, text) rows given in preorder."""
+        nodes: dict[str, Subsection] = {}
+        roots: list[Subsection] = []
+        for path, identifier, heading, text in rows:
+            text = self.codec.decompress(title, text)
+            node = Subsection(identifier=identifier, heading=heading, text=text or "")
+            nodes[path] = node
+            parent = nodes.get(path.rsplit("/", 1)[0])
+            (parent.children if parent else roots).append(node)
+        return roots
+
+    def _load_subsections(self, title: int, section: str) -> list[Subsection]:
+        """Load a section's full subsection tree in one index range scan."""
+        rows = self.db.execute(
+            """
+            SELECT path, identifier, heading, text FROM subsections
+            WHERE title = ? AND section = ?
+            ORDER BY ordinal
+            """,
+            [title, section],
+        ).fetchall()
+        return self._build_subsection_tree(title, rows)
 
     def _subsection_to_dict(self, sub: Subsection) -> dict:
         """Convert Subsection to dictionary for JSON serialization."""
@@ -195,29 +976,40 @@ class SQLiteStorage(StorageBackend):
             children=[self._dict_to_subsection(c) for c in d.get("children", [])],
         )
 
-    def _update_cross_references(self, section: Section) -> None:
-        """Update cross-reference table for a section."""
-        # Remove existing references from this section
-        self.db.execute(
-            "DELETE FROM cross_references WHERE from_title = ? AND from_section = ?",
-            [section.citation.title, section.citation.section],
-        )
-
-        # Add new references
+    def _cross_reference_rows(self, section: Section) -> list[tuple]:
+        """Build cross_references rows for a section's outgoing references."""
+        rows = []
         for ref in section.references_to:
             try:
                 ref_citation = Citation.from_string(ref)
-                self.db["cross_references"].insert(
-                    {
-                        "from_title": section.citation.title,
-                        "from_section": section.citation.section,
-                        "to_title": ref_citation.title,
-                        "to_section": ref_citation.section,
-                    },
-                    ignore=True,
-                )
             except ValueError:
-                pass  # Skip malformed references
+                continue  # Skip malformed references
+            rows.append(
+                (
+                    section.citation.title,
+                    section.citation.section,
+                    ref_citation.title,
+                    ref_citation.section,
+                )
+            )
+        return rows
+
+    def _replace_cross_references(self, sections: list[Section]) -> None:
+        """Replace cross-references for a batch of sections.
+
+        Runs inside the caller's transaction; does not commit.
+        """
+        self.db.conn.executemany(
+            "DELETE FROM cross_references WHERE from_title = ? AND from_section = ?",
+            [(s.citation.title, s.citation.section) for s in sections],
+        )
+        self.db.conn.executemany(
+            """
+            INSERT OR IGNORE INTO cross_references (from_title, from_section, to_title, to_section)
+            VALUES (?, ?, ?, ?)
+            """,
+            [row for s in sections for row in self._cross_reference_rows(s)],
+        )
 
     def get_section(
         self,
@@ -226,34 +1018,217 @@ class SQLiteStorage(StorageBackend):
         subsection: str | None = None,
         as_of: date | None = None,
     ) -> Section | None:
-        """Retrieve a section by citation."""
-        # TODO: Implement historical versions (as_of parameter)
+        """Retrieve a section by citation.
+
+        If ``subsection`` is given (e.g. "a/1"), only that node and its
+        descendants are read, and the returned Section holds just that subtree.
+        If ``as_of`` is given, the version in effect on that date is returned.
+        """
+        if as_of is not None:
+            return self._get_version(title, section, subsection, as_of)
+
+        if subsection:
+            return self._get_subtree(title, section, subsection)
+
         row = self.db.execute(
-            "SELECT * FROM sections WHERE title = ? AND section = ?", [title, section]
+            f"SELECT {SECTION_SELECT} FROM sections WHERE title = ? AND section = ?",
+            [title, section],
         ).fetchone()
 
         if not row:
             return None
 
         # Convert row to Section
-        return self._row_to_section(row)
+        return self._row_to_section(row, self._load_subsections(title, section))
+
+    def _get_subtree(self, title: int, section: str, subsection: str) -> Section | None:
+        """Retrieve a single subsection node and its descendants."""
+        row = self.db.execute(
+            f"SELECT {SECTION_META_SELECT} FROM sections WHERE title = ? AND section = ?",
+            [title, section],
+        ).fetchone()
+        if not row:
+            return None
+
+        subsection = subsection.strip("/")
+        path = f"{title}/{section}/{subsection}"
+        rows = self.db.execute(
+            """
+            SELECT path, identifier, heading, text FROM subsections
+            WHERE path = ? OR (path >= ? AND path < ?)
+            ORDER BY ordinal
+            """,
+            [path, f"{path}/", f"{path}0"],  # "0" sorts right after "/"
+        ).fetchall()
+
+        if rows:
+            nodes = self._build_subsection_tree(title, rows)
+        else:
+            # Legacy rows keep the tree in subsections_json
+            node = self._find_subsection(
+                self._load_subsections_json(title, section), subsection.split("/")
+            )
+            if node is None:
+                return None
+            nodes = [node]
+
+        return self._row_to_section(
+            row,
+            nodes,
+            subsection=subsection,
+            text="\n".join(t for t in self._iter_subsection_text(nodes) if t),
+        )
+
+    def _get_version(
+        self, title: int, section: str, subsection: str | None, as_of: date
+    ) -> Section | None:
+        """Retrieve the version of a section in effect on ``as_of``."""
+        row = self.db.execute(
+            f"""
+            SELECT valid_to, {SECTION_SELECT} FROM section_versions
+            WHERE title = ? AND section = ? AND valid_from <= ?
+            ORDER BY valid_from DESC
+            LIMIT 1
+            """,
+            [title, section, as_of.isoformat()],
+        ).fetchone()
+        if not row or (row[0] is not None and row[0] <= as_of.isoformat()):
+            return None
+
+        version = self._row_to_section(row[1:], [])
+        if not subsection:
+            return version
 
-    def _row_to_section(self, row: tuple) -> Section:
-        """Convert a database row to a Section model."""
-        # Get column names
-        cursor = self.db.execute("SELECT * FROM sections LIMIT 0")
-        columns = [desc[0] for desc in cursor.description]
-        record = dict(zip(columns, row, strict=True))
+        subsection = subsection.strip("/")
+        node = self._find_subsection(version.subsections, subsection.split("/"))
+        if node is None:
+            return None
+        return self._row_to_section(
+            row[1:],
+            [node],
+            subsection=subsection,
+            text="\n".join(t for t in self._iter_subsection_text([node]) if t),
+        )
+
+    def _load_subsections_json(self, title: int, section: str) -> list[Subsection]:
+        """Decode the legacy subsections_json blob for a section."""
+        row = self.db.execute(
+            "SELECT subsections_json FROM sections WHERE title = ? AND section = ?",
+            [title, section],
+        ).fetchone()
+        payload = self.codec.decompress(title, row[0]) if row else None
+        return [self._dict_to_subsection(d) for d in json.loads(payload or "[]")]
+
+    @staticmethod
+    def _find_subsection(subsections: list[Subsection], parts: list[str]) -> Subsection | None:
+        """Walk a subsection tree along identifier path parts."""
+        node = None
+        for part in parts:
+            node = next((s for s in subsections if s.identifier == part), None)
+            if node is None:
+                return None
+            subsections = node.children
+        return node
+
+    @classmethod
+    def _iter_subsection_text(cls, subsections: list[Subsection]) -> Iterator[str]:
+        """Yield subsection texts in document order."""
+        for sub in subsections:
+            yield sub.text
+            yield from cls._iter_subsection_text(sub.children)
 
-        subsections = [
-            self._dict_to_subsection(d) for d in json.loads(record["subsections_json"] or "[]")
+    def get_sections(
+        self,
+        citations: Sequence[Citation],
+        as_of: date | None = None,
+    ) -> list[Section | None]:
+        """Retrieve many sections with one indexed query per chunk of citations.
+
+        Citations that name a subsection, and historical (``as_of``) lookups,
+        are resolved individually.
+        """
+        if as_of is not None:
+            return [
+                self.get_section(c.title, c.section, subsection=c.subsection, as_of=as_of)
+                for c in citations
+            ]
+
+        keys = list(dict.fromkeys((c.title, c.section) for c in citations if not c.subsection))
+        found: dict[tuple[int, str], Section] = {}
+
+        for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+            chunk = keys[start : start + LOOKUP_CHUNK_SIZE]
+            values = ", ".join("(?, ?)" for _ in chunk)
+            params = [v for key in chunk for v in key]
+            rows = self.db.execute(
+                f"""
+                WITH wanted(title, section) AS (VALUES {values})
+                SELECT {", ".join(f"s.{c}" for c in SECTION_COLUMNS)}
+                FROM wanted
+                JOIN sections s ON s.title = wanted.title AND s.section = wanted.section
+                """,
+                params,
+            ).fetchall()
+            sub_rows = self.db.execute(
+                f"""
+                WITH wanted(title, section) AS (VALUES {values})
+                SELECT ss.title, ss.section, ss.path, ss.identifier, ss.heading, ss.text
+                FROM wanted
+                JOIN subsections ss ON ss.title = wanted.title AND ss.section = wanted.section
+                ORDER BY ss.title, ss.section, ss.ordinal
+                """,
+                params,
+            ).fetchall()
+
+            grouped: dict[tuple[int, str], list[tuple]] = {}
+            for title, section, *node in sub_rows:
+                grouped.setdefault((title, section), []).append(tuple(node))
+
+            for row in rows:
+                key = (row[SECTION_COLUMNS.index("title")], row[SECTION_COLUMNS.index("section")])
+                found[key] = self._row_to_section(
+                    row, self._build_subsection_tree(key[0], grouped.get(key, []))
+                )
+
+        return [
+            self.get_section(c.title, c.section, subsection=c.subsection)
+            if c.subsection
+            else found.get((c.title, c.section))
+            for c in citations
         ]
 
+    def _row_to_section(
+        self,
+        row: tuple,
+        subsections: list[Subsection],
+        subsection: str | None = None,
+        text: str | None = None,
+    ) -> Section:
+        """Convert a row selected with SECTION_SELECT to a Section model.
+
+        Args:
+            row: Row aligned with SECTION_COLUMNS
+            subsections: Subsection tree loaded from the subsections table
+            subsection: Subsection path when the Section holds only a subtree
+            text: Text to use instead of the row's text column
+        """
+        record = dict(zip(SECTION_COLUMNS, row, strict=True))
+        for column in ("text", "subsections_json"):
+            record[column] = self.codec.decompress(record["title"], record[column])
+
+        # Rows written before subsections were stored individually
+        if not subsections and record["subsections_json"]:
+            subsections = [
+                self._dict_to_subsection(d) for d in json.loads(record["subsections_json"])
+            ]
+
         return Section(
-            citation=Citation(title=record["title"], section=record["section"]),
+            citation=Citation(
+                title=record["title"], section=record["section"], subsection=subsection
+            ),
             title_name=record["title_name"],
             section_title=record["section_title"],
-            text=record["text"],
+            text=record["text"] if text is None else text,
             subsections=subsections,
             enacted_date=(
                 date.fromisoformat(record["enacted_date"]) if record["enacted_date"] else None
@@ -279,44 +1254,180 @@ class SQLiteStorage(StorageBackend):
         limit: int = 20,
     ) -> list[SearchResult]:
         """Full-text search across sections."""
+        return self.search_page(query, title=title, limit=limit).results
+
+    def search_page(
+        self,
+        query: str,
+        title: int | None = None,
+        jurisdiction: str | None = None,
+        doc_type: str | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> SearchPage:
+        """Full-text search with keyset pagination on (bm25 score, rowid).
+
+        Each page resumes after the last (score, rowid) of the previous one,
+        so deep pages never materialize and discard earlier rows the way
+        OFFSET does. Snippets are only generated for the rows returned.
+
+        Args:
+            query: FTS5 query
+            title: Only match sections in this title
+            jurisdiction: Only match this jurisdiction ("us"/"federal" here)
+            doc_type: Only match this document type ("statute" here)
+            limit: Page size
+            cursor: ``next_cursor`` from the previous page
+            include_total: Also count all matching sections
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        # This table only holds the US Code, so other scopes match nothing
+        if not matches_scope(jurisdiction, doc_type):
+            return SearchPage(results=[], total=0 if include_total else None)
+
+        total = self.count_matches(query, title=title) if include_total else None
+        after = _decode_cursor(cursor) if cursor is not None else None
+        ranked = self.search_ranked(query, title=title, limit=limit, after=after)
+
+        next_cursor = None
+        if len(ranked) == limit:
+            last_score, last_rowid, _ = ranked[-1]
+            next_cursor = _encode_cursor(last_score, last_rowid)
+        return SearchPage(
+            results=[result for _, _, result in ranked], next_cursor=next_cursor, total=total
+        )
+
+    def _match_conditions(self, query: str, title: int | None) -> tuple[str, list[str], list]:
+        """FROM-clause join, WHERE conditions and parameters for a match query."""
+        join = "JOIN sections s ON s.rowid = sections_fts.rowid" if title is not None else ""
+        conditions = ["sections_fts MATCH ?"]
+        params: list = [query]
         if title is not None:
-            sql = """
-                SELECT s.title, s.section, s.section_title,
-                       snippet(sections_fts, 1, '<mark>', '</mark>', '...', 32) as snippet,
-                       bm25(sections_fts) as score
-                FROM sections_fts
-                JOIN sections s ON sections_fts.rowid = s.rowid
-                WHERE sections_fts MATCH ? AND s.title = ?
-                ORDER BY score
-                LIMIT ?
-            """
-            rows = self.db.execute(sql, [query, title, limit]).fetchall()
-        else:
-            sql = """
-                SELECT s.title, s.section, s.section_title,
-                       snippet(sections_fts, 1, '<mark>', '</mark>', '...', 32) as snippet,
-                       bm25(sections_fts) as score
+            conditions.append("s.title = ?")
+            params.append(title)
+        return join, conditions, params
+
+    def count_matches(self, query: str, title: int | None = None) -> int:
+        """Count the sections matching an FTS5 query."""
+        join, conditions, params = self._match_conditions(query, title)
+        return self.db.execute(
+            f"SELECT count(*) FROM sections_fts {join} WHERE {' AND '.join(conditions)}",
+            params,
+        ).fetchone()[0]
+
+    def search_ranked(
+        self,
+        query: str,
+        title: int | None = None,
+        limit: int = 20,
+        after: tuple[float, int] | None = None,
+    ) -> list[tuple[float, int, SearchResult]]:
+        """Rank matches by (bm25 score, rowid), starting after a position.
+
+        Args:
+            query: FTS5 query
+            title: Only match sections in this title
+            limit: Maximum results
+            after: (score, rowid) of the last result already returned
+
+        Returns:
+            (raw bm25 score, rowid, result) tuples in rank order
+        """
+        join, conditions, params = self._match_conditions(query, title)
+        if after is not None:
+            last_score, last_rowid = after
+            conditions.append(
+                "(bm25(sections_fts) > ? OR (bm25(sections_fts) = ? AND sections_fts.rowid > ?))"
+            )
+            params.extend([last_score, last_score, last_rowid])
+
+        page = self.db.execute(
+            f"""
+            SELECT sections_fts.rowid, bm25(sections_fts) AS score
+            FROM sections_fts {join}
+            WHERE {" AND ".join(conditions)}
+            ORDER BY score, sections_fts.rowid
+            LIMIT ?
+            """,
+            [*params, limit],
+        ).fetchall()
+        if not page:
+            return []
+
+        rowids = [rowid for rowid, _ in page]
+        details = {
+            row[0]: row[1:]
+            for row in self.db.execute(
+                f"""
+                SELECT sections_fts.rowid, s.title, s.section, s.section_title,
+                       snippet(sections_fts, 1, '<mark>', '</mark>', '...', 32)
                 FROM sections_fts
-                JOIN sections s ON sections_fts.rowid = s.rowid
-                WHERE sections_fts MATCH ?
-                ORDER BY score
-                LIMIT ?
-            """
-            rows = self.db.execute(sql, [query, limit]).fetchall()
-
-        results = []
-        for row in rows:
-            title_num, section, section_title, snippet, score = row
-            results.append(
-                SearchResult(
-                    citation=Citation(title=title_num, section=section),
-                    section_title=section_title,
-                    snippet=snippet,
-                    score=abs(score),  # BM25 returns negative scores
-                )
+                JOIN sections s ON s.rowid = sections_fts.rowid
+                WHERE sections_fts MATCH ? AND sections_fts.rowid IN ({", ".join("?" * len(rowids))})
+                """,
+                [query, *rowids],
+            ).fetchall()
+        }
+
+        ranked = []
+        for rowid, score in page:
+            title_num, section, section_title, snippet = details[rowid]
+            result = SearchResult(
+                citation=Citation(title=title_num, section=section),
+                section_title=section_title,
+                snippet=snippet,
+                score=abs(score),  # BM25 returns negative scores
             )
+            ranked.append((score, rowid, result))
+        return ranked
+
+    def get_title_sections(
+        self, title: int, after: str | None = None, limit: int = 500
+    ) -> list[Section]:
+        """Get one page of a title's sections in stored section-number order.
+
+        Pages are keyset ranges over the (title, section) index, so walking a
+        whole title holds only one page in memory and each page costs the
+        same however deep it is.
+
+        Args:
+            title: Title number
+            after: Section number of the last section already read
+            limit: Page size
+        """
+        condition = "title = ?" + (" AND section > ?" if after is not None else "")
+        params = [title] if after is None else [title, after]
+        rows = self.db.execute(
+            f"SELECT {SECTION_SELECT} FROM sections WHERE {condition} ORDER BY section LIMIT ?",
+            [*params, limit],
+        ).fetchall()
+        if not rows:
+            return []
+
+        last = rows[-1][SECTION_COLUMNS.index("section")]
+        grouped: dict[str, list[tuple]] = {}
+        for section, *node in self.db.execute(
+            f"""
+            SELECT section, path, identifier, heading, text FROM subsections
+            WHERE {condition} AND section <= ?
+            ORDER BY section, ordinal
+            """,
+            [*params, last],
+        ):
+            grouped.setdefault(section, []).append(tuple(node))
 
-        return results
+        return [
+            self._row_to_section(
+                row,
+                self._build_subsection_tree(
+                    title, grouped.get(row[SECTION_COLUMNS.index("section")], [])
+                ),
+            )
+            for row in rows
+        ]
 
     def list_titles(self) -> list[TitleInfo]:
         """List all available titles with metadata."""
@@ -348,6 +1459,50 @@ class SQLiteStorage(StorageBackend):
         ).fetchall()
         return [f"{row[0]} USC {row[1]}" for row in rows]
 
+    def iter_cross_references(self) -> Iterator[tuple[str, str]]:
+        """Yield every (from_citation, to_citation) cross-reference edge."""
+        for from_title, from_section, to_title, to_section in self.db.execute(
+            "SELECT from_title, from_section, to_title, to_section FROM cross_references"
+        ):
+            yield f"{from_title} USC {from_section}", f"{to_title} USC {to_section}"
+
+    def iter_section_headings(self) -> Iterator[tuple[str, str]]:
+        """Yield (citation, heading) for every section."""
+        for title, section, heading in self.db.execute(
+            "SELECT title, section, section_title FROM sections"
+        ):
+            yield f"{title} USC {section}", heading
+
+    def cross_reference_fingerprint(self) -> str | None:
+        """Row count, max rowid and write counter of cross_references.
+
+        The counter is maintained by triggers on every insert, update and
+        delete, so rewriting a section's references in place (same count,
+        reused rowids) still changes the fingerprint.
+        """
+        count, max_rowid, version = self.db.execute(
+            """
+            SELECT count(*), max(rowid), (SELECT version FROM cross_reference_changes)
+            FROM cross_references
+            """
+        ).fetchone()
+        return f"{count}:{max_rowid}:{version}"
+
+    def data_version(self, title: int | None = None) -> str | None:
+        """Committed write counter of a title, or of every title if None.
+
+        The counters are maintained by triggers on sections, subsections and
+        section_versions, so they change with every write to a title's rows
+        and with nothing else (checkpoints, other titles, metadata).
+        """
+        if title is None:
+            (version,) = self.db.execute("SELECT total(version) FROM title_versions").fetchone()
+            return str(int(version))
+        row = self.db.execute(
+            "SELECT version FROM title_versions WHERE title = ?", [title]
+        ).fetchone()
+        return f"{title}:{row[0] if row else 0}"
+
     def update_title_metadata(self, title_num: int, name: str, is_positive_law: bool) -> None:
         """Update metadata for a title."""
         # Count sections
@@ -11,7 +11,7 @@ Environment variable: COSILICO_SUPABASE_DB_URL
 
 import json
 import os
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from typing import Any
 
@@ -318,6 +318,42 @@ class SupabaseStorage:
 
             return self._row_to_statute(row)
 
+    def get_statutes(
+        self,
+        citations: Sequence[tuple[str, str, str]],
+    ) -> list[Statute | None]:
+        """Retrieve many whole-section statutes in one query.
+
+        Args:
+            citations: (jurisdiction, code, section) tuples
+
+        Returns:
+            List aligned with ``citations``, with None where not found
+        """
+        keys = list(dict.fromkeys(citations))
+        if not keys:
+            return []
+
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT s.* FROM arch.statutes s
+                JOIN unnest(%s::text[], %s::text[], %s::text[])
+                    AS wanted(jurisdiction, code, section)
+                    ON s.jurisdiction = wanted.jurisdiction
+                    AND s.code = wanted.code
+                    AND s.section = wanted.section
+                WHERE s.subsection_path IS NULL
+                """,
+                [[k[0] for k in keys], [k[1] for k in keys], [k[2] for k in keys]],
+            )
+            rows = cur.fetchall()
+
+        found = {(row["jurisdiction"], row["code"], row["section"]): row for row in rows}
+        return [
+            self._row_to_statute(found[key]) if key in found else None for key in citations
+        ]
+
     def _row_to_statute(self, row: dict) -> Statute:
         """Convert database row to Statute model."""
         subsections = [
@@ -0,0 +1,196 @@
+"""Prefix index over citations and section headings for typeahead lookups.
+
+Every section contributes its normalized citation ("26 usc 32") and the
+word suffixes of its heading ("earned income", "income") as keys. The keys
+are sorted and packed into one string with an offsets array, so the index
+costs a few bytes per key instead of a Python object each.
+
+Matches are ranked by popularity (how many sections cite the match), then
+alphabetically. The keys sharing a prefix form one contiguous run, found by
+two binary searches; a segment tree over each key's rank in that order then
+yields the best matches of the run one at a time. A one-character query
+therefore costs about as much as a full one, however many keys it matches.
+
+Example:
+    >>> index = SuggestIndex.build([("26 USC 32", "Earned income")])
+    >>> index.suggest("earned inc")[0].citation
+    '26 USC 32'
+"""
+
+import heapq
+import re
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+
+from arch.models import Suggestion
+
+# Keys are truncated to this length; longer queries only compare this far
+MAX_KEY_LENGTH = 48
+
+# Heading word suffixes indexed per section ("earned income credit",
+# "income credit", "credit"), bounding the keys a long heading adds
+MAX_HEADING_KEYS = 8
+
+# Sorts after any character a normalized key can contain
+_PREFIX_END = "\U0010ffff"
+
+_USC = re.compile(r"\bu\.?\s?s\.?\s?c\b\.?")
+_CFR = re.compile(r"\bc\.?\s?f\.?\s?r\b\.?")
+_SEPARATORS = re.compile(r"[^\w.\-]+")
+
+
+def normalize(text: str) -> str:
+    """Normalize a citation, heading or query for prefix matching.
+
+    Lowercases, spells "U.S.C."/"C.F.R." as "usc"/"cfr" and collapses
+    punctuation other than "." and "-" (which separate CFR parts and state
+    code segments) to single spaces.
+
+    Example:
+        >>> normalize("26 U.S.C. § 32")
+        '26 usc 32'
+    """
+    text = _CFR.sub(" cfr ", _USC.sub(" usc ", text.lower()))
+    return " ".join(_SEPARATORS.sub(" ", text).split())
+
+
+class _PackedKeys:
+    """Sorted keys stored in one string, indexable for bisect."""
+
+    def __init__(self, blob: str, offsets: array):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self.blob[self.offsets[i] : self.offsets[i + 1]]
+
+
+class SuggestIndex:
+    """Sorted prefix index from normalized keys to sections."""
+
+    def __init__(
+        self,
+        keys: _PackedKeys,
+        ids: array,
+        citations: list[str],
+        headings: list[str],
+        scores: array,
+    ):
+        self.keys = keys
+        self.ids = ids
+        self.citations = citations
+        self.headings = headings
+        self.scores = scores
+        self._build_rank_tree()
+
+    def _build_rank_tree(self) -> None:
+        """Rank key positions (most popular first) and index ranks for range minima."""
+        n = len(self.keys)
+        key_scores = [self.scores[i] for i in self.ids]
+        # Stable sort: ties keep key order, so equally popular matches stay alphabetical
+        self.by_rank = array("i", sorted(range(n), key=key_scores.__getitem__, reverse=True))
+        rank = array("i", bytes(4 * n))
+        for r, pos in enumerate(self.by_rank):
+            rank[pos] = r
+        self.leaves = 1 << max(n - 1, 0).bit_length()
+        tree = array("i", [n]) * self.leaves + rank + array("i", [n]) * (self.leaves - n)
+        for node in range(self.leaves - 1, 0, -1):
+            tree[node] = min(tree[2 * node], tree[2 * node + 1])
+        self.tree = tree
+
+    def _best(self, lo: int, hi: int) -> int:
+        """Lowest rank among key positions [lo, hi)."""
+        best = len(self.keys)
+        lo += self.leaves
+        hi += self.leaves
+        while lo < hi:
+            if lo & 1:
+                best = min(best, self.tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = min(best, self.tree[hi])
+            lo >>= 1
+            hi >>= 1
+        return best
+
+    @classmethod
+    def build(
+        cls,
+        entries: Iterable[tuple[str, str]],
+        popularity: Callable[[str], int] | None = None,
+    ) -> "SuggestIndex":
+        """Build an index from (citation, heading) pairs.
+
+        Args:
+            entries: Citation and heading of each section
+            popularity: Ranking score for a citation (e.g. its in-degree)
+
+        Returns:
+            SuggestIndex
+        """
+        citations: list[str] = []
+        headings: list[str] = []
+        scores = array("i")
+        pairs: list[tuple[str, int]] = []
+        for citation, heading in entries:
+            i = len(citations)
+            citations.append(citation)
+            headings.append(heading)
+            scores.append(popularity(citation) if popularity else 0)
+            pairs.append((normalize(citation)[:MAX_KEY_LENGTH], i))
+            words = normalize(heading).split()
+            for start in range(min(len(words), MAX_HEADING_KEYS)):
+                pairs.append((" ".join(words[start:])[:MAX_KEY_LENGTH], i))
+
+        pairs = sorted(set(pairs))
+        offsets = array("i", [0])
+        for key, _ in pairs:
+            offsets.append(offsets[-1] + len(key))
+        keys = _PackedKeys("".join(key for key, _ in pairs), offsets)
+        return cls(keys, array("i", (i for _, i in pairs)), citations, headings, scores)
+
+    def __len__(self) -> int:
+        return len(self.citations)
+
+    def suggest(self, query: str, limit: int = 10) -> list[Suggestion]:
+        """Sections whose citation or heading starts with the query.
+
+        Args:
+            query: What the user has typed so far
+            limit: Maximum suggestions
+
+        Returns:
+            Suggestions, most cited first
+        """
+        prefix = normalize(query)[:MAX_KEY_LENGTH]
+        if not prefix:
+            return []
+
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + _PREFIX_END, lo=start)
+        # Best remaining match of each unvisited run of matching keys
+        runs = [(self._best(start, end), start, end)] if start < end else []
+        top: list[int] = []
+        while runs and len(top) < limit:
+            rank, lo, hi = heapq.heappop(runs)
+            pos = self.by_rank[rank]
+            # A section matching through several keys is listed at its best one
+            if self.ids[pos] not in top:
+                top.append(self.ids[pos])
+            for run in ((lo, pos), (pos + 1, hi)):
+                if run[0] < run[1]:
+                    heapq.heappush(runs, (self._best(*run), *run))
+
+        return [
+            Suggestion(
+                citation=self.citations[i],
+                heading=self.headings[i],
+                cited_by=self.scores[i],
+            )
+            for i in top
+        ]
@@ -0,0 +1,557 @@
+"""Tests for the REST API."""
+
+import json
+from datetime import date
+
+import httpx
+import pytest
+
+from arch.models import Citation, Section, Subsection
+from arch.storage.sqlite import SQLiteStorage
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Create a small database and run from a temp dir (the module creates atlas.db)."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "test.db"
+    storage = SQLiteStorage(path)
+    storage.store_sections(
+        [
+            Section(
+                citation=Citation(title=26, section="32"),
+                title_name="Internal Revenue Code",
+                section_title="Earned income",
+                text="(a) Allowance of credit. In the case of an eligible individual...",
+                subsections=[
+                    Subsection(
+                        identifier="a",
+                        heading="Allowance of credit",
+                        text="In the case of an eligible individual...",
+                        children=[Subsection(identifier="1", text="The credit shall be...")],
+                    )
+                ],
+                references_to=["26 USC 24"],
+                source_url="https://uscode.house.gov/view.xhtml?req=26+USC+32",
+                retrieved_at=date(2025, 1, 1),
+                uslm_id="/us/usc/t26/s32",
+            ),
+            Section(
+                citation=Citation(title=26, section="24"),
+                title_name="Internal Revenue Code",
+                section_title="Child tax credit",
+                text="There shall be allowed as a credit with respect to each qualifying child...",
+                source_url="https://uscode.house.gov/view.xhtml?req=26+USC+24",
+                retrieved_at=date(2025, 1, 1),
+                uslm_id="/us/usc/t26/s24",
+            ),
+        ]
+    )
+    return path
+
+
+@pytest.fixture
+def app(db_path):
+    from arch.api.main import create_app
+
+    return create_app(db_path=db_path)
+
+
+@pytest.fixture
+async def client(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+class TestSectionsEndpoints:
+    """Tests for section lookup endpoints."""
+
+    async def test_get_section(self, client):
+        response = await client.get("/v1/sections/26/32")
+
+        assert response.status_code == 200
+        assert response.json()["section_title"] == "Earned income"
+
+    async def test_get_subsection_returns_subtree(self, client):
+        response = await client.get("/v1/sections/26/32/a/1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["citation"] == "26 USC 32(a)(1)"
+        assert [s["identifier"] for s in data["subsections"]] == ["1"]
+
+    async def test_get_section_as_of(self, client):
+        assert (await client.get("/v1/sections/26/32?as_of=2025-06-01")).status_code == 200
+        assert (await client.get("/v1/sections/26/32?as_of=2024-06-01")).status_code == 404
+
+    async def test_get_missing_section(self, client):
+        assert (await client.get("/v1/sections/26/9999")).status_code == 404
+
+
+class TestBatchEndpoint:
+    """Tests for POST /v1/sections:batch."""
+
+    async def test_batch_returns_found_and_missing(self, client):
+        response = await client.post(
+            "/v1/sections:batch",
+            json={"citations": ["26 USC 32", "26 USC 9999", "26 USC 24"]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [s["citation"] for s in data["sections"]] == ["26 USC 32", "26 USC 24"]
+        assert data["not_found"] == ["26 USC 9999"]
+
+    async def test_batch_rejects_bad_citation(self, client):
+        response = await client.post("/v1/sections:batch", json={"citations": ["not a cite"]})
+        assert response.status_code == 400
+
+
+class TestSearchEndpoint:
+    """Tests for /v1/search."""
+
+    async def test_search_reports_total_and_cursor(self, client):
+        response = await client.get(
+            "/v1/search", params={"q": "credit", "limit": 1, "include_total": True}
+        )
+
+        data = response.json()
+        assert data["total"] == 2
+        assert len(data["results"]) == 1
+
+        response = await client.get(
+            "/v1/search",
+            params={
+                "q": "credit",
+                "limit": 1,
+                "include_total": True,
+                "cursor": data["next_cursor"],
+            },
+        )
+        assert response.json()["results"][0]["citation"] != data["results"][0]["citation"]
+        # Only the first page is counted
+        assert response.json()["total"] is None
+
+    async def test_search_total_off_by_default(self, client):
+        response = await client.get("/v1/search", params={"q": "credit"})
+
+        assert response.json()["total"] is None
+        assert len(response.json()["results"]) == 2
+
+    async def test_search_bad_cursor(self, client):
+        response = await client.get("/v1/search", params={"q": "credit", "cursor": "bad"})
+        assert response.status_code == 400
+
+
+class TestGraphEndpoints:
+    """Tests for /v1/graph endpoints."""
+
+    async def test_dependencies(self, client):
+        response = await client.get("/v1/graph/26/32/dependencies")
+
+        assert response.status_code == 200
+        assert response.json()["sections"] == [{"citation": "26 USC 24", "depth": 1}]
+
+    async def test_dependents(self, client):
+        response = await client.get("/v1/graph/26/24/dependents", params={"depth": 1})
+        assert [s["citation"] for s in response.json()["sections"]] == ["26 USC 32"]
+
+    async def test_most_cited(self, client):
+        response = await client.get("/v1/graph/most-cited", params={"limit": 1})
+        assert response.json() == [{"citation": "26 USC 24", "cited_by": 1}]
+
+
+class TestResponseCaching:
+    """Tests for ETags, conditional GETs and the response cache."""
+
+    async def test_caching_headers(self, client):
+        response = await client.get("/v1/sections/26/32")
+
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "public, max-age=3600"
+        assert response.headers["last-modified"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    async def test_not_modified(self, client):
+        etag = (await client.get("/v1/sections/26/32")).headers["etag"]
+
+        response = await client.get("/v1/sections/26/32", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    async def test_stale_etag_gets_body(self, client):
+        response = await client.get("/v1/sections/26/32", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+
+    async def test_repeat_requests_hit_cache(self, app, client):
+        cache = app.state.response_cache
+        first = await client.get("/v1/sections/26/32")
+        second = await client.get("/v1/citation/26 USC 32")
+
+        assert second.content == first.content
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    async def test_reingest_invalidates(self, app, client, db_path):
+        first = await client.get("/v1/sections/26/24")
+
+        storage = SQLiteStorage(db_path)
+        section = storage.get_section(26, "24")
+        storage.store_section(section.model_copy(update={"text": "Amended text."}))
+
+        second = await client.get("/v1/sections/26/24")
+        assert second.json()["text"] == "Amended text."
+        assert second.headers["etag"] != first.headers["etag"]
+
+    async def test_not_found_is_not_cached(self, app, client):
+        assert (await client.get("/v1/sections/26/9999")).status_code == 404
+        assert len(app.state.response_cache) == 0
+
+
+class TestCompressedResponses:
+    """Tests for pre-compressed cached responses."""
+
+    @pytest.fixture
+    def long_section(self, db_path):
+        section = Section(
+            citation=Citation(title=26, section="1"),
+            title_name="Internal Revenue Code",
+            section_title="Tax imposed",
+            text="There is hereby imposed on the taxable income of every individual. " * 40,
+            source_url="https://uscode.house.gov/view.xhtml?req=26+USC+1",
+            retrieved_at=date(2025, 1, 1),
+        )
+        SQLiteStorage(db_path).store_section(section)
+        return section
+
+    async def test_gzip_negotiated(self, client, long_section):
+        plain = await client.get("/v1/sections/26/1", headers={"Accept-Encoding": "identity"})
+        response = await client.get("/v1/sections/26/1", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in plain.headers
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+        assert response.content == plain.content  # httpx decodes the body
+
+    async def test_not_modified_with_encoded_etag(self, client, long_section):
+        headers = {"Accept-Encoding": "gzip"}
+        etag = (await client.get("/v1/sections/26/1", headers=headers)).headers["etag"]
+
+        response = await client.get("/v1/sections/26/1", headers={**headers, "If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    async def test_refused_encoding_sends_identity(self, client, long_section):
+        response = await client.get(
+            "/v1/sections/26/1", headers={"Accept-Encoding": "gzip;q=0, identity"}
+        )
+        assert "content-encoding" not in response.headers
+
+    async def test_search_gzipped(self, client):
+        response = await client.get(
+            "/v1/search", params={"q": "credit", "limit": 100}, headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == 2
+
+    async def test_encoding_runs_off_the_event_loop(self, client, long_section, monkeypatch):
+        import threading
+
+        from arch.api import cache, main
+
+        threads = []
+
+        def recording(func):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        monkeypatch.setattr(main, "dumps", recording(main.dumps))
+        monkeypatch.setattr(cache, "encode_body", recording(cache.encode_body))
+        headers = {"Accept-Encoding": "gzip"}
+
+        await client.get("/v1/sections/26/1", headers=headers)
+        await client.post("/v1/sections:batch", json={"citations": ["26 USC 1"]}, headers=headers)
+        await client.get("/v1/search", params={"q": "imposed"}, headers=headers)
+        await client.get("/v1/suggest", params={"q": "26"}, headers=headers)
+
+        assert len(threads) >= 6
+        assert threading.main_thread() not in threads
+
+
+class TestFastSerialization:
+    """Tests that the fast JSON path matches the response models."""
+
+    @pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+    def encoder(self, request, monkeypatch):
+        from arch.api import serialize
+
+        if request.param and not serialize.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(serialize, "ORJSON_AVAILABLE", request.param)
+        return serialize
+
+    def test_section_matches_model(self, encoder, db_path):
+        from arch.api.main import SectionResponse
+
+        section = SQLiteStorage(db_path).get_section(26, "32")
+
+        assert json.loads(encoder.dumps(encoder.section_payload(section))) == json.loads(
+            SectionResponse.from_section(section).model_dump_json()
+        )
+
+    def test_search_matches_model(self, encoder, db_path):
+        from arch.api.main import SearchResponse, SearchResultResponse
+
+        page = SQLiteStorage(db_path).search_page("credit", include_total=True)
+        expected = SearchResponse(
+            query="credit",
+            total=page.total,
+            results=[SearchResultResponse.from_result(r) for r in page.results],
+            next_cursor=page.next_cursor,
+        )
+
+        assert json.loads(encoder.dumps(encoder.search_payload("credit", page))) == json.loads(
+            expected.model_dump_json()
+        )
+
+    def test_non_ascii_kept_as_utf8(self, encoder):
+        assert encoder.dumps({"text": "§ 32—credit"}) == '{"text":"§ 32—credit"}'.encode()
+
+
+class TestTitleExport:
+    """Tests for the streaming NDJSON title export."""
+
+    async def test_exports_every_section_in_order(self, client):
+        response = await client.get("/v1/titles/26/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["citation"] for line in lines] == ["26 USC 24", "26 USC 32"]
+        assert lines[1]["subsections"][0]["identifier"] == "a"
+
+    async def test_resume_after_section(self, client):
+        first = await client.get("/v1/titles/26/export")
+        response = await client.get(
+            "/v1/titles/26/export",
+            params={"after": "24"},
+            headers={"If-Match": first.headers["etag"]},
+        )
+
+        assert response.status_code == 200
+        assert [json.loads(line)["citation"] for line in response.text.splitlines()] == [
+            "26 USC 32"
+        ]
+
+    async def test_gzip_when_accepted(self, client):
+        response = await client.get("/v1/titles/26/export", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.text.splitlines()) == 2
+
+    async def test_stale_if_match_is_rejected(self, client):
+        response = await client.get(
+            "/v1/titles/26/export", params={"after": "24"}, headers={"If-Match": '"stale"'}
+        )
+
+        assert response.status_code == 412
+
+    async def test_unknown_title(self, client):
+        response = await client.get("/v1/titles/99/export")
+
+        assert response.status_code == 404
+
+    async def test_cli_export_matches_api(self, client, db_path, tmp_path):
+        from click.testing import CliRunner
+
+        from arch.cli import main
+
+        output = tmp_path / "usc26.ndjson"
+        result = CliRunner().invoke(main, ["--db", str(db_path), "export", "26", "-o", output])
+
+        assert result.exit_code == 0, result.output
+        assert output.read_text() == (await client.get("/v1/titles/26/export")).text
+
+    def test_cli_resume_refused_after_archive_changes(self, db_path, tmp_path):
+        from click.testing import CliRunner
+
+        from arch.cli import main
+
+        output = tmp_path / "usc26.ndjson"
+        args = ["--db", str(db_path), "export", "26", "-o", output]
+        assert CliRunner().invoke(main, args).exit_code == 0
+        lines = output.read_text().splitlines()
+        output.write_text(lines[0] + "\n")
+        assert CliRunner().invoke(main, [*args, "--resume"]).exit_code == 0
+        assert output.read_text().splitlines() == lines
+
+        storage = SQLiteStorage(db_path)
+        section = storage.get_section(26, "24")
+        storage.store_section(section.model_copy(update={"text": "Amended text."}))
+        output.write_text(lines[0] + "\n")
+        result = CliRunner().invoke(main, [*args, "--resume"])
+
+        assert result.exit_code != 0
+        assert "changed" in result.output
+        assert output.read_text().splitlines() == lines[:1]
+
+    @staticmethod
+    def _checkpoint_and_touch_other_title(db_path):
+        storage = SQLiteStorage(db_path)
+        storage.db.enable_wal()
+        storage.store_section(_other_title_section())
+        storage.db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    async def test_resume_survives_checkpoint_and_other_titles(self, client, db_path):
+        first = await client.get("/v1/titles/26/export")
+        self._checkpoint_and_touch_other_title(db_path)
+
+        response = await client.get(
+            "/v1/titles/26/export",
+            params={"after": "24"},
+            headers={"If-Match": first.headers["etag"]},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == first.headers["etag"]
+
+    def test_cli_resume_survives_checkpoint_and_other_titles(self, db_path, tmp_path):
+        from click.testing import CliRunner
+
+        from arch.cli import main
+
+        output = tmp_path / "usc26.ndjson"
+        args = ["--db", str(db_path), "export", "26", "-o", output]
+        assert CliRunner().invoke(main, args).exit_code == 0
+        lines = output.read_text().splitlines()
+        output.write_text(lines[0] + "\n")
+        self._checkpoint_and_touch_other_title(db_path)
+
+        result = CliRunner().invoke(main, [*args, "--resume"])
+
+        assert result.exit_code == 0, result.output
+        assert output.read_text().splitlines() == lines
+
+
+def _other_title_section() -> Section:
+    return Section(
+        citation=Citation(title=42, section="1395"),
+        title_name="The Public Health and Welfare",
+        section_title="Prohibition against any Federal interference",
+        text="Nothing in this subchapter shall be construed...",
+        source_url="https://uscode.house.gov/view.xhtml?req=42+USC+1395",
+        retrieved_at=date(2025, 1, 1),
+    )
+
+
+class TestMetrics:
+    """Tests for the Prometheus /metrics endpoint."""
+
+    @pytest.fixture
+    async def metrics_client(self, db_path):
+        from arch.api.main import create_app
+
+        transport = httpx.ASGITransport(app=create_app(db_path=db_path, metrics=True))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+    async def test_route_and_storage_metrics(self, metrics_client):
+        await metrics_client.get("/v1/sections/26/32")
+        await metrics_client.get("/v1/sections/26/32")
+        await metrics_client.get("/v1/search", params={"q": "credit"})
+
+        response = await metrics_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert (
+            'arch_http_request_duration_seconds_count{method="GET",'
+            'route="/v1/sections/{title}/{section}",status="200"} 2'
+        ) in text
+        assert (
+            'arch_storage_operation_duration_seconds_count{backend="SQLiteStorage",'
+            'operation="search_page"} 1'
+        ) in text
+        assert 'arch_storage_rows_total{backend="SQLiteStorage",operation="search_page"} 2' in text
+        assert "arch_response_cache_hits_total 1" in text
+        assert "arch_response_cache_misses_total 1" in text
+        assert 'arch_http_response_bytes_total{method="GET",route="/v1/search"}' in text
+
+    def test_nested_storage_calls_recorded_once(self, db_path):
+        from arch.api.metrics import MetricsRegistry, instrument_storage
+
+        storage = SQLiteStorage(db_path)
+        registry = MetricsRegistry()
+        instrument_storage(storage, registry)
+
+        storage.search("credit")
+        storage.get_sections([Citation(title=26, section="32"), Citation(title=26, section="24")])
+
+        text = registry.render()
+        assert 'operation="search"} 1' in text
+        assert 'operation="get_sections"} 1' in text
+        assert 'operation="search_page"' not in text
+        assert 'operation="get_section"' not in text
+
+    async def test_disabled_by_default(self, client):
+        assert (await client.get("/metrics")).status_code == 404
+
+
+class TestMetricsRegistry:
+    """Tests for the metrics registry and text format."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        from arch.api.metrics import MetricsRegistry
+
+        registry = MetricsRegistry()
+        histogram = registry.histogram("op_seconds", "Latency", ["op"], buckets=[0.1, 1])
+        for value in (0.05, 0.5, 5):
+            histogram.observe(value, "get")
+
+        lines = registry.render().splitlines()
+
+        assert lines[:2] == ["# HELP op_seconds Latency", "# TYPE op_seconds histogram"]
+        assert 'op_seconds_bucket{op="get",le="0.1"} 1' in lines
+        assert 'op_seconds_bucket{op="get",le="1"} 2' in lines
+        assert 'op_seconds_bucket{op="get",le="+Inf"} 3' in lines
+        assert 'op_seconds_count{op="get"} 3' in lines
+        assert 'op_seconds_sum{op="get"} 5.55' in lines
+
+    def test_label_values_escaped(self):
+        from arch.api.metrics import MetricsRegistry
+
+        registry = MetricsRegistry()
+        registry.counter("hits_total", "Hits", ["route"]).inc(1, 'a"b')
+
+        assert 'hits_total{route="a\\"b"} 1' in registry.render()
+
+    def test_duplicate_name_rejected(self):
+        from arch.api.metrics import MetricsRegistry
+
+        registry = MetricsRegistry()
+        registry.counter("hits_total", "Hits")
+        with pytest.raises(ValueError):
+            registry.gauge("hits_total", "Hits")
+
+
+class TestSuggestEndpoint:
+    """Tests for typeahead suggestions."""
+
+    async def test_suggest_citation_prefix(self, client):
+        response = await client.get("/v1/suggest", params={"q": "26 USC 2"})
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"citation": "26 USC 24", "heading": "Child tax credit", "cited_by": 1}
+        ]
+
+    async def test_suggest_heading(self, client):
+        response = await client.get("/v1/suggest", params={"q": "earned"})
+        assert [s["citation"] for s in response.json()] == ["26 USC 32"]
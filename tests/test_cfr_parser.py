@@ -186,3 +186,129 @@ class TestParagraphParsing:
 
         assert extract_heading("(a) <I>In general.</I> The rule...") == "In general"
         assert extract_heading("(a) No heading here.") is None
+
+    PARAGRAPHS_XML = """<DIV8>
+<P>(a) <I>Nested <E T="03">emph</E>.</I> then <I>Real &amp; one.</I> tail</P>tail &amp; more
+<P>(b) <I T="x">With attribute.</I> <I>.</I> <I>..</I></P>
+<P>(c)<I>No period</I><I>  Trailing space.  </I></P>
+<P>  (d)   <I></I><I>A.</I></P>
+<P>plain   text
+  with  newlines</P>
+<P>(g) 5 &lt; 6 &gt; 4 <I>Less &lt; than.</I></P>
+<CITA TYPE="N">[T.D. 9954, 86 FR 12345, Mar. 15, 2021]</CITA>
+</DIV8>"""
+
+    def test_element_text_matches_serialized_text(self):
+        """Reading the tree gives the same text as cleaning the HTML serialization."""
+        from xml.etree import ElementTree as ET
+
+        from arch.parsers.cfr import clean_text, element_text
+
+        for elem in ET.fromstring(self.PARAGRAPHS_XML):
+            expected = clean_text(ET.tostring(elem, encoding="unicode", method="html"))
+            assert element_text(elem) == expected
+
+    def test_element_heading_matches_serialized_heading(self):
+        """Structural italic detection agrees with the regex on serialized markup."""
+        from xml.etree import ElementTree as ET
+
+        from arch.parsers.cfr import element_heading, extract_heading
+
+        headings = []
+        for elem in ET.fromstring(self.PARAGRAPHS_XML).iter("P"):
+            expected = extract_heading(ET.tostring(elem, encoding="unicode", method="html"))
+            heading = element_heading(elem)
+            assert (heading.strip() if heading is not None else None) == expected
+            headings.append(expected)
+        assert headings == ["Real &amp; one", ".", None, "A", None, "Less &lt; than"]
+
+
+STREAM_TITLE_XML = """<?xml version="1.0" encoding="UTF-8" ?>
+<DLPSTEXTCLASS>
+<HEADER><FILEDESC>
+<TITLESTMT><TITLE>Title 26: Internal Revenue</TITLE></TITLESTMT>
+<PUBLICATIONSTMT><IDNO TYPE="title">26</IDNO></PUBLICATIONSTMT>
+</FILEDESC></HEADER>
+<TEXT><BODY><ECFRBRWS>
+<AMDDATE>Dec. 18, 2025</AMDDATE>
+<DIV1 N="1" NODE="26:1" TYPE="TITLE">
+<DIV5 N="1" NODE="26:1.0.1.1.1" TYPE="PART">
+<HEAD>PART 1</HEAD>
+<AUTH><HED>Authority:</HED><PSPACE>26 U.S.C. 7805</PSPACE></AUTH>
+<DIV8 N="§ 1.1-1" TYPE="SECTION"><HEAD>§ 1.1-1   Tax imposed.</HEAD><P>(a) One.</P></DIV8>
+<DIV8 N="§ 1.32-1" TYPE="SECTION"><HEAD>§ 1.32-1   Earned income.</HEAD><P>(a) Two.</P></DIV8>
+</DIV5>
+<DIV5 N="31" NODE="26:1.0.1.1.31" TYPE="PART">
+<HEAD>PART 31</HEAD>
+<AUTH><HED>Authority:</HED><PSPACE>26 U.S.C. 3402</PSPACE></AUTH>
+<DIV8 N="§ 31.3402-1" TYPE="SECTION"><HEAD>§ 31.3402-1   Withholding.</HEAD><P>Three.</P></DIV8>
+</DIV5>
+</DIV1>
+</ECFRBRWS></BODY></TEXT>
+</DLPSTEXTCLASS>
+"""
+
+
+class TestCFRStreaming:
+    """Tests for streaming CFR titles with iterparse."""
+
+    def test_streaming_matches_tree(self, tmp_path):
+        """Streaming yields the same sections as the tree walk."""
+        from arch.parsers.cfr import CFRParser
+
+        xml_path = tmp_path / "title-26.xml"
+        xml_path.write_text(STREAM_TITLE_XML)
+
+        tree = list(CFRParser(STREAM_TITLE_XML).iter_sections())
+        streamed = list(CFRParser(xml_path).iter_sections(streaming=True))
+
+        assert [r.model_dump() for r in streamed] == [r.model_dump() for r in tree]
+        assert [r.cfr_cite for r in streamed] == [
+            "26 CFR 1.1-1",
+            "26 CFR 1.32-1",
+            "26 CFR 31.3402-1",
+        ]
+        assert streamed[2].authority.endswith("26 U.S.C. 3402")
+
+    def test_path_reads_header_only(self, tmp_path):
+        """A path source gets header metadata without parsing the document."""
+        from arch.parsers.cfr import CFRParser
+
+        xml_path = tmp_path / "title-26.xml"
+        xml_path.write_text(STREAM_TITLE_XML)
+        parser = CFRParser(xml_path)
+
+        assert parser.title_number == 26
+        assert parser.title_name == "Internal Revenue"
+        assert parser._root is None
+        assert parser.get_section(31, "3402-1").heading == "Withholding"
+
+    def test_file_object_source(self):
+        """A file object is streamed once, filling in the header as it goes."""
+        import io
+
+        from arch.parsers.cfr import CFRParser
+
+        parser = CFRParser(io.BytesIO(STREAM_TITLE_XML.encode()))
+        assert parser.title_number == 0
+
+        sections = list(parser.iter_sections(streaming=True))
+        assert len(sections) == 3
+        assert parser.title_number == 26
+        with pytest.raises(ValueError, match="streaming"):
+            parser.iter_parts().__next__()
+
+    def test_finished_sections_detached(self, tmp_path):
+        """Sections already yielded are removed from their part."""
+        from arch.parsers.cfr import CFRTitleStream
+
+        xml_path = tmp_path / "title-26.xml"
+        xml_path.write_text(STREAM_TITLE_XML)
+
+        seen = []
+        for section, part in CFRTitleStream(xml_path):
+            # iterparse may have built later sections already, never earlier ones
+            assert not any(s in part.findall("DIV8") for s in seen)
+            assert part.find("AUTH") is not None
+            seen.append(section)
+        assert len(seen) == 3
@@ -1,5 +1,8 @@
 """Tests for eCFR converter."""
 
+import subprocess
+import sys
+
 import pytest
 from datetime import date
 from unittest.mock import Mock, patch
@@ -308,6 +311,91 @@ class TestECFRConvenienceMethods:
         assert len(result.regulations) >= 1
 
 
+def _mock_client(xml: str) -> Mock:
+    """HTTP client stub that returns the same part XML for every request."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.text = xml
+    mock_client = Mock()
+    mock_client.get.return_value = mock_response
+    return mock_client
+
+
+class TestECFRPartCache:
+    """Tests for the in-memory and on-disk part cache."""
+
+    def test_repeated_section_fetches_download_part_once(self, tmp_path):
+        """Sections of one part share a single download."""
+        converter = ECFRConverter(data_dir=tmp_path)
+        converter._client = _mock_client(SAMPLE_MULTIPLE_SECTIONS_XML)
+
+        for _ in range(20):
+            assert converter.fetch("26/1.32-1").success
+        assert converter.fetch_irs(1, "32-2").success
+        assert len(converter.fetch_part(26, 1).regulations) == 2
+
+        converter._client.get.assert_called_once()
+
+    def test_dates_cached_separately(self, tmp_path):
+        """Each as_of date is its own cache entry."""
+        converter = ECFRConverter(data_dir=tmp_path)
+        converter._client = _mock_client(SAMPLE_MULTIPLE_SECTIONS_XML)
+
+        converter.fetch_part(26, 1, as_of=date(2023, 1, 1))
+        converter.fetch_part(26, 1, as_of=date(2024, 1, 1))
+        converter.fetch_part(26, 1, as_of=date(2024, 1, 1))
+
+        assert converter._client.get.call_count == 2
+
+    def test_dated_part_served_from_disk(self, tmp_path):
+        """A dated part downloaded once is read from disk by a new converter."""
+        as_of = date(2024, 1, 1)
+        first = ECFRConverter(data_dir=tmp_path)
+        first._client = _mock_client(SAMPLE_SECTION_XML)
+        first.fetch("26/1.32-1", as_of=as_of)
+
+        second = ECFRConverter(data_dir=tmp_path)
+        second._client = _mock_client(SAMPLE_SECTION_XML)
+        result = second.fetch("26/1.32-1", as_of=as_of)
+
+        assert result.success
+        second._client.get.assert_not_called()
+        assert (tmp_path / "parts" / "title-26_part-1_2024-01-01.xml").exists()
+
+    def test_current_part_not_written_to_disk(self, tmp_path):
+        """The current version can change, so it is only cached in memory."""
+        converter = ECFRConverter(data_dir=tmp_path)
+        converter._client = _mock_client(SAMPLE_SECTION_XML)
+        converter.fetch("26/1.32-1")
+
+        assert not (tmp_path / "parts").exists()
+
+    def test_least_recently_used_part_evicted(self, tmp_path):
+        """Only part_cache_size parsed parts are kept in memory."""
+        converter = ECFRConverter(data_dir=tmp_path, part_cache_size=1)
+        converter._client = _mock_client(SAMPLE_MULTIPLE_SECTIONS_XML)
+
+        converter.fetch_part(26, 1)
+        converter.fetch_part(26, 2)
+        converter.fetch_part(26, 1)
+
+        assert converter._client.get.call_count == 3
+
+    def test_errors_not_cached(self, tmp_path):
+        """A failed download is retried on the next call."""
+        import httpx
+
+        converter = ECFRConverter(data_dir=tmp_path)
+        converter._client = _mock_client(SAMPLE_SECTION_XML)
+        converter._client.get.side_effect = [
+            httpx.ConnectError("connection refused"),
+            converter._client.get.return_value,
+        ]
+
+        assert "Request error" in converter.fetch("26/1.32-1").error
+        assert converter.fetch("26/1.32-1").success
+
+
 class TestFetchResult:
     """Tests for FetchResult dataclass."""
 
@@ -372,3 +460,150 @@ class TestModuleFunctions:
 
             assert result.success
             mock_converter.fetch.assert_called_once_with("26/1.32", as_of=None)
+
+    def test_does_not_import_storage(self):
+        """Importing the converter leaves the storage layer unloaded."""
+        code = (
+            "import sys, arch.converters.ecfr; "
+            "assert 'arch.storage.regulation' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestECFRFetchTitle:
+    """Tests for streaming whole titles."""
+
+    TITLE_XML = SAMPLE_MULTIPLE_SECTIONS_XML.encode()
+
+    def _converter(self, tmp_path, requests):
+        import httpx
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=iter([self.TITLE_XML[:100], self.TITLE_XML[100:]]))
+
+        converter = ECFRConverter(data_dir=tmp_path)
+        converter._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return converter
+
+    def test_fetch_title_streams_to_cache(self, tmp_path):
+        """The title is streamed to the cache file and parsed from it."""
+        requests = []
+        converter = self._converter(tmp_path, requests)
+        as_of = date(2024, 1, 1)
+
+        regulations = list(converter.fetch_title(26, as_of=as_of))
+        again = list(converter.fetch_title(26, as_of=as_of))
+
+        assert [r.citation.section for r in regulations] == ["32-1", "32-2"]
+        assert regulations[0].authority == "Authority: 26 U.S.C. 7805"
+        assert [r.model_dump() for r in again] == [r.model_dump() for r in regulations]
+        assert len(requests) == 1
+        assert (tmp_path / "title-26_2024-01-01.xml").read_bytes() == self.TITLE_XML
+
+    def test_fetch_title_without_cache(self, tmp_path):
+        """With cache=False sections are parsed straight off the HTTP body."""
+        requests = []
+        converter = self._converter(tmp_path, requests)
+
+        regulations = list(converter.fetch_title(26, cache=False))
+
+        assert [r.citation.section for r in regulations] == ["32-1", "32-2"]
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestECFRTrackPart:
+    """Tests for recording a part's history across dates."""
+
+    JUNE_XML = (
+        SAMPLE_MULTIPLE_SECTIONS_XML.replace(
+            "Test content for section 32-1.", "Amended content for section 32-1."
+        )
+        .replace('N="§ 1.32-2"', 'N="§ 1.32-3"')
+        .replace("§ 1.32-2   Qualifying child.", "§ 1.32-3   Eligible individual.")
+    )
+
+    def _converter(self, tmp_path, requests):
+        import httpx
+
+        def handler(request):
+            requests.append(request)
+            if "/2024-01-01/" in request.url.path:
+                return httpx.Response(200, text=SAMPLE_MULTIPLE_SECTIONS_XML)
+            return httpx.Response(200, text=self.JUNE_XML)
+
+        converter = ECFRConverter(data_dir=tmp_path / "ecfr")
+        converter._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return converter
+
+    def test_track_part_records_changes(self, tmp_path):
+        """Each snapshot reports its changes and only changed sections are stored."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        converter = self._converter(tmp_path, [])
+        dates = [date(2024, 12, 1), date(2024, 1, 1), date(2024, 6, 1)]
+
+        changes = converter.track_part(26, 1, dates, storage)
+
+        assert [c.end for c in changes] == sorted(dates)
+        assert changes[0].added == ["32-1", "32-2"]
+        assert (changes[1].added, changes[1].changed, changes[1].removed) == (
+            ["32-3"],
+            ["32-1"],
+            ["32-2"],
+        )
+        assert changes[2].sections == [] and changes[2].unchanged == 2
+        versions = storage.db.execute("SELECT COUNT(*) FROM regulation_versions").fetchone()[0]
+        assert versions == 4
+
+    def test_diff_answered_without_downloading(self, tmp_path):
+        """Recorded dates are not fetched again; diffs come from storage."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        requests = []
+        converter = self._converter(tmp_path, requests)
+        converter.track_part(26, 1, [date(2024, 1, 1), date(2024, 6, 1)], storage)
+
+        assert converter.track_part(26, 1, [date(2024, 6, 1)], storage) == []
+        assert len(requests) == 2
+
+        diff = storage.diff_part(26, 1, date(2024, 3, 1), date(2024, 7, 1))
+        assert diff.sections == ["32-1", "32-2", "32-3"]
+
+    def test_earlier_date_replays_history_from_disk(self, tmp_path):
+        """A date before the latest snapshot rebuilds history from cached parts."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        requests = []
+        converter = self._converter(tmp_path, requests)
+        converter.track_part(26, 1, [date(2024, 6, 1)], storage)
+
+        changes = converter.track_part(26, 1, [date(2024, 1, 1)], storage)
+
+        assert [c.end for c in changes] == [date(2024, 1, 1)]
+        assert storage.part_snapshot_dates(26, 1) == [date(2024, 1, 1), date(2024, 6, 1)]
+        assert storage.diff_part(26, 1, date(2024, 1, 1), date(2024, 6, 1)).changed == ["32-1"]
+        assert len(requests) == 2
+
+    def test_failed_replay_keeps_history(self, tmp_path):
+        """A download failing during a replay leaves the recorded history intact."""
+        import httpx
+
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        converter = self._converter(tmp_path, [])
+        converter.track_part(26, 1, [date(2024, 6, 1)], storage)
+        converter._client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            converter.track_part(26, 1, [date(2024, 1, 1)], storage)
+
+        assert storage.part_snapshot_dates(26, 1) == [date(2024, 6, 1)]
+        versions = storage.db.execute("SELECT COUNT(*) FROM regulation_versions").fetchone()[0]
+        assert versions == 2
@@ -0,0 +1,126 @@
+"""Tests for the cross-reference graph."""
+
+from datetime import date
+
+import pytest
+
+from arch.archive import Arch
+from arch.graph import CrossReferenceGraph
+from arch.models import Citation, Section
+
+EDGES = [
+    ("26 USC 32", "26 USC 152"),
+    ("26 USC 32", "26 USC 62"),
+    ("26 USC 152", "26 USC 151"),
+    ("26 USC 151", "26 USC 152"),
+    ("26 USC 24", "26 USC 152"),
+    ("26 USC 62", "26 USC 61"),
+]
+
+
+@pytest.fixture
+def graph():
+    return CrossReferenceGraph.from_edges(EDGES)
+
+
+class TestCrossReferenceGraph:
+    """Tests for CSR graph queries."""
+
+    def test_counts(self, graph):
+        assert len(graph) == 6
+        assert graph.edge_count == 6
+
+    def test_direct_neighbors(self, graph):
+        assert sorted(graph.references_to("26 USC 32")) == ["26 USC 152", "26 USC 62"]
+        assert sorted(graph.referenced_by("26 USC 152")) == [
+            "26 USC 151",
+            "26 USC 24",
+            "26 USC 32",
+        ]
+
+    def test_reachable_with_depth(self, graph):
+        assert graph.reachable("26 USC 32") == {
+            "26 USC 152": 1,
+            "26 USC 62": 1,
+            "26 USC 151": 2,
+            "26 USC 61": 2,
+        }
+        assert set(graph.reachable("26 USC 32", max_depth=1)) == {"26 USC 152", "26 USC 62"}
+
+    def test_reverse_reachable(self, graph):
+        assert graph.reachable("26 USC 61", reverse=True) == {"26 USC 62": 1, "26 USC 32": 2}
+
+    def test_unknown_citation(self, graph):
+        assert graph.reachable("99 USC 1") == {}
+        assert graph.in_degree("99 USC 1") == 0
+
+    def test_most_cited(self, graph):
+        assert graph.most_cited(1) == [("26 USC 152", 3)]
+
+    def test_strongly_connected_components(self, graph):
+        components = graph.strongly_connected_components()
+        assert [sorted(c) for c in components] == [["26 USC 151", "26 USC 152"]]
+
+    def test_snapshot_roundtrip(self, graph, tmp_path):
+        graph.fingerprint = "6:6"
+        graph.save(tmp_path / "g.graph")
+        loaded = CrossReferenceGraph.load(tmp_path / "g.graph")
+
+        assert loaded.fingerprint == "6:6"
+        assert loaded.nodes == graph.nodes
+        assert loaded.reachable("26 USC 32") == graph.reachable("26 USC 32")
+
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / "bogus.graph"
+        path.write_bytes(b"not a graph\n")
+        with pytest.raises(ValueError):
+            CrossReferenceGraph.load(path)
+
+
+class TestArchGraph:
+    """Tests for graph access through Arch."""
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        archive = Arch(db_path=tmp_path / "test.db")
+        archive.storage.store_sections(
+            Section(
+                citation=Citation.from_string(source),
+                title_name="Internal Revenue Code",
+                section_title="",
+                text="",
+                references_to=[target for s, target in EDGES if s == source],
+                source_url="",
+                retrieved_at=date(2025, 1, 1),
+            )
+            for source in dict.fromkeys(s for s, _ in EDGES)
+        )
+        return archive
+
+    def test_dependencies_and_dependents(self, archive):
+        assert archive.get_dependencies("26 USC 32", max_depth=1) == {
+            "26 USC 152": 1,
+            "26 USC 62": 1,
+        }
+        assert "26 USC 32" in archive.get_dependents("26 USC 61")
+
+    def test_snapshot_rebuilt_when_references_rewritten(self, archive, tmp_path):
+        archive.graph  # noqa: B018 - loads and snapshots the graph
+
+        # Rewrite the newest edge in place (62 now cites 151, not 61): the row
+        # count and max rowid stay the same
+        section = archive.storage.get_section(26, "62")
+        section.references_to = ["26 USC 151"]
+        archive.storage.store_section(section)
+
+        reloaded = Arch(db_path=tmp_path / "test.db").graph
+        assert reloaded.reachable("26 USC 62", max_depth=1) == {"26 USC 151": 1}
+
+    def test_snapshot_written_and_reused(self, archive, tmp_path):
+        archive.graph  # noqa: B018 - loads and snapshots the graph
+        snapshot = tmp_path / "test.db.graph"
+        assert snapshot.exists()
+
+        reloaded = Arch(db_path=tmp_path / "test.db").load_graph()
+        assert reloaded.fingerprint == archive.graph.fingerprint
+        assert reloaded.edge_count == 6
@@ -1,5 +1,8 @@
 """Tests for regulation storage backend."""
 
+import subprocess
+import sys
+
 import pytest
 from datetime import date
 from pathlib import Path
@@ -328,3 +331,274 @@ class TestRegulationsByPart:
         regs = storage.list_regulations_in_part(26, 1)
         assert len(regs) == 1
         assert regs[0].citation.part == 1
+
+    def test_list_runs_one_query(self, tmp_path):
+        """Rows are decoded without a column-name query per row."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        storage.store_regulations(
+            _regulation(f"3402-{n}", f"Withholding {n}", "...") for n in range(1, 6)
+        )
+        statements = []
+        storage.db.conn.set_trace_callback(statements.append)
+
+        regs = storage.list_regulations_in_part(26, 31)
+
+        assert [r.heading for r in regs][:2] == ["Withholding 1", "Withholding 2"]
+        assert len(regs) == 5
+        assert len(statements) == 1
+        assert storage.get_regulation(26, 31, "3402-3").heading == "Withholding 3"
+        assert len(statements) == 2
+
+
+def _regulation(section: str, heading: str, full_text: str, title: int = 26):
+    from arch.models_regulation import CFRCitation, Regulation
+
+    return Regulation(
+        citation=CFRCitation(title=title, part=31, section=section),
+        heading=heading,
+        authority="26 U.S.C. 3402",
+        source="T.D. 9000",
+        full_text=full_text,
+        effective_date=date(2021, 1, 1),
+    )
+
+
+class TestBulkStoreRegulations:
+    """Tests for batched regulation ingest with a deferred FTS rebuild."""
+
+    def test_store_regulations_indexes_all(self, tmp_path):
+        """Bulk-stored regulations are counted, retrievable and searchable."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        count = storage.store_regulations(
+            (
+                _regulation(f"3402-{i}", f"Rule {i}", f"withholding rule number {i}")
+                for i in range(25)
+            ),
+            batch_size=10,
+        )
+
+        assert count == 25
+        assert storage.count_regulations(26) == 25
+        assert len(storage.search("withholding", limit=100)) == 25
+        assert storage.get_regulation(26, 31, "3402-7").heading == "Rule 7"
+
+    def test_store_regulations_restores_triggers(self, tmp_path):
+        """Single-row stores after a bulk load still keep the FTS index in sync."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        storage.store_regulations([_regulation("3402-1", "Old", "obsolete wording")])
+        storage.store_regulation(_regulation("3402-1", "New", "revised wording"))
+
+        assert storage.search("obsolete") == []
+        assert [r.heading for r in storage.search("revised")] == ["New"]
+        # Raises if the index disagrees with the table
+        storage.db.execute(
+            "INSERT INTO regulations_fts(regulations_fts) VALUES ('integrity-check')"
+        )
+
+    def test_interrupted_bulk_load_repaired_on_open(self, tmp_path):
+        """Triggers dropped by a load killed mid-way are restored on reopen."""
+        from arch.storage.regulation import RegulationStorage
+
+        def interrupted():
+            yield _regulation("3402-1", "Wages", "withholding on wages")
+            raise KeyboardInterrupt  # Killed before the finally block can run
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        storage._end_bulk_load = lambda: None
+        with pytest.raises(KeyboardInterrupt):
+            storage.store_regulations(interrupted(), batch_size=1)
+        exited = subprocess.Popen([sys.executable, "-c", ""])
+        exited.wait()
+        storage.db.execute("UPDATE bulk_loads SET pid = ?", [exited.pid])
+        storage.db.conn.commit()
+
+        reopened = RegulationStorage(tmp_path / "test.db")
+        reopened.store_regulation(_regulation("3402-2", "Tips", "reporting of tips"))
+        assert [r.heading for r in reopened.search("withholding")] == ["Wages"]
+        assert [r.heading for r in reopened.search("tips")] == ["Tips"]
+
+    def test_running_bulk_load_not_repaired_on_open(self, tmp_path):
+        """Opening the database mid-load leaves the loader's triggers dropped."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        triggers_mid_load = set()
+
+        def loading():
+            yield _regulation("3402-1", "Wages", "withholding on wages")
+            RegulationStorage(tmp_path / "test.db")
+            triggers_mid_load.update(
+                name
+                for (name,) in storage.db.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+                ).fetchall()
+            )
+            yield _regulation("3402-2", "Tips", "reporting of tips")
+
+        assert storage.store_regulations(loading(), batch_size=1) == 2
+        assert not {"regulations_ai", "regulations_ad", "regulations_au"} & triggers_mid_load
+        assert [r.heading for r in storage.search("tips")] == ["Tips"]
+
+
+class TestCombinedSearch:
+    """Tests for searching statutes and regulations together."""
+
+    def _store_statute(self, db_path, section: str, text: str, compression=None):
+        from arch.models import Citation, Section
+        from arch.storage.sqlite import SQLiteStorage
+
+        statutes = SQLiteStorage(db_path)
+        statutes.store_section(
+            Section(
+                citation=Citation(title=26, section=section),
+                title_name="Internal Revenue Code",
+                section_title=f"Section {section}",
+                text=text,
+                subsections=[],
+                source_url=f"https://uscode.house.gov/view.xhtml?req=26+USC+{section}",
+                retrieved_at=date(2024, 1, 1),
+            )
+        )
+        if compression:
+            statutes.set_compression(compression)
+
+    def test_merges_statutes_and_regulations(self, tmp_path):
+        """Hits from both indexes come back in one list ordered by score."""
+        from arch.storage.regulation import RegulationStorage
+
+        db_path = tmp_path / "combined.db"
+        self._store_statute(db_path, "3402", "Income tax collected at source by withholding.")
+        storage = RegulationStorage(db_path)
+        storage.store_regulations(
+            [
+                _regulation("3402(a)-1", "Withholding", "Withholding withholding withholding."),
+                _regulation("3401(a)-1", "Wages", "Remuneration for services."),
+            ]
+        )
+
+        results = storage.search_combined("withholding")
+
+        assert {r.doc_type for r in results} == {"statute", "regulation"}
+        assert {r.citation for r in results} == {"26 USC 3402", "26 CFR 31.3402(a)-1"}
+        assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+        assert all("<mark>" in r.snippet for r in results)
+
+    def test_title_filter_and_limit(self, tmp_path):
+        """The title filter applies to both sources and the limit to the merged list."""
+        from arch.storage.regulation import RegulationStorage
+
+        db_path = tmp_path / "combined.db"
+        self._store_statute(db_path, "3402", "Withholding of tax on wages.")
+        storage = RegulationStorage(db_path)
+        storage.store_regulations(
+            [
+                _regulation("3402-1", "Withholding", "Withholding on wages."),
+                _regulation("273.1", "Households", "Withholding of benefits.", title=7),
+            ]
+        )
+
+        assert len(storage.search_combined("withholding")) == 3
+        assert len(storage.search_combined("withholding", limit=2)) == 2
+        assert {r.citation for r in storage.search_combined("withholding", title=7)} == {
+            "7 CFR 31.273.1"
+        }
+
+    def test_compressed_statute_snippets(self, tmp_path):
+        """Snippets are read from compressed statute text."""
+        from arch.storage.regulation import RegulationStorage
+
+        db_path = tmp_path / "combined.db"
+        self._store_statute(db_path, "3402", "Income tax collected at source.", compression="zlib")
+        storage = RegulationStorage(db_path)
+
+        results = storage.search_combined("collected")
+        assert [r.citation for r in results] == ["26 USC 3402"]
+        assert "<mark>collected</mark>" in results[0].snippet
+
+    def test_regulations_only_database(self, tmp_path):
+        """Without a sections table only regulations are searched."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        storage.store_regulations([_regulation("3402-1", "Withholding", "Withholding on wages.")])
+
+        results = storage.search_combined("withholding")
+        assert [(r.doc_type, r.citation) for r in results] == [("regulation", "26 CFR 31.3402-1")]
+
+
+class TestPartHistory:
+    """Tests for point-in-time snapshots of CFR parts."""
+
+    def test_get_regulation_as_of(self, tmp_path):
+        """Each date returns the version recorded at or before it."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        storage.record_part_snapshot(
+            26, 31, [_regulation("3402-1", "Rule", "old text")], date(2024, 1, 1)
+        )
+        storage.record_part_snapshot(
+            26, 31, [_regulation("3402-1", "Rule", "new text")], date(2024, 6, 1)
+        )
+
+        assert storage.get_regulation_as_of(26, 31, "3402-1", date(2023, 12, 31)) is None
+        assert storage.get_regulation_as_of(26, 31, "3402-1", date(2024, 5, 31)).full_text == (
+            "old text"
+        )
+        assert storage.get_regulation_as_of(26, 31, "3402-1", date(2025, 1, 1)).full_text == (
+            "new text"
+        )
+
+    def test_whitespace_changes_not_recorded(self, tmp_path):
+        """Formatting-only differences do not create a new version."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        storage.record_part_snapshot(
+            26, 31, [_regulation("3402-1", "Rule", "some text")], date(2024, 1, 1)
+        )
+        changes = storage.record_part_snapshot(
+            26, 31, [_regulation("3402-1", "Rule", "some\n  text")], date(2024, 6, 1)
+        )
+
+        assert changes.sections == []
+        assert changes.unchanged == 1
+
+    def test_snapshots_must_be_in_date_order(self, tmp_path):
+        """Recording a date at or before the latest snapshot raises."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        storage.record_part_snapshot(26, 31, [], date(2024, 6, 1))
+
+        with pytest.raises(ValueError, match="not after"):
+            storage.record_part_snapshot(26, 31, [], date(2024, 1, 1))
+
+    def test_regulation_from_other_part_rejected(self, tmp_path):
+        """Every regulation in a snapshot must belong to the part."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        with pytest.raises(ValueError, match="is not in 26 CFR 1"):
+            storage.record_part_snapshot(
+                26, 1, [_regulation("3402-1", "Rule", "text")], date(2024, 1, 1)
+            )
+        assert storage.part_snapshot_dates(26, 1) == []
+
+    def test_diff_before_first_snapshot_raises(self, tmp_path):
+        """Dates without recorded history cannot be diffed."""
+        from arch.storage.regulation import RegulationStorage
+
+        storage = RegulationStorage(tmp_path / "test.db")
+        storage.record_part_snapshot(26, 31, [], date(2024, 6, 1))
+
+        with pytest.raises(ValueError, match="No snapshot"):
+            storage.diff_part(26, 31, date(2024, 1, 1), date(2024, 7, 1))
+        with pytest.raises(ValueError, match="after end date"):
+            storage.diff_part(26, 31, date(2024, 7, 1), date(2024, 6, 1))
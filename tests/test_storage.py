@@ -1,12 +1,19 @@
 """Tests for storage backends."""
 
+import json
+import sqlite3
+import subprocess
+import sys
 import tempfile
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 from pathlib import Path
 
 import pytest
 
-from arch.models import Citation, Section, Subsection
+from arch.archive import Arch
+from arch.models import Citation, Section, Subsection, TitleChanges
+from arch.storage.sharded import ShardedStorage, open_storage, shard_path
 from arch.storage.sqlite import SQLiteStorage
 
 
@@ -19,6 +26,13 @@ def temp_db():
     db_path.unlink(missing_ok=True)
 
 
+def _exited_pid() -> int:
+    """Pid of a process that has already exited."""
+    process = subprocess.Popen([sys.executable, "-c", ""])
+    process.wait()
+    return process.pid
+
+
 @pytest.fixture
 def storage(temp_db):
     """Create a SQLite storage instance."""
@@ -129,3 +143,863 @@ class TestSQLiteStorage:
         assert retrieved.subsections[0].identifier == "a"
         assert len(retrieved.subsections[0].children) == 1
         assert retrieved.subsections[0].children[0].identifier == "1"
+
+
+def _make_section(title: int, section: str, text: str, refs: list[str] | None = None) -> Section:
+    return Section(
+        citation=Citation(title=title, section=section),
+        title_name=f"Title {title}",
+        section_title=f"Section {section}",
+        text=text,
+        references_to=refs or [],
+        source_url=f"https://uscode.house.gov/view.xhtml?req={title}+USC+{section}",
+        retrieved_at=date.today(),
+        uslm_id=f"/us/usc/t{title}/s{section}",
+    )
+
+
+class TestSQLiteBulkStore:
+    """Tests for the batched store_sections path."""
+
+    def test_store_sections_returns_count(self, storage):
+        sections = (_make_section(26, str(i), f"text {i}") for i in range(1, 26))
+        assert storage.store_sections(sections, batch_size=10) == 25
+        assert storage.get_section(26, "25") is not None
+
+    def test_fts_rebuilt_after_bulk_load(self, storage):
+        storage.store_sections(
+            [
+                _make_section(26, "32", "earned income credit"),
+                _make_section(26, "24", "child tax credit"),
+            ]
+        )
+        results = storage.search("child")
+        assert [r.citation.section for r in results] == ["24"]
+
+    def test_triggers_restored_after_bulk_load(self, storage):
+        storage.store_sections([_make_section(26, "32", "earned income credit")])
+        storage.store_section(_make_section(26, "63", "standard deduction"))
+
+        triggers = {
+            row[0]
+            for row in storage.db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+            ).fetchall()
+        }
+        assert {"sections_ai", "sections_ad", "sections_au"} <= triggers
+        assert storage.search("deduction")[0].citation.section == "63"
+
+    def test_interrupted_bulk_load_repaired_on_open(self, temp_db):
+        def interrupted():
+            yield _make_section(26, "32", "earned income credit")
+            raise KeyboardInterrupt  # Killed before the finally block can run
+
+        storage = SQLiteStorage(temp_db)
+        storage._end_bulk_load = lambda: None
+        with pytest.raises(KeyboardInterrupt):
+            storage.store_sections(interrupted(), batch_size=1)
+        storage.db.execute("UPDATE bulk_loads SET pid = ?", [_exited_pid()])
+        storage.db.conn.commit()
+
+        reopened = SQLiteStorage(temp_db)
+        reopened.store_section(_make_section(26, "63", "standard deduction"))
+        assert reopened.search("earned")[0].citation.section == "32"
+        assert reopened.search("deduction")[0].citation.section == "63"
+        assert reopened.db.execute("SELECT COUNT(*) FROM bulk_loads").fetchone()[0] == 0
+
+    def test_running_bulk_load_not_repaired_on_open(self, temp_db):
+        storage = SQLiteStorage(temp_db)
+        triggers_mid_load = set()
+
+        def loading():
+            yield _make_section(26, "32", "earned income credit")
+            SQLiteStorage(temp_db)  # Another connection opens the database mid-load
+            triggers_mid_load.update(
+                name
+                for (name,) in storage.db.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+                ).fetchall()
+            )
+            yield _make_section(26, "63", "standard deduction")
+
+        assert storage.store_sections(loading(), batch_size=1) == 2
+        assert not {"sections_ai", "sections_ad", "sections_au"} & triggers_mid_load
+        assert storage.search("deduction")[0].citation.section == "63"
+        assert storage.db.execute("SELECT COUNT(*) FROM bulk_loads").fetchone()[0] == 0
+
+    def test_bulk_cross_references_replaced(self, storage):
+        storage.store_sections([_make_section(26, "32", "text", ["26 USC 24", "26 USC 152"])])
+        storage.store_sections([_make_section(26, "32", "text", ["26 USC 151"])])
+
+        assert storage.get_references_to(26, "32") == ["26 USC 151"]
+        assert storage.get_referenced_by(26, "151") == ["26 USC 32"]
+
+
+class TestSQLiteBatchLookup:
+    """Tests for get_sections batched lookups."""
+
+    def test_get_sections_aligned_with_input(self, storage):
+        storage.store_sections([_make_section(26, "32", "a"), _make_section(26, "24", "b")])
+
+        results = storage.get_sections(
+            [
+                Citation(title=26, section="24"),
+                Citation(title=42, section="1"),
+                Citation(title=26, section="32"),
+                Citation(title=26, section="24"),
+            ]
+        )
+
+        assert [r.citation.section if r else None for r in results] == ["24", None, "32", "24"]
+
+    def test_get_sections_spans_chunks(self, storage):
+        storage.store_sections(_make_section(26, str(i), f"text {i}") for i in range(1, 1001))
+
+        citations = [Citation(title=26, section=str(i)) for i in range(1, 1001)]
+        results = storage.get_sections(citations)
+
+        assert all(r is not None for r in results)
+        assert results[999].citation.section == "1000"
+
+    def test_get_sections_empty(self, storage):
+        assert storage.get_sections([]) == []
+
+
+class TestSQLiteReadOnlyMode:
+    """Tests for the concurrent read-only mode."""
+
+    def test_enables_wal(self, temp_db, sample_section):
+        SQLiteStorage(temp_db).store_section(sample_section)
+        reader = SQLiteStorage(temp_db, read_only=True)
+
+        assert reader.db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_concurrent_reads_from_threads(self, temp_db):
+        SQLiteStorage(temp_db).store_sections(
+            _make_section(26, str(i), f"text {i}") for i in range(1, 51)
+        )
+        reader = SQLiteStorage(temp_db, read_only=True)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: reader.get_section(26, str(i)), range(1, 51)))
+
+        assert [r.citation.section for r in results] == [str(i) for i in range(1, 51)]
+
+    def test_rejects_writes(self, temp_db, sample_section):
+        reader = SQLiteStorage(temp_db, read_only=True)
+
+        with pytest.raises(sqlite3.OperationalError):
+            reader.store_section(sample_section)
+
+
+class TestSQLiteDataVersion:
+    """Tests for the per-title data version used by caches and exports."""
+
+    def test_changes_only_with_the_title(self, storage):
+        storage.store_sections([_make_section(26, "32", "a"), _make_section(42, "1", "b")])
+        before = (storage.data_version(26), storage.data_version(42), storage.data_version())
+
+        storage.store_section(_make_section(42, "1", "amended"))
+
+        assert storage.data_version(26) == before[0]
+        assert storage.data_version(42) != before[1]
+        assert storage.data_version() != before[2]
+
+    def test_same_size_rewrite_changes_version(self, storage):
+        storage.store_section(_make_section(26, "32", "aaaa"))
+        before = storage.data_version(26)
+
+        storage.store_section(_make_section(26, "32", "bbbb"))
+
+        assert storage.data_version(26) != before
+
+    def test_checkpoint_keeps_version(self, temp_db):
+        SQLiteStorage(temp_db).store_section(_make_section(26, "32", "a"))
+        reader = SQLiteStorage(temp_db, read_only=True)
+        before = reader.data_version(26)
+
+        writer = SQLiteStorage(temp_db)
+        writer.db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        assert reader.data_version(26) == before
+        assert SQLiteStorage(temp_db).data_version(99) == "99:0"
+
+
+class TestSQLiteSubsections:
+    """Tests for subsection-granular storage."""
+
+    def test_subsections_stored_as_rows(self, storage, sample_section):
+        storage.store_section(sample_section)
+
+        paths = [
+            row[0] for row in storage.db.execute("SELECT path FROM subsections ORDER BY ordinal")
+        ]
+        assert paths == ["26/32/a", "26/32/a/1"]
+
+    def test_get_subtree(self, storage, sample_section):
+        storage.store_section(sample_section)
+        result = storage.get_section(26, "32", subsection="a/1")
+
+        assert result.citation.usc_cite == "26 USC 32(a)(1)"
+        assert [s.identifier for s in result.subsections] == ["1"]
+        assert result.text == "The credit shall be..."
+
+    def test_get_subtree_includes_descendants(self, storage, sample_section):
+        storage.store_section(sample_section)
+        result = storage.get_section(26, "32", subsection="a")
+
+        assert result.subsections[0].identifier == "a"
+        assert result.subsections[0].children[0].identifier == "1"
+
+    def test_get_missing_subsection(self, storage, sample_section):
+        storage.store_section(sample_section)
+        assert storage.get_section(26, "32", subsection="z") is None
+
+    def test_restore_replaces_subsections(self, storage, sample_section):
+        storage.store_section(sample_section)
+        sample_section.subsections = [Subsection(identifier="b", text="New")]
+        storage.store_section(sample_section)
+
+        retrieved = storage.get_section(26, "32")
+        assert [s.identifier for s in retrieved.subsections] == ["b"]
+
+    def test_duplicate_sibling_designations_kept(self, storage, sample_section):
+        sample_section.subsections = [
+            Subsection(
+                identifier="a", text="First a", children=[Subsection(identifier="1", text="x")]
+            ),
+            Subsection(
+                identifier="a", text="Second a", children=[Subsection(identifier="1", text="y")]
+            ),
+            Subsection(identifier="b", text="B"),
+        ]
+        storage.store_section(sample_section)
+
+        retrieved = storage.get_section(26, "32")
+        assert [(s.identifier, s.text) for s in retrieved.subsections] == [
+            ("a", "First a"),
+            ("a", "Second a"),
+            ("b", "B"),
+        ]
+        assert [s.children[0].text for s in retrieved.subsections[:2]] == ["x", "y"]
+        assert storage.get_section(26, "32", subsection="a").text == "First a\nx"
+
+    def test_legacy_subsections_json_fallback(self, storage, sample_section):
+        storage.store_section(sample_section)
+        # Simulate a row written before subsection rows existed
+        storage.db.execute("DELETE FROM subsections")
+        storage.db.execute(
+            "UPDATE sections SET subsections_json = ?",
+            ['[{"identifier": "a", "heading": null, "text": "Old", "children": []}]'],
+        )
+        storage.db.conn.commit()
+
+        assert storage.get_section(26, "32").subsections[0].text == "Old"
+        assert storage.get_section(26, "32", subsection="a").text == "Old"
+
+
+class TestPostgresSubsectionLookups:
+    """Tests for the backend-independent parts of PostgresStorage lookups."""
+
+    @pytest.fixture
+    def postgres(self):
+        from arch.storage.postgres import PostgresStorage
+
+        return PostgresStorage.__new__(PostgresStorage)  # No database needed
+
+    def test_subtree_matches_sqlite(self, postgres, storage, sample_section):
+        storage.store_section(sample_section)
+        expected = storage.get_section(26, "32", subsection="a")
+
+        result = postgres._subtree(sample_section, "a")
+        assert result.citation == expected.citation
+        assert result.text == expected.text
+        assert result.subsections == expected.subsections
+        assert postgres._subtree(sample_section, "z") is None
+
+    def test_as_of_not_supported(self, postgres):
+        with pytest.raises(NotImplementedError, match="as_of"):
+            postgres.get_section(26, "32", as_of=date(2020, 1, 1))
+        with pytest.raises(NotImplementedError, match="as_of"):
+            postgres.get_sections([Citation(title=26, section="32")], as_of=date(2020, 1, 1))
+
+
+class TestSQLiteVersions:
+    """Tests for point-in-time section versions."""
+
+    def test_as_of_returns_covering_version(self, storage):
+        storage.store_section(_make_section(26, "32", "old text"), valid_from=date(2019, 1, 1))
+        storage.store_section(_make_section(26, "32", "new text"), valid_from=date(2022, 1, 1))
+
+        assert storage.get_section(26, "32", as_of=date(2020, 1, 1)).text == "old text"
+        assert storage.get_section(26, "32", as_of=date(2022, 1, 1)).text == "new text"
+        assert storage.get_section(26, "32").text == "new text"
+
+    def test_as_of_before_first_version(self, storage):
+        storage.store_section(_make_section(26, "32", "text"), valid_from=date(2019, 1, 1))
+        assert storage.get_section(26, "32", as_of=date(2010, 1, 1)) is None
+
+    def test_unchanged_content_adds_no_version(self, storage):
+        storage.store_sections([_make_section(26, "32", "same")], valid_from=date(2019, 1, 1))
+        storage.store_sections([_make_section(26, "32", "same  ")], valid_from=date(2022, 1, 1))
+
+        rows = storage.db.execute("SELECT valid_from, valid_to FROM section_versions").fetchall()
+        assert rows == [("2019-01-01", None)]
+
+    def test_changed_content_closes_previous_version(self, storage):
+        storage.store_sections([_make_section(26, "32", "old")], valid_from=date(2019, 1, 1))
+        storage.store_sections([_make_section(26, "32", "new")], valid_from=date(2022, 1, 1))
+
+        rows = storage.db.execute(
+            "SELECT valid_from, valid_to FROM section_versions ORDER BY valid_from"
+        ).fetchall()
+        assert rows == [("2019-01-01", "2022-01-01"), ("2022-01-01", None)]
+
+    def test_out_of_order_version_rejected(self, storage):
+        storage.store_section(_make_section(26, "32", "new"), valid_from=date(2022, 1, 1))
+        with pytest.raises(ValueError):
+            storage.store_section(_make_section(26, "32", "old"), valid_from=date(2019, 1, 1))
+
+    def test_as_of_subsection(self, storage, sample_section):
+        storage.store_section(sample_section, valid_from=date(2019, 1, 1))
+        result = storage.get_section(26, "32", subsection="a/1", as_of=date(2020, 1, 1))
+
+        assert result.citation.usc_cite == "26 USC 32(a)(1)"
+        assert result.text == "The credit shall be..."
+
+
+class TestSQLiteIncrementalSync:
+    """Tests for syncing a title against a new parse by content hash."""
+
+    @pytest.fixture
+    def synced(self, storage):
+        storage.store_sections(
+            [
+                _make_section(26, "1", "tax imposed"),
+                _make_section(26, "2", "definitions", refs=["26 USC 1"]),
+                _make_section(26, "3", "repealed soon"),
+            ],
+            valid_from=date(2019, 1, 1),
+        )
+        return storage
+
+    def test_only_differences_written(self, synced):
+        rowid = synced.db.execute("SELECT rowid FROM sections WHERE section = '1'").fetchone()
+        changes = synced.sync_title(
+            26,
+            [
+                _make_section(26, "1", "tax imposed"),
+                _make_section(26, "2", "definitions amended"),
+                _make_section(26, "4", "new credit"),
+            ],
+            valid_from=date(2024, 1, 1),
+        )
+
+        assert (changes.added, changes.changed, changes.removed) == (["4"], ["2"], ["3"])
+        assert changes.unchanged == 1
+        assert set(changes.content_hashes) == {"2", "4"}
+        assert changes.summary() == "Title 26: 1 added, 1 changed, 1 removed, 1 unchanged"
+        # Unchanged rows are not rewritten
+        assert (
+            synced.db.execute("SELECT rowid FROM sections WHERE section = '1'").fetchone() == rowid
+        )
+        assert synced.get_section(26, "3") is None
+        assert synced.get_references_to(26, "2") == []
+
+    def test_fts_follows_changes(self, synced):
+        synced.sync_title(
+            26,
+            [_make_section(26, "1", "tax imposed"), _make_section(26, "2", "amended wording")],
+            valid_from=date(2024, 1, 1),
+        )
+
+        assert [r.citation.section for r in synced.search("amended")] == ["2"]
+        assert synced.search("definitions") == []
+        assert synced.search("repealed") == []
+        assert synced.count_matches("tax") == 1
+
+    def test_versions_closed_for_changes_and_removals(self, synced):
+        synced.sync_title(
+            26,
+            [_make_section(26, "1", "tax imposed"), _make_section(26, "2", "amended")],
+            valid_from=date(2024, 1, 1),
+        )
+
+        assert synced.get_section(26, "2", as_of=date(2020, 1, 1)).text == "definitions"
+        assert synced.get_section(26, "3", as_of=date(2020, 1, 1)).text == "repealed soon"
+        assert synced.get_section(26, "3", as_of=date(2024, 6, 1)) is None
+
+    def test_no_changes(self, synced):
+        changes = synced.sync_title(
+            26,
+            [
+                _make_section(26, "1", "tax imposed"),
+                _make_section(26, "2", "definitions", refs=["26 USC 1"]),
+                _make_section(26, "3", "repealed soon"),
+            ],
+        )
+        assert changes.written == 0
+        assert changes.unchanged == 3
+
+    def test_other_title_rejected(self, synced):
+        with pytest.raises(ValueError, match="title 26"):
+            synced.sync_title(26, [_make_section(42, "1", "wrong title")])
+
+    def test_removal_before_open_version_rejected(self, synced):
+        with pytest.raises(ValueError, match="predates"):
+            synced.sync_title(26, [], valid_from=date(2010, 1, 1))
+        assert synced.get_section(26, "1") is not None
+
+
+class TestSQLiteSearchPagination:
+    """Tests for keyset-paginated search."""
+
+    @pytest.fixture
+    def populated(self, storage):
+        storage.store_sections(
+            _make_section(26 if i % 2 else 42, str(i), "income " * (i % 7 + 1) + "credit")
+            for i in range(1, 31)
+        )
+        return storage
+
+    def test_pages_cover_all_results_in_order(self, populated):
+        expected = populated.search_page("income", limit=100).results
+
+        seen, cursor = [], None
+        while True:
+            page = populated.search_page("income", limit=7, cursor=cursor)
+            seen.extend(page.results)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert [r.citation for r in seen] == [r.citation for r in expected]
+        assert len(seen) == 30
+
+    def test_total_and_title_filter(self, populated):
+        page = populated.search_page("income", title=26, limit=5, include_total=True)
+
+        assert page.total == 15
+        assert all(r.citation.title == 26 for r in page.results)
+
+    def test_other_jurisdiction_matches_nothing(self, populated):
+        page = populated.search_page("income", jurisdiction="us-ca", include_total=True)
+        assert page.results == [] and page.total == 0
+
+    def test_invalid_cursor(self, populated):
+        with pytest.raises(ValueError):
+            populated.search_page("income", cursor="not-a-cursor")
+
+
+class TestSQLiteTitleExport:
+    """Tests for paging through a whole title."""
+
+    def test_pages_cover_title_in_section_order(self, storage, sample_section):
+        storage.store_section(sample_section)
+        storage.store_sections(_make_section(26, str(i), f"text {i}") for i in range(1, 12))
+        storage.store_section(_make_section(42, "1", "other title"))
+
+        seen, after = [], None
+        while page := storage.get_title_sections(26, after=after, limit=5):
+            seen.extend(page)
+            after = page[-1].citation.section
+
+        sections = [s.citation.section for s in seen]
+        assert sections == sorted(sections) and len(sections) == 12
+        assert next(s for s in seen if s.citation.section == "32").subsections[0].children
+
+    def test_arch_iter_title_resumes(self, temp_db):
+        storage = SQLiteStorage(temp_db)
+        storage.store_sections(_make_section(26, str(i), f"text {i}") for i in range(1, 6))
+        atlas = Arch(db_path=temp_db)
+
+        resumed = [s.citation.section for s in atlas.iter_title(26, after="2", batch_size=2)]
+
+        assert resumed == ["3", "4", "5"]
+
+
+class TestSQLiteTextCompression:
+    """Tests for compressed text columns."""
+
+    BOILERPLATE = (
+        "For purposes of this subsection, the term 'qualifying child' has the meaning given. "
+    )
+
+    @pytest.fixture
+    def loaded(self, storage, sample_section):
+        storage.store_section(sample_section)
+        storage.store_sections(
+            _make_section(26, str(n), self.BOILERPLATE * 3 + f"Credit number {n}.")
+            for n in range(100, 120)
+        )
+        return storage
+
+    @pytest.mark.parametrize("codec", ["zlib", "zstd"])
+    def test_migration_preserves_reads_and_search(self, loaded, sample_section, codec):
+        if codec == "zstd":
+            pytest.importorskip("zstandard")
+        before = loaded.get_section(26, "105")
+
+        loaded.set_compression(codec)
+
+        assert loaded.db.execute(
+            "SELECT typeof(text) FROM sections WHERE section = '105'"
+        ).fetchone() == ("blob",)
+        assert loaded.get_section(26, "105") == before
+        assert loaded.get_section(26, "32", subsection="a").subsections[0].text == (
+            sample_section.subsections[0].text
+        )
+        results = loaded.search("qualifying", limit=50)
+        assert len(results) == 20
+        assert "<mark>qualifying</mark>" in results[0].snippet
+
+    def test_format_persists_and_new_writes_are_indexed(self, loaded, temp_db):
+        loaded.set_compression("zlib")
+
+        reopened = SQLiteStorage(temp_db)
+        assert reopened.codec.name == "zlib"
+        assert 26 in reopened.codec.dictionaries
+        reopened.store_section(_make_section(26, "200", self.BOILERPLATE + "Unique zebra clause."))
+
+        reader = SQLiteStorage(temp_db, read_only=True)
+        assert [r.citation.section for r in reader.search("zebra")] == ["200"]
+        assert reader.get_section(26, "200").text.endswith("Unique zebra clause.")
+
+    def test_convert_back_to_plain(self, loaded):
+        before = loaded.get_section(26, "110")
+        loaded.set_compression("zlib")
+        loaded.set_compression(None)
+
+        assert loaded.db.execute(
+            "SELECT count(*) FROM sections WHERE typeof(text) = 'blob'"
+        ).fetchone() == (0,)
+        assert loaded.db.execute("SELECT count(*) FROM text_dictionaries").fetchone() == (0,)
+        assert loaded.get_section(26, "110") == before
+        assert len(loaded.search("qualifying", limit=50)) == 20
+
+    def test_unknown_codec(self, storage):
+        with pytest.raises(ValueError):
+            storage.set_compression("lzma")
+
+
+def _write_uslm_title(
+    path: Path, title: int, sections: dict[str, str], released: str | None = "2025-01-31"
+) -> Path:
+    """Write a minimal USLM XML file for a title, released on ``released``."""
+    body = "".join(
+        f'<section identifier="/us/usc/t{title}/s{num}"><num value="{num}">§ {num}.</num>'
+        f"<heading>Section {num}</heading><content>{text}</content></section>"
+        for num, text in sections.items()
+    )
+    meta = (
+        f"<meta><dcterms:created>{released}T12:00:00</dcterms:created></meta>" if released else ""
+    )
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<uscDoc xmlns="http://xml.house.gov/schemas/uslm/1.0" identifier="/us/usc/t{title}"'
+        f' xmlns:dcterms="http://purl.org/dc/terms/">{meta}'
+        f'<main><title identifier="/us/usc/t{title}"><num value="{title}">Title {title}</num>'
+        f"<heading>Title {title} Name</heading>{body}</title></main></uscDoc>"
+    )
+    return path
+
+
+class TestShardedStorage:
+    """Tests for title-sharded SQLite storage."""
+
+    @pytest.fixture
+    def sharded(self, tmp_path):
+        storage = ShardedStorage(tmp_path / "shards")
+        storage.store_sections(
+            [
+                _make_section(26, "32", "earned income credit", refs=["42 USC 601"]),
+                _make_section(26, "24", "child tax credit income"),
+                _make_section(42, "601", "grants for income support", refs=["26 USC 32"]),
+                _make_section(42, "602", "state plans"),
+            ]
+        )
+        return storage
+
+    def test_one_file_per_title(self, sharded, tmp_path):
+        assert sharded.titles == [26, 42]
+        assert shard_path(tmp_path / "shards", 26).exists()
+        assert sharded.shard(26).get_section(42, "601") is None
+
+    def test_routed_lookups(self, sharded):
+        assert sharded.get_section(42, "601").text == "grants for income support"
+        assert sharded.get_section(5, "1") is None
+
+        found = sharded.get_sections(
+            [
+                Citation(title=42, section="602"),
+                Citation(title=7, section="1"),
+                Citation(title=26, section="32"),
+            ]
+        )
+        assert [s and s.citation.section for s in found] == ["602", None, "32"]
+
+    def test_cross_shard_references(self, sharded):
+        assert sharded.get_referenced_by(26, "32") == ["42 USC 601"]
+        assert sorted(sharded.iter_cross_references()) == [
+            ("26 USC 32", "42 USC 601"),
+            ("42 USC 601", "26 USC 32"),
+        ]
+
+    def test_search_merges_shards_and_paginates(self, sharded):
+        first = sharded.search_page("income", limit=2, include_total=True)
+        assert first.total == 3
+        second = sharded.search_page("income", limit=2, cursor=first.next_cursor)
+
+        cites = [r.citation.usc_cite for r in first.results + second.results]
+        assert sorted(cites) == ["26 USC 24", "26 USC 32", "42 USC 601"]
+        assert second.next_cursor is None
+        assert [r.citation.title for r in sharded.search("income", title=42)] == [42]
+
+    def test_reingest_touches_only_its_shard(self, sharded, tmp_path):
+        other = shard_path(tmp_path / "shards", 42)
+        before = (other.stat().st_mtime_ns, other.read_bytes())
+
+        sharded.store_sections([_make_section(26, "32", "amended credit")])
+
+        assert (other.stat().st_mtime_ns, other.read_bytes()) == before
+        assert sharded.get_section(26, "32").text == "amended credit"
+
+    def test_open_storage_detects_directory(self, sharded, tmp_path):
+        reader = open_storage(tmp_path / "shards", read_only=True)
+        assert isinstance(reader, ShardedStorage)
+        assert reader.get_section(26, "24") is not None
+        assert isinstance(open_storage(tmp_path / "single.db"), SQLiteStorage)
+
+    def test_parallel_ingest(self, tmp_path):
+        paths = [
+            _write_uslm_title(tmp_path / "usc98.xml", 98, {"1": "alpha text", "2": "beta"}),
+            _write_uslm_title(tmp_path / "usc99.xml", 99, {"1": "gamma text"}),
+        ]
+        archive = Arch(storage=ShardedStorage(tmp_path / "shards"))
+
+        results = archive.ingest_titles(paths, workers=2)
+
+        assert {(r.title, r.sections) for r in results} == {(98, 2), (99, 1)}
+        assert [t.number for t in archive.list_titles()] == [98, 99]
+        assert archive.get("99 USC 1").text.endswith("gamma text")
+
+
+class TestParallelIngest:
+    """Tests for multi-file ingest into a single database."""
+
+    def test_workers_stream_to_single_writer(self, tmp_path):
+        paths = [
+            _write_uslm_title(
+                tmp_path / f"usc{t}.xml", t, {str(n): f"title {t} text {n}" for n in range(1, 6)}
+            )
+            for t in (97, 98, 99)
+        ]
+        archive = Arch(db_path=tmp_path / "atlas.db")
+        seen = []
+
+        results = archive.ingest_titles(paths, workers=2, batch_size=2, progress=seen.append)
+
+        assert sorted(r.title for r in results) == [97, 98, 99]
+        assert seen == results
+        assert all(r.sections == 5 and r.seconds >= 0 for r in results)
+        assert [(t.number, t.section_count) for t in archive.list_titles()] == [
+            (97, 5),
+            (98, 5),
+            (99, 5),
+        ]
+        assert [r.citation.title for r in archive.search("text", title=98)] == [98] * 5
+
+    def test_duplicate_paths_ingested_once(self, tmp_path, monkeypatch):
+        path = _write_uslm_title(tmp_path / "usc99.xml", 99, {"1": "one", "2": "two"})
+        monkeypatch.chdir(tmp_path)
+        archive = Arch(db_path=tmp_path / "atlas.db")
+
+        results = archive.ingest_titles([path, "usc99.xml", str(path)], workers=2)
+
+        assert [(r.title, r.sections) for r in results] == [(99, 2)]
+        assert archive.list_titles()[0].section_count == 2
+
+    def test_titles_with_different_release_dates(self, tmp_path):
+        paths = [
+            _write_uslm_title(tmp_path / "usc98.xml", 98, {"1": "one"}, released="2025-01-31"),
+            _write_uslm_title(tmp_path / "usc99.xml", 99, {"1": "one"}, released="2025-02-28"),
+        ]
+        archive = Arch(db_path=tmp_path / "atlas.db")
+
+        with pytest.raises(ValueError, match="different release dates"):
+            archive.ingest_titles(paths, workers=2)
+        archive.ingest_titles(paths, workers=2, valid_from=date(2025, 3, 1))
+        assert archive.storage.db.execute(
+            "SELECT DISTINCT valid_from FROM section_versions"
+        ).fetchall() == [("2025-03-01",)]
+
+    def test_parse_error_propagates(self, tmp_path):
+        bad = tmp_path / "usc96.xml"
+        bad.write_text("<not-xml")
+        good = _write_uslm_title(tmp_path / "usc99.xml", 99, {"1": "fine"})
+
+        with pytest.raises(ValueError, match="usc96.xml"):
+            Arch(db_path=tmp_path / "atlas.db").ingest_titles([good, bad], workers=2)
+
+    def test_worker_error_stops_busy_ingest(self, tmp_path):
+        bad = tmp_path / "usc96.xml"
+        bad.write_text("<not-xml")
+        sections = {str(n): f"section text {n}" for n in range(1, 2001)}
+        good = _write_uslm_title(tmp_path / "usc99.xml", 99, sections)
+        archive = Arch(db_path=tmp_path / "atlas.db")
+
+        # The good title keeps the queue busy; the failure must still surface
+        # before it has been streamed in full
+        with pytest.raises(ValueError, match="usc96.xml"):
+            archive.ingest_titles([bad, good], workers=2, batch_size=1, valid_from=date(2025, 1, 1))
+        stored = archive.storage.db.execute("SELECT COUNT(*) FROM sections").fetchone()[0]
+        assert stored < len(sections)
+
+
+class TestIncrementalIngest:
+    """Tests for release point re-ingest through Arch.sync_title."""
+
+    def test_sync_title_from_xml(self, tmp_path):
+        xml_path = _write_uslm_title(tmp_path / "usc99.xml", 99, {"1": "one", "2": "two"})
+        archive = Arch(db_path=tmp_path / "atlas.db")
+        archive.ingest_title(xml_path, valid_from=date(2024, 1, 1))
+
+        _write_uslm_title(xml_path, 99, {"1": "one", "2": "two amended", "3": "three"})
+        changes = archive.sync_title(xml_path, valid_from=date(2025, 1, 1))
+
+        assert (changes.added, changes.changed, changes.removed) == (["3"], ["2"], [])
+        assert archive.get("99 USC 2").text.endswith("two amended")
+        assert archive.list_titles()[0].section_count == 3
+        assert archive.ingest_title(xml_path, incremental=True) == 0
+
+    def test_versions_dated_by_release_point(self, tmp_path):
+        xml_path = _write_uslm_title(tmp_path / "usc99.xml", 99, {"1": "one"}, "2024-06-10")
+        archive = Arch(db_path=tmp_path / "atlas.db")
+        archive.ingest_title(xml_path)
+
+        _write_uslm_title(xml_path, 99, {"1": "one amended"}, "2025-01-31")
+        changes = archive.sync_title(xml_path)
+
+        assert changes.valid_from == date(2025, 1, 31)
+        assert archive.get("99 USC 1", as_of=date(2024, 12, 1)).text.endswith("one")
+        assert archive.get("99 USC 1", as_of=date(2025, 2, 1)).text.endswith("one amended")
+
+    def test_undated_release_needs_valid_from(self, tmp_path):
+        xml_path = _write_uslm_title(tmp_path / "usc99.xml", 99, {"1": "one"}, released=None)
+        archive = Arch(db_path=tmp_path / "atlas.db")
+
+        with pytest.raises(ValueError, match="no release date"):
+            archive.ingest_title(xml_path)
+        with pytest.raises(ValueError, match="no release date"):
+            archive.sync_title(xml_path)
+        assert archive.get("99 USC 1") is None
+
+        archive.ingest_title(xml_path, valid_from=date(2024, 1, 1))
+        assert archive.get("99 USC 1", as_of=date(2024, 1, 1)) is not None
+
+    def test_sync_title_on_sharded_storage(self, tmp_path):
+        xml_path = _write_uslm_title(tmp_path / "usc99.xml", 99, {"1": "one"})
+        (tmp_path / "shards").mkdir()
+        archive = Arch(db_path=tmp_path / "shards")
+
+        changes = archive.sync_title(xml_path)
+        assert changes.added == ["1"]
+        assert shard_path(tmp_path / "shards", 99).exists()
+
+    CHANGES = TitleChanges(
+        title=26,
+        added=["4"],
+        changed=["2"],
+        removed=["3"],
+        unchanged=1,
+        content_hashes={"2": "aa", "4": "bb"},
+    )
+
+    def test_archive_records(self):
+        from arch.ingest.supabase import (
+            title_change_crawl_log,
+            title_change_sources,
+            title_change_versions,
+        )
+
+        retrieved = datetime(2025, 1, 2, tzinfo=timezone.utc)
+        sources = title_change_sources(self.CHANGES, retrieved)
+        source_ids = {s["path"]: f"id-{s['path']}" for s in sources}
+        versions = title_change_versions(
+            self.CHANGES, source_ids, retrieved, published_at=date(2025, 1, 1)
+        )
+        crawl_log = title_change_crawl_log(
+            self.CHANGES, source_ids, {"us/statute/26/4": "v4"}, retrieved
+        )
+
+        assert [s["path"] for s in sources] == [
+            "us/statute/26",
+            "us/statute/26/4",
+            "us/statute/26/2",
+            "us/statute/26/3",
+        ]
+        # Sources are upserted on path, so they carry no id of their own
+        assert all("id" not in s for s in sources)
+        assert [(v["source_id"], v["content_hash"]) for v in versions] == [
+            ("id-us/statute/26/4", "bb"),
+            ("id-us/statute/26/2", "aa"),
+        ]
+        # Nothing is uploaded, so no version points at an R2 object
+        assert all(v["r2_key"] is None and v["is_current"] for v in versions)
+        assert [c["status"] for c in crawl_log] == ["success", "success", "success", "removed"]
+        assert crawl_log[1]["new_version_id"] == "v4"
+        # Ids are deterministic, so re-recording a sync is idempotent
+        again = title_change_crawl_log(self.CHANGES, source_ids, {}, retrieved)
+        assert [c["id"] for c in again] == [c["id"] for c in crawl_log]
+        unchanged = title_change_crawl_log(TitleChanges(title=26), source_ids, {}, retrieved)
+        assert unchanged[0]["status"] == "no_change"
+
+    def test_record_title_changes_uses_stored_ids(self, monkeypatch):
+        import httpx
+
+        from arch.ingest.supabase import SupabaseIngestor
+
+        calls = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            calls.append((request.method, request.url.path, dict(request.url.params), body))
+            if request.method == "POST" and request.url.path.endswith("/sources"):
+                # Ids come from the database, not from the sync
+                return httpx.Response(
+                    201, json=[{"id": f"db:{row['path']}", "path": row["path"]} for row in body]
+                )
+            if request.method == "POST" and request.url.path.endswith("/versions"):
+                return httpx.Response(
+                    201, json=[{"id": f"ver:{row['content_hash']}", **row} for row in body]
+                )
+            return httpx.Response(201 if request.method == "POST" else 204)
+
+        real_client = httpx.Client
+        monkeypatch.setattr(
+            httpx,
+            "Client",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+        ingestor = SupabaseIngestor(url="https://example.supabase.co", key="key")
+
+        counts = ingestor.record_title_changes(self.CHANGES)
+
+        assert counts == {"sources": 4, "versions": 2, "crawl_log": 4}
+        assert [(method, path) for method, path, _, _ in calls] == [
+            ("POST", "/rest/v1/sources"),
+            ("PATCH", "/rest/v1/versions"),
+            ("POST", "/rest/v1/versions"),
+            ("POST", "/rest/v1/crawl_log"),
+        ]
+        assert calls[0][2]["on_conflict"] == "path"
+        assert calls[1][2]["source_id"] == "in.(db:us/statute/26/2,db:us/statute/26/3)"
+        assert calls[2][2]["on_conflict"] == "source_id,content_hash"
+        crawl_log = calls[3][3]
+        assert [c["source_id"] for c in crawl_log] == [
+            "db:us/statute/26",
+            "db:us/statute/26/4",
+            "db:us/statute/26/2",
+            "db:us/statute/26/3",
+        ]
+        assert [c.get("new_version_id") for c in crawl_log] == [None, "ver:bb", "ver:aa", None]
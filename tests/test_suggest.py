@@ -0,0 +1,121 @@
+"""Tests for the typeahead suggestion index."""
+
+from datetime import date
+
+import pytest
+
+from arch.archive import Arch
+from arch.models import Citation, Section
+from arch.suggest import MAX_KEY_LENGTH, SuggestIndex, normalize
+
+ENTRIES = [
+    ("26 USC 32", "Earned income"),
+    ("26 USC 3", "Rates of tax on individuals"),
+    ("26 USC 30D", "Clean vehicle credit"),
+    ("26 USC 61", "Gross income defined"),
+    ("26 CFR 1.32-1", "Earned income credit"),
+    ("NY-TAX-606", "Credits against tax"),
+]
+
+IN_DEGREE = {"26 USC 32": 5, "26 USC 61": 40, "26 USC 3": 2}
+
+
+@pytest.fixture
+def index():
+    return SuggestIndex.build(ENTRIES, popularity=lambda c: IN_DEGREE.get(c, 0))
+
+
+class TestNormalize:
+    """Tests for query and key normalization."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("26 U.S.C. § 32", "26 usc 32"),
+            ("26 usc 32", "26 usc 32"),
+            ("26 C.F.R. 1.32-1", "26 cfr 1.32-1"),
+            ("  Earned   Income,  ", "earned income"),
+            ("NY-TAX-606", "ny-tax-606"),
+        ],
+    )
+    def test_normalize(self, text, expected):
+        assert normalize(text) == expected
+
+
+class TestSuggestIndex:
+    """Tests for prefix lookups and ranking."""
+
+    def test_citation_prefix_ranked_by_popularity(self, index):
+        results = index.suggest("26 USC 3")
+
+        assert [s.citation for s in results] == ["26 USC 32", "26 USC 3", "26 USC 30D"]
+        assert results[0].cited_by == 5
+
+    def test_heading_prefix(self, index):
+        assert {s.citation for s in index.suggest("earned inc")} == {
+            "26 USC 32",
+            "26 CFR 1.32-1",
+        }
+
+    def test_heading_inner_word(self, index):
+        results = index.suggest("income")
+        assert [s.citation for s in results] == ["26 USC 61", "26 USC 32", "26 CFR 1.32-1"]
+
+    def test_cfr_and_state_citations(self, index):
+        assert index.suggest("26 c.f.r. 1.32")[0].citation == "26 CFR 1.32-1"
+        assert index.suggest("ny-tax")[0].heading == "Credits against tax"
+
+    def test_each_section_suggested_once(self, index):
+        # "Credits against tax" matches both "credits ..." and "tax"; "credit" prefixes both
+        citations = [s.citation for s in index.suggest("credit")]
+        assert len(citations) == len(set(citations)) == 3
+
+    def test_limit_and_no_match(self, index):
+        assert len(index.suggest("26", limit=2)) == 2
+        assert index.suggest("zzz") == []
+        assert index.suggest("§ ") == []
+
+    def test_long_query_matches_truncated_key(self):
+        heading = "word " * 30
+        index = SuggestIndex.build([("1 USC 1", heading)])
+        assert len(normalize(heading)) > MAX_KEY_LENGTH
+        assert index.suggest(heading)[0].citation == "1 USC 1"
+
+    def test_broad_prefix_ranks_every_match(self):
+        entries = [(f"42 USC {n}", f"Section {n}") for n in range(10000, 30000)]
+        index = SuggestIndex.build(entries, popularity=lambda c: 7 if c == "42 USC 29999" else 0)
+
+        results = index.suggest("4", limit=3)
+
+        assert [s.citation for s in results] == ["42 USC 29999", "42 USC 10000", "42 USC 10001"]
+
+
+class TestArchSuggest:
+    """Tests for suggestions through Arch."""
+
+    def test_ranked_by_in_degree(self, tmp_path):
+        archive = Arch(db_path=tmp_path / "test.db")
+        archive.storage.store_sections(
+            Section(
+                citation=Citation(title=26, section=number),
+                title_name="Internal Revenue Code",
+                section_title=heading,
+                text="",
+                references_to=refs,
+                source_url="",
+                retrieved_at=date(2025, 1, 1),
+            )
+            for number, heading, refs in [
+                ("1", "Tax imposed", ["26 USC 151"]),
+                ("151", "Allowance of deductions for personal exemptions", []),
+                ("152", "Dependent defined", ["26 USC 151"]),
+            ]
+        )
+
+        results = archive.suggest("26 USC 15")
+
+        assert [(s.citation, s.cited_by) for s in results] == [
+            ("26 USC 151", 2),
+            ("26 USC 152", 0),
+        ]
+        assert archive.suggest("dependent")[0].citation == "26 USC 152"
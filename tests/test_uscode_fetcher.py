@@ -0,0 +1,168 @@
+"""Tests for the US Code release point downloader."""
+
+import io
+import zipfile
+
+import httpx
+import pytest
+
+from arch.fetchers.uscode import (
+    USCodeFetcher,
+    discover_release_point,
+    release_point_url,
+)
+from arch.parsers.us.section_index import index_path
+from arch.parsers.us.statutes import USLMParser
+from tests.test_uslm_parser import SAMPLE_TITLE_XML
+
+DOWNLOAD_PAGE = """<html><body>
+<a href="releasepoints/us/pl/119/59/xml_usc01@119-59.zip">Title 1</a>
+<a href="releasepoints/us/pl/119/59/xml_uscAll@119-59.zip">All titles</a>
+</body></html>"""
+
+
+def make_zip(xml: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("usc99.xml", xml)
+    return buffer.getvalue()
+
+
+class FakeServer:
+    """uscode.house.gov stand-in supporting ETag, Range and If-Range."""
+
+    def __init__(self, body: bytes, etag: str = '"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+        self.fail_after: int | None = None  # Drop the connection after this many bytes
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith("download.shtml"):
+            return httpx.Response(200, text=DOWNLOAD_PAGE)
+        if "xml_usc99@" not in request.url.path:
+            return httpx.Response(404)
+        if request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+
+        headers = {"ETag": self.etag}
+        body, status = self.body, 200
+        range_header = request.headers.get("range")
+        if range_header and request.headers.get("if-range") == self.etag:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            if start >= len(self.body):
+                return httpx.Response(416)
+            body, status = self.body[start:], 206
+            headers["Content-Range"] = f"bytes {start}-{len(self.body) - 1}/{len(self.body)}"
+
+        if self.fail_after is not None:
+            limit, self.fail_after = self.fail_after, None
+
+            def stream():
+                yield body[:limit]
+                raise httpx.ReadError("connection reset")
+
+            return httpx.Response(status, headers=headers, content=stream())
+        return httpx.Response(status, headers=headers, content=body)
+
+
+@pytest.fixture
+def server():
+    return FakeServer(make_zip(SAMPLE_TITLE_XML))
+
+
+@pytest.fixture
+def fetcher(server, tmp_path):
+    client = httpx.Client(transport=httpx.MockTransport(server.handler))
+    return USCodeFetcher(tmp_path, client=client)
+
+
+class TestReleasePoints:
+    """Tests for release point URLs and discovery."""
+
+    def test_release_point_url(self):
+        assert release_point_url(26, "119-59") == (
+            "https://uscode.house.gov/download/releasepoints/us/pl/119/59/xml_usc26@119-59.zip"
+        )
+
+    def test_discover_release_point(self, server):
+        client = httpx.Client(transport=httpx.MockTransport(server.handler))
+        assert discover_release_point(client) == "119-59"
+
+    def test_discovery_fails_without_links(self):
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+        with pytest.raises(ValueError, match="No release point"):
+            discover_release_point(client)
+
+
+class TestUSCodeFetcher:
+    """Tests for streaming, resumable and conditional downloads."""
+
+    def test_download_and_extract(self, fetcher, server, tmp_path):
+        result = fetcher.download_title(99)
+
+        assert result.changed
+        assert result.release_point == "119-59"
+        assert result.bytes_downloaded == len(server.body)
+        assert result.path == tmp_path / "usc99.xml"
+        assert result.path.read_text() == SAMPLE_TITLE_XML
+        assert index_path(result.path).exists()
+
+    def test_unchanged_title_skipped(self, fetcher, server):
+        fetcher.download_title(99)
+        result = fetcher.download_title(99)
+
+        assert not result.changed
+        assert result.bytes_downloaded == 0
+        assert server.requests[-1].headers["if-none-match"] == '"v1"'
+
+    def test_changed_title_downloaded_again(self, fetcher, server):
+        fetcher.download_title(99)
+        server.body = make_zip(SAMPLE_TITLE_XML.replace("Tax imposed.", "Tax repealed."))
+        server.etag = '"v2"'
+
+        result = fetcher.download_title(99)
+        assert result.changed
+        assert "Tax repealed." in result.path.read_text()
+
+    def test_resume_interrupted_download(self, fetcher, server, tmp_path):
+        server.fail_after = 100
+        with pytest.raises(httpx.ReadError):
+            fetcher.download_zip(99)
+        assert (tmp_path / "usc99.zip.part").stat().st_size == 100
+
+        result = fetcher.download_zip(99)
+        assert server.requests[-1].headers["range"] == "bytes=100-"
+        assert result.bytes_downloaded == len(server.body) - 100
+        assert result.path.read_bytes() == server.body
+        assert not (tmp_path / "usc99.zip.part").exists()
+
+    def test_resume_restarts_when_file_changed(self, fetcher, server, tmp_path):
+        server.fail_after = 100
+        with pytest.raises(httpx.ReadError):
+            fetcher.download_zip(99)
+        server.body = make_zip(SAMPLE_TITLE_XML.replace("Tax imposed.", "Tax repealed."))
+        server.etag = '"v2"'
+
+        result = fetcher.download_zip(99)
+        assert result.bytes_downloaded == len(server.body)
+        assert result.path.read_bytes() == server.body
+
+    def test_missing_title_raises(self, fetcher):
+        with pytest.raises(httpx.HTTPStatusError):
+            fetcher.download_zip(53)
+
+    def test_parse_from_zip_without_extracting(self, fetcher):
+        result = fetcher.download_title(99, extract=False)
+
+        assert result.path.suffix == ".zip"
+        parser = USLMParser(result.path)
+        assert parser.get_title_number() == 99
+        assert [s.citation.section for s in parser.iter_sections(streaming=True)] == [
+            "1",
+            "2",
+            "2a",
+            "3",
+        ]
+        assert USLMParser(result.path).get_section("3").text.endswith("Tax imposed.")
@@ -0,0 +1,230 @@
+"""Tests for the USLM (US Code XML) parser."""
+
+from datetime import date
+
+import pytest
+
+from arch.parsers.us.section_index import SectionIndex, index_path
+from arch.parsers.us.statutes import USLMParser
+
+SAMPLE_TITLE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<uscDoc xmlns="http://xml.house.gov/schemas/uslm/1.0" identifier="/us/usc/t99">
+<meta><docNumber>99</docNumber></meta>
+<main><title identifier="/us/usc/t99"><num value="99">Title 99—</num><heading>Test Title</heading>
+<chapter identifier="/us/usc/t99/ch1"><heading>General provisions</heading>
+<section identifier="/us/usc/t99/s1"><num value="1">§ 1.</num><heading>Definitions</heading>
+<subsection identifier="/us/usc/t99/s1/a"><num value="a">(a)</num><heading>In general</heading>
+<content>The term earned income means wages. See <ref href="/us/usc/t99/s2">section 2</ref>.</content>
+<paragraph identifier="/us/usc/t99/s1/a/1"><num value="1">(1)</num><content>First paragraph.</content>
+</paragraph>
+</subsection>
+<subsection identifier="/us/usc/t99/s1/b"><num value="b">(b)</num><content>Other.</content>
+</subsection>
+</section>
+<section identifier="/us/usc/t99/s2"><num value="2">§ 2.</num><heading>Credit</heading>
+<content>A credit is allowed. Refer to <ref href="/us/usc/t26/s32">26 USC 32</ref>.</content>
+<notes><note><quotedContent>
+<section identifier="/us/usc/t99/s2a"><num value="2a">§ 2a.</num><heading>Quoted</heading>
+<content>Amended text.</content></section>
+</quotedContent></note></notes>
+</section>
+</chapter>
+<chapter identifier="/us/usc/t99/ch2"><heading>Taxes</heading>
+<section identifier="/us/usc/t99/s3"><num value="3">§ 3.</num><heading>Tax</heading>
+<content>Tax imposed.</content></section>
+</chapter>
+</title></main></uscDoc>
+"""
+
+
+@pytest.fixture
+def xml_path(tmp_path):
+    path = tmp_path / "usc99.xml"
+    path.write_text(SAMPLE_TITLE_XML)
+    return path
+
+
+class TestUSLMParser:
+    """Tests for tree-mode parsing."""
+
+    def test_title_header(self, xml_path):
+        parser = USLMParser(xml_path)
+        assert parser.get_title_number() == 99
+        assert parser.get_title_name() == "Test Title"
+
+    def test_iter_sections(self, xml_path):
+        sections = list(USLMParser(xml_path).iter_sections())
+
+        assert [s.citation.section for s in sections] == ["1", "2", "2a", "3"]
+        assert sections[0].subsections[0].children[0].identifier == "1"
+        assert sections[1].references_to == ["26 USC 32"]
+
+    def test_header_read_without_loading_tree(self, xml_path):
+        parser = USLMParser(xml_path)
+        parser.get_title_number()
+        parser.get_title_name()
+        assert parser._tree is None
+
+    def test_release_date(self, xml_path, tmp_path):
+        path = tmp_path / "usc99-dated.xml"
+        path.write_text(
+            SAMPLE_TITLE_XML.replace(
+                "<docNumber>99</docNumber>",
+                '<docNumber>99</docNumber><dcterms:created xmlns:dcterms="http://purl.org/dc/terms/">'
+                "2025-01-31T10:15:00</dcterms:created>",
+            )
+        )
+
+        parser = USLMParser(path)
+        assert parser.get_release_date() == date(2025, 1, 31)
+        assert parser._tree is None
+        assert USLMParser(xml_path).get_release_date() is None
+
+
+class TestUSLMStreaming:
+    """Tests for iterparse-based streaming mode."""
+
+    def test_matches_tree_mode(self, xml_path):
+        tree = list(USLMParser(xml_path).iter_sections())
+        streamed = list(USLMParser(xml_path).iter_sections(streaming=True))
+
+        assert streamed == tree
+
+    def test_does_not_load_tree(self, xml_path):
+        parser = USLMParser(xml_path)
+        sections = list(parser.iter_sections(streaming=True))
+
+        assert sections[0].title_name == "Test Title"
+        assert sections[0].citation.title == 99
+        assert parser._tree is None
+        assert parser.get_title_number() == 99
+
+    def test_title_number_from_title_identifier(self, tmp_path):
+        path = tmp_path / "usc99.xml"
+        path.write_text(SAMPLE_TITLE_XML.replace("<meta><docNumber>99</docNumber></meta>", ""))
+
+        sections = list(USLMParser(path).iter_sections(streaming=True))
+        assert {s.citation.title for s in sections} == {99}
+
+    def test_missing_title_number(self, tmp_path):
+        path = tmp_path / "bad.xml"
+        path.write_text(
+            '<uscDoc xmlns="http://xml.house.gov/schemas/uslm/1.0"><main>'
+            '<section identifier="/us/usc/t99/s1"><heading>X</heading></section>'
+            "</main></uscDoc>"
+        )
+
+        with pytest.raises(ValueError, match="title number"):
+            list(USLMParser(path).iter_sections(streaming=True))
+
+
+NESTED_SECTION_XML = """<uscDoc xmlns="http://xml.house.gov/schemas/uslm/1.0">
+<meta><docNumber>99</docNumber></meta><main><title identifier="/us/usc/t99">
+<section identifier="/us/usc/t99/s5"><num value="5">§ 5.</num><heading>Rates <i>generally</i></heading>
+<subsection identifier="/us/usc/t99/s5/a"><num value="a">(a)</num><heading>Rate</heading>
+<chapeau>The rate is—</chapeau>
+<paragraph identifier="/us/usc/t99/s5/a/1"><num value="1">(1)</num><content>10 percent, and</content>
+</paragraph>
+<!-- editorial comment -->
+<paragraph identifier="/us/usc/t99/s5/a/2"><num value="2">(2)</num><content>20 percent
+under <ref href="/us/usc/t26/s1">section 1</ref>.</content></paragraph>
+<continuation>of taxable income.</continuation>
+</subsection>
+<paragraph identifier="/us/usc/t99/s5/9"><content>Stray paragraph.</content></paragraph>
+<subsection identifier="/us/usc/t99/s5/b"><content>See <ref href="/us/usc/t26/s1">section 1</ref>
+and <ref href="/us/usc/t26/s32">section 32</ref>.</content></subsection>
+<subsection><content>No identifier.</content></subsection>
+</section></title></main></uscDoc>
+"""
+
+
+class TestSectionVisitor:
+    """Tests for the single-pass section hierarchy walk."""
+
+    @pytest.fixture
+    def section(self, tmp_path):
+        path = tmp_path / "usc99.xml"
+        path.write_text(NESTED_SECTION_XML)
+        return USLMParser(path).get_section("5")
+
+    def test_heading_includes_inline_text(self, section):
+        assert section.section_title == "Rates generally"
+
+    def test_subsections_grouped_by_level(self, section):
+        assert [s.identifier for s in section.subsections] == ["a", "b", "9"]
+        assert [c.identifier for c in section.subsections[0].children] == ["1", "2"]
+
+    def test_own_text_excludes_child_subsections(self, section):
+        rate = section.subsections[0]
+        assert rate.heading == "Rate"
+        assert rate.text == "(a) Rate The rate is— of taxable income."
+        assert rate.children[1].text == "(2) 20 percent\nunder section 1."
+
+    def test_references_distinct_in_document_order(self, section):
+        assert section.references_to == ["26 USC 1", "26 USC 32"]
+
+    def test_full_text_skips_comments(self, section):
+        assert "editorial comment" not in section.text
+        assert "10 percent, and" in section.text
+
+
+class TestSectionIndex:
+    """Tests for the sidecar byte-offset index."""
+
+    def test_records_every_section(self, xml_path):
+        index = SectionIndex.build(xml_path)
+
+        assert set(index.sections) == {f"/us/usc/t99/s{n}" for n in ("1", "2", "2a", "3")}
+        start, end = index.sections["/us/usc/t99/s3"]
+        assert xml_path.read_bytes()[start:end].startswith(b'<section identifier="/us/usc/t99/s3"')
+
+    def test_nested_section_inside_parent(self, xml_path):
+        index = SectionIndex.build(xml_path)
+
+        outer = index.sections["/us/usc/t99/s2"]
+        quoted = index.sections["/us/usc/t99/s2a"]
+        assert outer[0] < quoted[0] and quoted[1] < outer[1]
+
+    def test_ignores_comments(self, tmp_path):
+        path = tmp_path / "usc99.xml"
+        path.write_text(
+            SAMPLE_TITLE_XML.replace(
+                '<chapter identifier="/us/usc/t99/ch2">',
+                '<!-- <section identifier="/us/usc/t99/s9"> --><chapter identifier="/us/usc/t99/ch2">',
+            )
+        )
+
+        index = SectionIndex.build(path)
+        assert "/us/usc/t99/s9" not in index.sections
+        assert index.read_section(path, "/us/usc/t99/s3") is not None
+
+    def test_get_section_reads_only_the_fragment(self, xml_path):
+        expected = {s.citation.section: s for s in USLMParser(xml_path).iter_sections()}
+        USLMParser(xml_path).build_index()
+
+        for number, section in expected.items():
+            parser = USLMParser(xml_path)
+            assert parser.get_section(number) == section
+            assert parser._tree is None
+        assert USLMParser(xml_path).get_section("404") is None
+
+    def test_save_and_load(self, xml_path):
+        index = SectionIndex.build(xml_path)
+        index.save(index_path(xml_path))
+
+        assert index_path(xml_path).name == "usc99.xml.idx"
+        assert SectionIndex.load(index_path(xml_path)) == index
+
+    def test_stale_index_falls_back_to_tree(self, xml_path):
+        USLMParser(xml_path).build_index()
+        xml_path.write_text(SAMPLE_TITLE_XML.replace("Tax imposed.", "Tax imposed at 10 percent."))
+
+        parser = USLMParser(xml_path)
+        assert parser.section_index is None
+        assert "10 percent" in parser.get_section("3").text
+
+    def test_corrupt_index_ignored(self, xml_path):
+        index_path(xml_path).write_text("not json")
+
+        assert SectionIndex.load(index_path(xml_path)) is None
+        assert USLMParser(xml_path).get_section("1").section_title == "Definitions"